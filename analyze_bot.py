@@ -7,9 +7,6 @@ This script provides a unified interface to all the analysis tools.
 import os
 import argparse
 import webbrowser
-from data_dashboard import DashboardGenerator
-from data_summary import DataSummary
-from performance_analyzer import PerformanceAnalyzer
 
 def main():
     """Main function to run the analysis suite"""
@@ -33,6 +30,7 @@ def main():
     
     # List available sessions
     if args.list:
+        from data_summary import DataSummary
         summary = DataSummary(args.log_dir)
         sessions = summary._load_sessions()
         print(f"Found {len(sessions)} sessions:")
@@ -42,6 +40,7 @@ def main():
     
     # Generate dashboard
     if args.dashboard or args.all:
+        from data_dashboard import DashboardGenerator
         print("Generating interactive dashboard...")
         generator = DashboardGenerator(args.log_dir)
         output_path = generator.generate_dashboard(args.session)
@@ -56,6 +55,7 @@ def main():
     
     # Generate text summary
     if args.summary or args.all:
+        from data_summary import DataSummary
         print("\nGenerating text summary...")
         summary = DataSummary(args.log_dir)
         report = summary.generate_text_report(args.session)
@@ -63,6 +63,7 @@ def main():
     
     # Show performance metrics
     if args.metrics or args.all:
+        from performance_analyzer import PerformanceAnalyzer
         print("\nAnalyzing performance metrics...")
         analyzer = PerformanceAnalyzer(args.log_dir)
         metrics = analyzer.analyze_performance_metrics(args.session)
@@ -81,6 +82,7 @@ def main():
     
     # Show decision patterns
     if args.patterns or args.all:
+        from performance_analyzer import PerformanceAnalyzer
         print("\nAnalyzing decision patterns...")
         analyzer = PerformanceAnalyzer(args.log_dir)
         patterns = analyzer.analyze_decision_patterns(args.session)
@@ -109,6 +111,7 @@ def main():
     
     # Export decision data
     if args.export or args.all:
+        from performance_analyzer import PerformanceAnalyzer
         print("\nExporting decision data...")
         analyzer = PerformanceAnalyzer(args.log_dir)
         output_file = args.export if args.export else os.path.join(args.log_dir, "decision_data.csv")
@@ -4,9 +4,42 @@ This module implements OpenPPL betting action symbols for the GeckoBot poker bot
 Based on OpenPPL_Library_Betting_Action_Symbols.ohf
 """
 
+from collections import namedtuple
 from typing import Dict, List, Optional, Tuple
+import numpy as np
 from poker_enums import Street, Position, Action
 
+# A single recorded betting action
+ActionRecord = namedtuple('ActionRecord', 'player action amount')
+
+# Small integer codes for actions in the columnar action log
+ACTION_CODES = {action: code for code, action in enumerate(Action)}
+CHECK_CODE = ACTION_CODES[Action.CHECK]
+RAISE_CODE = ACTION_CODES[Action.RAISE]
+ALL_IN_CODE = ACTION_CODES[Action.ALL_IN]
+
+# 2-bit action lanes for the per-street action history bitmask: the low bit
+# marks aggression (bet/raise/all-in), the high bit marks a call
+ACTION_BITS = {
+    Action.FOLD: 0b00,
+    Action.CHECK: 0b00,
+    Action.CALL: 0b10,
+    Action.RAISE: 0b01,
+    Action.ALL_IN: 0b01
+}
+RAISE_LANES = int('01' * 128, 2)  # 128 lanes, far more than any betting round
+
+# Per-street state lives in lists indexed by Street; values start at 1, so slot 0 is unused
+STREET_SLOTS = len(Street) + 1
+NO_STREET_VALUES = (None,) * STREET_SLOTS
+ZERO_STREET_COUNTS = (0,) * STREET_SLOTS
+
+# Street before each street, indexed by Street
+PREV_STREET = (None, None, Street.PREFLOP, Street.FLOP, Street.TURN)
+
+# Initial per-street capacity of the columnar action log (doubled on overflow)
+INITIAL_LOG_CAPACITY = 16
+
 
 class BettingActionSymbols:
     """
@@ -15,43 +48,58 @@ class BettingActionSymbols:
 
     def __init__(self):
         """Initialize the betting action symbols tracker."""
-        self.reset()
-
-    def reset(self):
-        """Reset all tracking variables."""
-        # Track actions by street
-        self.actions_by_street = {
-            Street.PREFLOP: [],
-            Street.FLOP: [],
-            Street.TURN: [],
-            Street.RIVER: []
-        }
+        # Per-street containers are allocated once here and cleared in place by reset()
+        # Track actions by street (lists indexed by Street)
+        self.actions_by_street = [[] for _ in range(STREET_SLOTS)]
 
         # Track bot's actions by street
-        self.bot_actions_by_street = {
-            Street.PREFLOP: [],
-            Street.FLOP: [],
-            Street.TURN: [],
-            Street.RIVER: []
-        }
+        self.bot_actions_by_street = [[] for _ in range(STREET_SLOTS)]
 
         # Track opponent actions by street
-        self.opponent_actions_by_street = {
-            Street.PREFLOP: [],
-            Street.FLOP: [],
-            Street.TURN: [],
-            Street.RIVER: []
-        }
+        self.opponent_actions_by_street = [[] for _ in range(STREET_SLOTS)]
 
         # Track last aggressor by street
-        self.last_aggressor_by_street = {
-            Street.PREFLOP: None,
-            Street.FLOP: None,
-            Street.TURN: None,
-            Street.RIVER: None
-        }
-
-        # Track betting patterns
+        self.last_aggressor_by_street = [None] * STREET_SLOTS
+
+        # Track bot's last action by street
+        self.bot_last_action_by_street = [None] * STREET_SLOTS
+
+        # Action counts keyed by (street, action, is_bot) so symbol queries
+        # are a single lookup instead of a scan over the action lists
+        self._counts = {(s, a, bot): 0 for s in Street for a in Action for bot in (True, False)}
+
+        # Raises and calls made since the bot last acted on each street
+        self._raises_since_bot = [0] * STREET_SLOTS
+        self._calls_since_bot = [0] * STREET_SLOTS
+
+        # Action history per street packed two bits per action (see ACTION_BITS)
+        self._street_bits = [0] * STREET_SLOTS
+
+        # Columnar action log per street (action code, player id, bot flag);
+        # the arrays keep their grown capacity across hands
+        self._action_codes = [np.empty(INITIAL_LOG_CAPACITY, dtype=np.int8) for _ in range(STREET_SLOTS)]
+        self._player_ids = [np.empty(INITIAL_LOG_CAPACITY, dtype=np.int16) for _ in range(STREET_SLOTS)]
+        self._is_bot = [np.empty(INITIAL_LOG_CAPACITY, dtype=np.bool_) for _ in range(STREET_SLOTS)]
+        self._log_sizes = [0] * STREET_SLOTS
+        self._player_index = {}
+
+        self.reset()
+
+    def reset(self):
+        """Reset all tracking variables."""
+        for street_actions in self.actions_by_street:
+            street_actions.clear()
+        for street_actions in self.bot_actions_by_street:
+            street_actions.clear()
+        for street_actions in self.opponent_actions_by_street:
+            street_actions.clear()
+        self.last_aggressor_by_street[:] = NO_STREET_VALUES
+        self.bot_last_action_by_street[:] = NO_STREET_VALUES
+
+        # Track betting patterns; the flags are refreshed lazily by _refresh_patterns
+        # whenever _version has moved past _patterns_version
+        self._version = 0
+        self._patterns_version = 0
         self.is_continuation_bet_situation = False
         self.is_check_raise_situation = False
         self.is_three_bet_situation = False
@@ -65,14 +113,18 @@ class BettingActionSymbols:
         self.calls_current_street = 0
         self.checks_current_street = 0
 
-        # Track bot's last actions
+        # Track bot's last action
         self.bot_last_action = None
-        self.bot_last_action_by_street = {
-            Street.PREFLOP: None,
-            Street.FLOP: None,
-            Street.TURN: None,
-            Street.RIVER: None
-        }
+
+        for key in self._counts:
+            self._counts[key] = 0
+        self._bot_raised_preflop_flag = False
+
+        self._raises_since_bot[:] = ZERO_STREET_COUNTS
+        self._calls_since_bot[:] = ZERO_STREET_COUNTS
+        self._street_bits[:] = ZERO_STREET_COUNTS
+        self._log_sizes[:] = ZERO_STREET_COUNTS
+        self._player_index.clear()
 
     def record_action(self, street: Street, player: str, action: Action,
                      amount: Optional[float] = None, is_bot: bool = False):
@@ -87,20 +139,27 @@ class BettingActionSymbols:
             is_bot: Whether this action was taken by the bot
         """
         # Record the action in the appropriate list
-        action_data = {
-            'player': player,
-            'action': action,
-            'amount': amount
-        }
+        action_data = ActionRecord(player, action, amount)
 
         self.actions_by_street[street].append(action_data)
+        self._counts[(street, action, is_bot)] += 1
+        self._street_bits[street] = (self._street_bits[street] << 2) | ACTION_BITS[action]
+        self._append_to_log(street, player, action, is_bot)
 
         if is_bot:
             self.bot_actions_by_street[street].append(action_data)
             self.bot_last_action = action
             self.bot_last_action_by_street[street] = action
+            if street == Street.PREFLOP and action == Action.RAISE:
+                self._bot_raised_preflop_flag = True
+            self._raises_since_bot[street] = 0
+            self._calls_since_bot[street] = 0
         else:
             self.opponent_actions_by_street[street].append(action_data)
+            if action == Action.RAISE or action == Action.ALL_IN:
+                self._raises_since_bot[street] += 1
+            elif action == Action.CALL:
+                self._calls_since_bot[street] += 1
 
         # Update counts
         if action == Action.RAISE or action == Action.ALL_IN:
@@ -111,37 +170,88 @@ class BettingActionSymbols:
         elif action == Action.CHECK:
             self.checks_current_street += 1
 
-        # Update betting patterns
-        self._update_betting_patterns(street, player, action, is_bot)
+        # Betting patterns are recomputed lazily on the next is_*() query
+        self._version += 1
+
+    def _append_to_log(self, street: Street, player: str, action: Action, is_bot: bool):
+        """Write one action into the columnar log, growing it if it is full."""
+        n = self._log_sizes[street]
+        if n == len(self._action_codes[street]):
+            for log in (self._action_codes, self._player_ids, self._is_bot):
+                grown = np.empty(2 * n, dtype=log[street].dtype)
+                grown[:n] = log[street]
+                log[street] = grown
+
+        self._action_codes[street][n] = ACTION_CODES[action]
+        self._player_ids[street][n] = self._player_index.setdefault(player, len(self._player_index))
+        self._is_bot[street][n] = is_bot
+        self._log_sizes[street] = n + 1
+
+    def _raises_on_street(self, street: Street) -> int:
+        """Count the bets/raises/all-ins recorded on a street."""
+        return (self._street_bits[street] & RAISE_LANES).bit_count()
+
+    def _refresh_patterns(self):
+        """Recompute the betting pattern flags if actions were recorded since the last refresh."""
+        if self._patterns_version == self._version:
+            return
+        self._patterns_version = self._version
+
+        self.is_continuation_bet_situation = False
+        self.is_check_raise_situation = False
+        self.is_three_bet_situation = False
+        self.is_four_bet_situation = False
+        self.is_donk_bet_situation = False
+        self.is_probe_bet_situation = False
+        self.is_float_bet_situation = False
 
-    def _update_betting_patterns(self, street: Street, player: str, action: Action, is_bot: bool):
-        """Update betting pattern flags based on the current action."""
+        # Replay each street's columnar log in order, tracking the state each
+        # action saw when it was made
+        player_names = list(self._player_index)
+        for street in Street:
+            n = self._log_sizes[street]
+            raises_this_street = 0
+            checked_players = set()
+            opponent_checked = False
+            for code, player_id, is_bot in zip(self._action_codes[street][:n].tolist(),
+                                               self._player_ids[street][:n].tolist(),
+                                               self._is_bot[street][:n].tolist()):
+                if code == CHECK_CODE:
+                    checked_players.add(player_id)
+                    if not is_bot:
+                        opponent_checked = True
+                elif code == RAISE_CODE or code == ALL_IN_CODE:
+                    raises_this_street += 1
+                    if code == RAISE_CODE:
+                        self._update_betting_patterns(street, player_names[player_id], is_bot,
+                                                      raises_this_street,
+                                                      player_id in checked_players,
+                                                      opponent_checked)
+
+    def _update_betting_patterns(self, street: Street, player: str, is_bot: bool,
+                                 raises_this_street: int, player_checked: bool,
+                                 opponent_checked: bool):
+        """Update betting pattern flags for a raise, given the street state at that point."""
         # Continuation bet: Bot raised preflop and bets on the flop
         if (street == Street.FLOP and
-            action == Action.RAISE and
             is_bot and
             self._bot_raised_preflop()):
             self.is_continuation_bet_situation = True
 
         # Check-raise: Player checked, someone bet, then player raised
-        if (action == Action.RAISE and
-            self._player_checked_this_street(player, street) and
-            self._bet_after_player_checked(player, street)):
+        if player_checked:
             self.is_check_raise_situation = True
 
-        # 3-bet: There was a raise, then a re-raise
-        if (action == Action.RAISE and
-            self.raises_current_street >= 2):
+        # 3-bet: There was a raise, then a re-raise on this street
+        if raises_this_street >= 2:
             self.is_three_bet_situation = True
 
-        # 4-bet: There was a raise, re-raise, and re-re-raise
-        if (action == Action.RAISE and
-            self.raises_current_street >= 3):
+        # 4-bet: There was a raise, re-raise, and re-re-raise on this street
+        if raises_this_street >= 3:
             self.is_four_bet_situation = True
 
         # Donk bet: Out of position player bets into previous street aggressor
         if (street != Street.PREFLOP and
-            action == Action.RAISE and
             not is_bot and
             self._is_out_of_position(player) and
             self._was_bot_aggressor_previous_street(street)):
@@ -149,42 +259,20 @@ class BettingActionSymbols:
 
         # Probe bet: In position player bets after check from out of position player
         if (street != Street.PREFLOP and
-            action == Action.RAISE and
             is_bot and
             not self._is_out_of_position(player) and
-            self._opponent_checked_this_street(street)):
+            opponent_checked):
             self.is_probe_bet_situation = True
 
         # Float bet: Calling a bet on one street and betting on the next
         if (street != Street.PREFLOP and
-            action == Action.RAISE and
             is_bot and
             self._bot_called_previous_street(street)):
             self.is_float_bet_situation = True
 
     def _bot_raised_preflop(self) -> bool:
         """Check if the bot raised preflop."""
-        for action_data in self.bot_actions_by_street[Street.PREFLOP]:
-            if action_data['action'] == Action.RAISE:
-                return True
-        return False
-
-    def _player_checked_this_street(self, player: str, street: Street) -> bool:
-        """Check if a player checked on this street before."""
-        for action_data in self.actions_by_street[street]:
-            if action_data['player'] == player and action_data['action'] == Action.CHECK:
-                return True
-        return False
-
-    def _bet_after_player_checked(self, player: str, street: Street) -> bool:
-        """Check if someone bet after the player checked."""
-        player_checked = False
-        for action_data in self.actions_by_street[street]:
-            if action_data['player'] == player and action_data['action'] == Action.CHECK:
-                player_checked = True
-            elif player_checked and action_data['action'] == Action.RAISE:
-                return True
-        return False
+        return self._bot_raised_preflop_flag
 
     def _is_out_of_position(self, player: str) -> bool:
         """
@@ -197,51 +285,19 @@ class BettingActionSymbols:
 
     def _was_bot_aggressor_previous_street(self, street: Street) -> bool:
         """Check if the bot was the aggressor on the previous street."""
-        if street == Street.PREFLOP:
-            return False
-
-        # Map current street to previous street
-        previous_street = None
-        if street == Street.FLOP:
-            previous_street = Street.PREFLOP
-        elif street == Street.TURN:
-            previous_street = Street.FLOP
-        elif street == Street.RIVER:
-            previous_street = Street.TURN
-
+        previous_street = PREV_STREET[street]
         if previous_street is None:
             return False
 
         return self.last_aggressor_by_street[previous_street] == "Bot"
 
-    def _opponent_checked_this_street(self, street: Street) -> bool:
-        """Check if any opponent checked on this street."""
-        for action_data in self.opponent_actions_by_street[street]:
-            if action_data['action'] == Action.CHECK:
-                return True
-        return False
-
     def _bot_called_previous_street(self, street: Street) -> bool:
         """Check if the bot called on the previous street."""
-        if street == Street.PREFLOP:
-            return False
-
-        # Map current street to previous street
-        previous_street = None
-        if street == Street.FLOP:
-            previous_street = Street.PREFLOP
-        elif street == Street.TURN:
-            previous_street = Street.FLOP
-        elif street == Street.RIVER:
-            previous_street = Street.TURN
-
+        previous_street = PREV_STREET[street]
         if previous_street is None:
             return False
 
-        for action_data in self.bot_actions_by_street[previous_street]:
-            if action_data['action'] == Action.CALL:
-                return True
-        return False
+        return self._counts[(previous_street, Action.CALL, True)] > 0
 
     # OpenPPL Betting Action Symbol implementations
 
@@ -258,80 +314,47 @@ class BettingActionSymbols:
 
     def bot_raised_on_flop(self) -> bool:
         """Check if the bot raised on the flop."""
-        for action_data in self.bot_actions_by_street[Street.FLOP]:
-            if action_data['action'] == Action.RAISE:
-                return True
-        return False
+        return self._counts[(Street.FLOP, Action.RAISE, True)] > 0
 
     def bot_raised_on_turn(self) -> bool:
         """Check if the bot raised on the turn."""
-        for action_data in self.bot_actions_by_street[Street.TURN]:
-            if action_data['action'] == Action.RAISE:
-                return True
-        return False
+        return self._counts[(Street.TURN, Action.RAISE, True)] > 0
 
     def bot_raised_on_river(self) -> bool:
         """Check if the bot raised on the river."""
-        for action_data in self.bot_actions_by_street[Street.RIVER]:
-            if action_data['action'] == Action.RAISE:
-                return True
-        return False
+        return self._counts[(Street.RIVER, Action.RAISE, True)] > 0
 
     def bot_called_before_flop(self) -> bool:
         """Check if the bot called before the flop."""
-        for action_data in self.bot_actions_by_street[Street.PREFLOP]:
-            if action_data['action'] == Action.CALL:
-                return True
-        return False
+        return self._counts[(Street.PREFLOP, Action.CALL, True)] > 0
 
     def bot_called_on_flop(self) -> bool:
         """Check if the bot called on the flop."""
-        for action_data in self.bot_actions_by_street[Street.FLOP]:
-            if action_data['action'] == Action.CALL:
-                return True
-        return False
+        return self._counts[(Street.FLOP, Action.CALL, True)] > 0
 
     def bot_called_on_turn(self) -> bool:
         """Check if the bot called on the turn."""
-        for action_data in self.bot_actions_by_street[Street.TURN]:
-            if action_data['action'] == Action.CALL:
-                return True
-        return False
+        return self._counts[(Street.TURN, Action.CALL, True)] > 0
 
     def bot_called_on_river(self) -> bool:
         """Check if the bot called on the river."""
-        for action_data in self.bot_actions_by_street[Street.RIVER]:
-            if action_data['action'] == Action.CALL:
-                return True
-        return False
+        return self._counts[(Street.RIVER, Action.CALL, True)] > 0
 
     def bot_checked_preflop(self) -> bool:
         """Check if the bot checked preflop."""
-        for action_data in self.bot_actions_by_street[Street.PREFLOP]:
-            if action_data['action'] == Action.CHECK:
-                return True
-        return False
+        return self._counts[(Street.PREFLOP, Action.CHECK, True)] > 0
 
     def bot_checked_on_flop(self) -> bool:
         """Check if the bot checked on the flop."""
-        for action_data in self.bot_actions_by_street[Street.FLOP]:
-            if action_data['action'] == Action.CHECK:
-                return True
-        return False
+        return self._counts[(Street.FLOP, Action.CHECK, True)] > 0
 
     def bot_checked_on_turn(self) -> bool:
         """Check if the bot checked on the turn."""
-        for action_data in self.bot_actions_by_street[Street.TURN]:
-            if action_data['action'] == Action.CHECK:
-                return True
-        return False
+        return self._counts[(Street.TURN, Action.CHECK, True)] > 0
 
     def bot_checked_on_river(self) -> bool:
         """Check if the bot checked on the river."""
-        for action_data in self.bot_actions_by_street[Street.RIVER]:
-            if action_data['action'] == Action.CHECK:
-                return True
-        return False
+        return self._counts[(Street.RIVER, Action.CHECK, True)] > 0
 
     def bots_actions_on_this_round(self, street: Street) -> int:
         """Get the number of actions the bot has taken on this round."""
@@ -339,84 +362,55 @@ class BettingActionSymbols:
 
     def no_betting_on_flop(self) -> bool:
         """Check if there was no betting on the flop."""
-        for action_data in self.actions_by_street[Street.FLOP]:
-            if action_data['action'] == Action.RAISE:
-                return False
-        return True
+        return self._raises_on_street(Street.FLOP) == 0
 
     def no_betting_on_turn(self) -> bool:
         """Check if there was no betting on the turn."""
-        for action_data in self.actions_by_street[Street.TURN]:
-            if action_data['action'] == Action.RAISE:
-                return False
-        return True
+        return self._raises_on_street(Street.TURN) == 0
 
     def raises_since_last_play(self, street: Street) -> int:
         """Get the number of raises since the bot's last action."""
         if len(self.bot_actions_by_street[street]) == 0:
             return self.raises_current_street
-
-        # Find the index of the bot's last action
-        bot_actions = self.bot_actions_by_street[street]
-        last_bot_action_index = -1
-        for i, action_data in enumerate(self.actions_by_street[street]):
-            if action_data['player'] == "Bot" and action_data == bot_actions[-1]:
-                last_bot_action_index = i
-                break
-
-        # Count raises after the bot's last action
-        raises_since_last_play = 0
-        for i in range(last_bot_action_index + 1, len(self.actions_by_street[street])):
-            if self.actions_by_street[street][i]['action'] == Action.RAISE:
-                raises_since_last_play += 1
-
-        return raises_since_last_play
+        return self._raises_since_bot[street]
 
     def calls_since_last_play(self, street: Street) -> int:
         """Get the number of calls since the bot's last action."""
         if len(self.bot_actions_by_street[street]) == 0:
             return self.calls_current_street
-
-        # Find the index of the bot's last action
-        bot_actions = self.bot_actions_by_street[street]
-        last_bot_action_index = -1
-        for i, action_data in enumerate(self.actions_by_street[street]):
-            if action_data['player'] == "Bot" and action_data == bot_actions[-1]:
-                last_bot_action_index = i
-                break
-
-        # Count calls after the bot's last action
-        calls_since_last_play = 0
-        for i in range(last_bot_action_index + 1, len(self.actions_by_street[street])):
-            if self.actions_by_street[street][i]['action'] == Action.CALL:
-                calls_since_last_play += 1
-
-        return calls_since_last_play
+        return self._calls_since_bot[street]
 
     def is_continuation_bet(self) -> bool:
         """Check if the current situation is a continuation bet."""
+        self._refresh_patterns()
         return self.is_continuation_bet_situation
 
     def is_check_raise(self) -> bool:
         """Check if the current situation is a check-raise."""
+        self._refresh_patterns()
         return self.is_check_raise_situation
 
     def is_three_bet(self) -> bool:
         """Check if the current situation is a 3-bet."""
+        self._refresh_patterns()
         return self.is_three_bet_situation
 
     def is_four_bet(self) -> bool:
         """Check if the current situation is a 4-bet."""
+        self._refresh_patterns()
         return self.is_four_bet_situation
 
     def is_donk_bet(self) -> bool:
         """Check if the current situation is a donk bet."""
+        self._refresh_patterns()
         return self.is_donk_bet_situation
 
     def is_probe_bet(self) -> bool:
         """Check if the current situation is a probe bet."""
+        self._refresh_patterns()
         return self.is_probe_bet_situation
 
     def is_float_bet(self) -> bool:
         """Check if the current situation is a float bet."""
+        self._refresh_patterns()
         return self.is_float_bet_situation
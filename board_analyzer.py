@@ -1,18 +1,148 @@
-from typing import List, Set, Dict, Optional
+from dataclasses import dataclass
+from typing import List, Set, Dict, Optional, Tuple
+import numpy as np
 from poker_enums import HandStrength, BoardTexture, Card, Rank, Suit, Street
 from hand_evaluator import HandEvaluator
-from board_texture_symbols import BoardTextureSymbols
+from board_texture_symbols import BoardTextureSymbols, CARD_CODES, RANK_TABLE, LOWEST_RANK_BIT
+
+# Card rank character -> HandEvaluator rank number, indexed by ord(rank)
+RANK_LUT = bytearray(128)
+for _number, _rank in enumerate(HandEvaluator.RANKS):
+    RANK_LUT[ord(_rank)] = _number
+
+# Suit character -> slot in a fixed 4-entry suit count array
+SUITS = 'hdcs'
+SUIT_IDX = {suit: i for i, suit in enumerate(SUITS)}
+
+# Try to import optional dependencies
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _build_straight_counts() -> bytes:
+    """Count the 5-rank straight windows holding 3+ ranks for every 13-bit rank mask"""
+    masks = np.arange(1 << len(HandEvaluator.RANKS))
+    window_bits = np.array([window.bit_count() for window in range(32)])
+    counts = np.zeros(len(masks), dtype=np.uint8)
+    for i in range(1, 11):
+        counts += window_bits[(masks >> i) & 0x1F] >= 3
+    return counts.tobytes()
+
+
+# Straight possibilities indexed by the board's rank bitmask
+STRAIGHT_COUNTS = _build_straight_counts()
+
+# Texture rank table columns for batch lookups, indexed by rank_mask >> LOWEST_RANK_BIT
+TABLE_STRAIGHT_COUNTS = np.array([row[0] for row in RANK_TABLE], dtype=np.uint8)
+TABLE_GUTSHOTS = np.array([row[2] for row in RANK_TABLE], dtype=bool)
+
+
+def _draw_density_from_mask(rank_mask: int, max_suit_count: int, num_cards: int) -> float:
+    """Score draw density (0-1 scale) from the rank bitmask and biggest suit count"""
+    score = 0.0
+
+    # Flush draws
+    if max_suit_count >= 3:
+        score += 0.3
+
+    # Straight draws: gaps between the sorted ranks, where a pair counts as -1
+    lowest = -1
+    highest = 0
+    distinct = 0
+    for rank in range(16):
+        if (rank_mask >> rank) & 1:
+            if lowest < 0:
+                lowest = rank
+            highest = rank
+            distinct += 1
+    gaps = highest - lowest - (num_cards - 1)
+    if gaps <= 2:
+        score += 0.3
+
+    # Texture points
+    if distinct < num_cards:
+        score += 0.2
+    if (rank_mask & (rank_mask >> 1)) != 0:
+        score += 0.2
+
+    return min(score, 1.0)
+
+
+if njit is not None:
+    _draw_density_from_mask = njit(cache=True)(_draw_density_from_mask)
+
+    # Compile at import rather than on the first board analysis
+    _draw_density_from_mask(0, 0, 1)
+
+# Number of board analyses kept before the cache is cleared
+ANALYSIS_CACHE_SIZE = 4096
+
+
+@dataclass(frozen=True, slots=True)
+class BoardAnalysis:
+    """Board characteristics returned by BoardAnalyzer.analyze_board"""
+    # Basic board properties
+    is_paired: bool
+    is_monotone: bool
+    is_connected: bool
+    is_very_connected: bool
+    draw_density: float
+    highest_card: str
+
+    # Connectedness
+    connectedness: float
+
+    # Suitedness
+    is_rainbow: bool
+    is_two_tone: bool
+    suits_on_board: int
+    flush_possible: bool
+    flush_draw_possible: bool
+
+    # Paired board
+    is_trips_on_board: bool
+    is_two_pair_on_board: bool
+    is_full_house_on_board: bool
+    is_quads_on_board: bool
+
+    # Texture changes
+    flop_texture_changed_on_turn: bool
+    turn_texture_changed_on_river: bool
+
+    # Draw possibilities
+    straight_possible: bool
+    open_ended_straight_draw_possible: bool
+    gut_shot_straight_draw_possible: bool
+    number_of_straight_possibilities: int
+
+    # Board danger level
+    danger_level: float
+    is_dry_board: bool
+    is_wet_board: bool
+    is_semi_wet_board: bool
+
+    # Legacy analysis for backward compatibility
+    potential_straights: int
+    flush_possibilities: Dict[str, int]
+
+    texture: BoardTexture
+
 
 class BoardAnalyzer:
     def __init__(self):
         self.hand_evaluator = HandEvaluator()
         self.texture_symbols = BoardTextureSymbols()
         self.current_street = Street.PREFLOP
+        self._analysis_cache: Dict[Tuple[Tuple[str, ...], Street], BoardAnalysis] = {}
+        self._last_key: Optional[Tuple[Tuple[str, ...], Street]] = None
+        self._last_result: Optional[BoardAnalysis] = None
 
-    def analyze_board(self, board: List[str], street: Street = None) -> dict:
-        """Analyze board texture and return characteristics"""
+    def analyze_board(self, board: List[str], street: Street = None) -> Optional[BoardAnalysis]:
+        """Analyze board texture and return characteristics (None before the flop)"""
         if len(board) < 3:
-            return {}
+            return None
 
         # Update current street if provided
         if street is not None:
@@ -26,123 +156,161 @@ class BoardAnalyzer:
             elif len(board) == 5:
                 self.current_street = Street.RIVER
 
+        # The same board is analyzed at every decision on a street, so reuse
+        # earlier results. Card order matters for the texture-change symbols.
+        # Results are frozen, so cached ones are returned as they are.
+        cache_key = (tuple(board), self.current_street)
+        if cache_key == self._last_key:
+            return self._last_result
+        cached = self._analysis_cache.get(cache_key)
+        if cached is not None:
+            self._last_key, self._last_result = cache_key, cached
+            return cached
+
         # Update board texture symbols
         self.texture_symbols.update_board(board, self.current_street)
 
-        result = {
+        # Single pass over the board feeding all the legacy statistics
+        rank_mask, suit_counts, highest_card = self._scan_board(board)
+        max_suit_count = max(suit_counts)
+
+        symbols = self.texture_symbols.compute_all()
+
+        fields = {
             # Basic board properties
-            'is_paired': self.texture_symbols.is_paired_board(),
-            'is_monotone': self.texture_symbols.is_monotone_board(),
-            'is_connected': self.texture_symbols.is_connected_board(),
-            'is_very_connected': self.texture_symbols.is_very_connected_board(),
-            'draw_density': self._calculate_draw_density(board),
-            'highest_card': self._get_highest_card(board),
+            'is_paired': symbols['is_paired_board'],
+            'is_monotone': symbols['is_monotone_board'],
+            'is_connected': symbols['is_connected_board'],
+            'is_very_connected': symbols['is_very_connected_board'],
+            'draw_density': self._calculate_draw_density(rank_mask, max_suit_count, len(board)),
+            'highest_card': highest_card,
 
             # Connectedness
-            'connectedness': self.texture_symbols.board_connectedness(),
+            'connectedness': symbols['board_connectedness'],
 
             # Suitedness
-            'is_rainbow': self.texture_symbols.is_rainbow_board(),
-            'is_two_tone': self.texture_symbols.is_two_tone_board(),
-            'suits_on_board': self.texture_symbols.suits_on_board(),
-            'flush_possible': self.texture_symbols.flush_possible(),
-            'flush_draw_possible': self.texture_symbols.flush_draw_possible(),
+            'is_rainbow': symbols['is_rainbow_board'],
+            'is_two_tone': symbols['is_two_tone_board'],
+            'suits_on_board': symbols['suits_on_board'],
+            'flush_possible': symbols['flush_possible'],
+            'flush_draw_possible': symbols['flush_draw_possible'],
 
             # Paired board
-            'is_trips_on_board': self.texture_symbols.is_trips_on_board(),
-            'is_two_pair_on_board': self.texture_symbols.is_two_pair_on_board(),
-            'is_full_house_on_board': self.texture_symbols.is_full_house_on_board(),
-            'is_quads_on_board': self.texture_symbols.is_quads_on_board(),
+            'is_trips_on_board': symbols['is_trips_on_board'],
+            'is_two_pair_on_board': symbols['is_two_pair_on_board'],
+            'is_full_house_on_board': symbols['is_full_house_on_board'],
+            'is_quads_on_board': symbols['is_quads_on_board'],
 
             # Texture changes
-            'flop_texture_changed_on_turn': self.texture_symbols.flop_texture_changed_on_turn() if self.current_street >= Street.TURN else False,
-            'turn_texture_changed_on_river': self.texture_symbols.turn_texture_changed_on_river() if self.current_street >= Street.RIVER else False,
+            'flop_texture_changed_on_turn': symbols['flop_texture_changed_on_turn'] if self.current_street >= Street.TURN else False,
+            'turn_texture_changed_on_river': symbols['turn_texture_changed_on_river'] if self.current_street >= Street.RIVER else False,
 
             # Draw possibilities
-            'straight_possible': self.texture_symbols.straight_possible(),
-            'open_ended_straight_draw_possible': self.texture_symbols.open_ended_straight_draw_possible(),
-            'gut_shot_straight_draw_possible': self.texture_symbols.gut_shot_straight_draw_possible(),
-            'number_of_straight_possibilities': self.texture_symbols.number_of_straight_possibilities(),
+            'straight_possible': symbols['straight_possible'],
+            'open_ended_straight_draw_possible': symbols['open_ended_straight_draw_possible'],
+            'gut_shot_straight_draw_possible': symbols['gut_shot_straight_draw_possible'],
+            'number_of_straight_possibilities': symbols['number_of_straight_possibilities'],
 
             # Board danger level
-            'danger_level': self.texture_symbols.board_danger_level(),
-            'is_dry_board': self.texture_symbols.is_dry_board(),
-            'is_wet_board': self.texture_symbols.is_wet_board(),
-            'is_semi_wet_board': self.texture_symbols.is_semi_wet_board(),
+            'danger_level': symbols['board_danger_level'],
+            'is_dry_board': symbols['is_dry_board'],
+            'is_wet_board': symbols['is_wet_board'],
+            'is_semi_wet_board': symbols['is_semi_wet_board'],
 
             # Legacy analysis for backward compatibility
-            'potential_straights': self._count_straight_possibilities(board),
-            'flush_possibilities': self._count_flush_possibilities(board)
+            'potential_straights': self._count_straight_possibilities(rank_mask),
+            'flush_possibilities': self._suit_count_dict(suit_counts)
         }
 
         # Add texture classification
-        result['texture'] = self._classify_texture(result)
+        result = BoardAnalysis(**fields, texture=self._classify_texture(fields))
+
+        if len(self._analysis_cache) >= ANALYSIS_CACHE_SIZE:
+            self._analysis_cache.clear()
+        self._analysis_cache[cache_key] = result
+        self._last_key, self._last_result = cache_key, result
         return result
 
-    def _is_paired(self, board: List[str]) -> bool:
-        """Check if board is paired"""
-        ranks = [card[0] for card in board]
-        return len(set(ranks)) < len(ranks)
-
-    def _is_monotone(self, board: List[str]) -> bool:
-        """Check if board is all one suit"""
-        suits = [card[1] for card in board]
-        return len(set(suits)) == 1
-
-    def _is_connected(self, board: List[str]) -> bool:
-        """Check if board has connected cards"""
-        ranks = sorted([self.hand_evaluator._rank_to_number(card[0]) for card in board])
-        for i in range(len(ranks)-1):
-            if ranks[i+1] - ranks[i] == 1:
-                return True
-        return False
-
-    def _calculate_draw_density(self, board: List[str]) -> float:
-        """Calculate draw density (0-1 scale)"""
-        score = 0.0
+    def encode_boards(self, boards: List[List[str]]) -> np.ndarray:
+        """Pack same-length boards into an (N, cards) array of card codes"""
+        return np.array([[CARD_CODES[card[0].upper() + card[1].lower()] for card in board]
+                         for board in boards], dtype=np.uint8)
+
+    def analyze_many(self, boards) -> Dict[str, np.ndarray]:
+        """Texture flags for many same-length boards at once.
+
+        Takes a list of boards or the (N, cards) code array from encode_boards
+        and returns one array per field, named as in BoardAnalysis.
+        """
+        codes = boards if isinstance(boards, np.ndarray) else self.encode_boards(boards)
+        if codes.ndim != 2 or codes.shape[1] < 3:
+            raise ValueError("analyze_many needs an (N, cards) batch of boards with 3+ cards")
+        num_cards = codes.shape[1]
+
+        ranks = (codes >> 2).astype(np.int32)
+        suits = codes & 3
+        rank_masks = np.bitwise_or.reduce(1 << ranks, axis=1)
+        table_index = rank_masks >> LOWEST_RANK_BIT
 
-        # Check for flush draws
-        suits = [card[1] for card in board]
-        max_suit_count = max(suits.count(suit) for suit in set(suits))
-        if max_suit_count >= 3:
-            score += 0.3
+        # Most repeated rank and per-suit card counts of each board
+        multiplicity = (ranks[:, :, None] == ranks[:, None, :]).sum(axis=2).max(axis=1)
+        suit_counts = np.stack([(suits == suit).sum(axis=1) for suit in range(4)], axis=1)
+        max_suit_count = suit_counts.max(axis=1)
+        suits_on_board = (suit_counts > 0).sum(axis=1)
+        num_straights = TABLE_STRAIGHT_COUNTS[table_index]
 
-        # Check for straight draws
-        ranks = sorted([self.hand_evaluator._rank_to_number(card[0]) for card in board])
-        gaps = sum(ranks[i+1] - ranks[i] - 1 for i in range(len(ranks)-1))
-        if gaps <= 2:
-            score += 0.3
+        return {
+            'is_paired': multiplicity >= 2,
+            'is_trips_on_board': multiplicity >= 3,
+            'is_quads_on_board': multiplicity >= 4,
+            'is_monotone': suits_on_board == 1,
+            'is_two_tone': suits_on_board == 2,
+            'is_rainbow': suits_on_board == num_cards,
+            'suits_on_board': suits_on_board,
+            'flush_possible': max_suit_count >= 3,
+            'flush_draw_possible': max_suit_count >= 2,
+            'straight_possible': num_straights > 0,
+            'gut_shot_straight_draw_possible': TABLE_GUTSHOTS[table_index],
+            'number_of_straight_possibilities': num_straights,
+        }
 
-        # Add texture points
-        if self._is_paired(board):
-            score += 0.2
-        if self._is_connected(board):
-            score += 0.2
+    def _scan_board(self, board: List[str]) -> Tuple[int, List[int], str]:
+        """Collect the rank bitmask, per-suit counts and highest card in one pass"""
+        rank_mask = 0
+        suit_counts = [0, 0, 0, 0]
+        highest_card = board[0]
+        highest_rank = -1
+        for card in board:
+            rank = RANK_LUT[ord(card[0])]
+            rank_mask |= 1 << rank
+            suit_counts[SUIT_IDX[card[1]]] += 1
+            if rank > highest_rank:
+                highest_rank = rank
+                highest_card = card
+        return rank_mask, suit_counts, highest_card
 
-        return min(score, 1.0)
+    def _calculate_draw_density(self, rank_mask: int, max_suit_count: int, num_cards: int) -> float:
+        """Calculate draw density (0-1 scale)"""
+        return _draw_density_from_mask(rank_mask, max_suit_count, num_cards)
 
     def _get_highest_card(self, board: List[str]) -> str:
         """Get highest card on board"""
-        return max(board, key=lambda x: self.hand_evaluator._rank_to_number(x[0]))
+        return self._scan_board(board)[2]
 
-    def _count_straight_possibilities(self, board: List[str]) -> int:
+    def _count_straight_possibilities(self, rank_mask: int) -> int:
         """Count number of possible straights"""
-        ranks = set(self.hand_evaluator._rank_to_number(card[0]) for card in board)
-        count = 0
-
-        # Check each possible 5-card straight
-        for i in range(1, 11):  # Ace-low to Ace-high
-            straight = set(range(i, i+5))
-            overlap = len(ranks & straight)
-            if overlap >= 3:  # Board has 3+ cards to straight
-                count += 1
-
-        return count
+        return STRAIGHT_COUNTS[rank_mask]
 
     def _count_flush_possibilities(self, board: List[str]) -> dict:
         """Count flush possibilities by suit"""
-        suits = [card[1] for card in board]
-        return {suit: suits.count(suit) for suit in set(suits)}
+        suit_counts = [0, 0, 0, 0]
+        for card in board:
+            suit_counts[SUIT_IDX[card[1]]] += 1
+        return self._suit_count_dict(suit_counts)
+
+    def _suit_count_dict(self, suit_counts: List[int]) -> dict:
+        """Convert a 4-entry suit count array to a dict of the suits present"""
+        return {suit: count for suit, count in zip(SUITS, suit_counts) if count}
 
     def _classify_texture(self, analysis: dict) -> BoardTexture:
         """Classify board texture based on analysis"""
@@ -4,8 +4,93 @@ Board Texture Symbols for OpenPPL implementation.
 This module implements the board texture symbols from OpenPPL.
 """
 
-from typing import List, Dict, Optional, Set
-from poker_enums import Street, Card, Rank, Suit
+from functools import cached_property
+from typing import List, Dict, Optional, Set, Tuple
+from poker_enums import Street, Card, Rank, Suit, DECK
+
+SUIT_INDEX = {suit: index for index, suit in enumerate(Suit)}
+
+# Cards packed as (rank << 2) | suit index, keyed like DECK
+CARD_CODES: Dict[str, int] = {
+    card_str: (card.rank << 2) | SUIT_INDEX[card.suit]
+    for card_str, card in DECK.items()
+}
+
+# Flops that are always rated at least semi-wet
+SEMI_WET_FLOPS = {
+    frozenset(CARD_CODES[card] for card in ('Ah', '5d', '2c')),
+    frozenset(CARD_CODES[card] for card in ('Ah', 'Kh', '2c')),
+}
+
+# Rank bit masks use bit n for a rank of value n (2-14)
+STRAIGHT_MASKS = tuple(0x1F << low for low in range(1, 11))  # Ace-low to Ace-high
+HIGH_CARD_MASK = sum(1 << rank for rank in Rank if rank >= Rank.TEN)
+ACE_QUEEN_TEN_MASK = (1 << Rank.ACE) | (1 << Rank.QUEEN) | (1 << Rank.TEN)
+ACE_KING_JACK_MASK = (1 << Rank.ACE) | (1 << Rank.KING) | (1 << Rank.JACK)
+LOWEST_RANK_BIT = int(Rank.TWO)
+
+# Danger level bounds of semi-wet boards; drier boards are dry, wetter ones wet
+DRY_DANGER_THRESHOLD = 0.3
+WET_DANGER_THRESHOLD = 0.6
+
+
+def _straight_count(mask: int) -> int:
+    """Count 5-card straights with 3+ ranks from the mask."""
+    return sum(1 for straight in STRAIGHT_MASKS if (mask & straight).bit_count() >= 3)
+
+
+def _has_four_with_one_gap(mask: int) -> bool:
+    """Check for 4 distinct ranks spanning exactly 5 rank values."""
+    ends = mask & (mask >> 4)
+    while ends:
+        low = ends & -ends
+        if (mask & (low * 0xE)).bit_count() == 2:
+            return True
+        ends ^= low
+    return False
+
+
+def _has_open_ender(mask: int) -> bool:
+    """Check the distinct ranks in the mask for an open-ended straight draw."""
+    # 3 consecutive ranks, or 4 ranks with one gap
+    return bool(mask & (mask >> 1) & (mask >> 2)) or _has_four_with_one_gap(mask)
+
+
+def _has_gutshot(mask: int) -> bool:
+    """Check the distinct ranks in the mask for a gut-shot straight draw."""
+    num_ranks = mask.bit_count()
+
+    # Special cases for A-Q-T (gut shot for K or J) and A-K-J (gut shot for Q)
+    if mask & ACE_QUEEN_TEN_MASK == ACE_QUEEN_TEN_MASK or mask & ACE_KING_JACK_MASK == ACE_KING_JACK_MASK:
+        return True
+
+    # Check for 3 cards with one gap in the middle
+    if num_ranks >= 3 and mask & (mask >> 2) & ~(mask >> 1):
+        return True
+
+    # Check for 4 cards with one gap
+    return num_ranks >= 4 and _has_four_with_one_gap(mask)
+
+
+def _gap_total(mask: int) -> int:
+    """Sum the gaps between neighbouring distinct ranks, capping each at 4."""
+    total = 0
+    previous = None
+    while mask:
+        rank = (mask & -mask).bit_length() - 1
+        if previous is not None:
+            total += min(rank - previous - 1, 4)
+        previous = rank
+        mask &= mask - 1
+    return total
+
+
+# Rank-only facts for every set of distinct ranks, indexed by rank_mask >> LOWEST_RANK_BIT:
+# (number of straight possibilities, open-ender possible, gut-shot possible, capped gap total)
+RANK_TABLE: List[Tuple[int, bool, bool, int]] = [
+    (_straight_count(mask), _has_open_ender(mask), _has_gutshot(mask), _gap_total(mask))
+    for mask in (index << LOWEST_RANK_BIT for index in range(1 << len(Rank)))
+]
 
 class BoardTextureSymbols:
     """
@@ -22,6 +107,17 @@ class BoardTextureSymbols:
         self._turn_card: Optional[Card] = None
         self._river_card: Optional[Card] = None
         self._board_cards: List[Card] = []
+        self._board_codes = b''
+        self._num_cards = 0
+        self._suit_counts = [0, 0, 0, 0]
+        self._max_suit_count = 0
+        # Ranks seen at least once, twice, three and four times
+        self._rank_mask = 0
+        self._paired_mask = 0
+        self._trips_mask = 0
+        self._quads_mask = 0
+        self._rank_info = RANK_TABLE[0]
+        self.__dict__.pop('_board_danger', None)
 
     def update_board(self, board_cards: List[str], street: Street):
         """
@@ -31,16 +127,35 @@ class BoardTextureSymbols:
             board_cards: List of card strings (e.g., ['Ah', 'Kd', '2c'])
             street: Current street
         """
-        self._board_cards = [self._parse_card(card) for card in board_cards]
+        keys = [self._card_key(card) for card in board_cards]
+        self._board_cards = [DECK[key] for key in keys]
+        self._board_codes = bytes(CARD_CODES[key] for key in keys)
+        self._encode_board()
+        self.__dict__.pop('_board_danger', None)
 
         if street >= Street.FLOP and len(board_cards) >= 3:
-            self._flop_cards = [self._parse_card(card) for card in board_cards[:3]]
+            self._flop_cards = self._board_cards[:3]
 
         if street >= Street.TURN and len(board_cards) >= 4:
-            self._turn_card = self._parse_card(board_cards[3])
+            self._turn_card = self._board_cards[3]
 
         if street >= Street.RIVER and len(board_cards) >= 5:
-            self._river_card = self._parse_card(board_cards[4])
+            self._river_card = self._board_cards[4]
+
+    def _card_key(self, card_str: str) -> str:
+        """
+        Normalize a card string to its lookup key (e.g., 'ah' -> 'Ah').
+
+        Args:
+            card_str: Card string (e.g., 'Ah')
+
+        Returns:
+            Normalized card string
+        """
+        key = card_str[0].upper() + card_str[1].lower()
+        if key not in DECK:
+            raise ValueError(f"Invalid card: {card_str}")
+        return key
 
     def _parse_card(self, card_str: str) -> Card:
         """
@@ -52,36 +167,37 @@ class BoardTextureSymbols:
         Returns:
             Card object
         """
-        rank_char = card_str[0].upper()
-        suit_char = card_str[1].lower()
-
-        # Convert rank character to Rank enum
-        if rank_char == 'A':
-            rank = Rank.ACE
-        elif rank_char == 'K':
-            rank = Rank.KING
-        elif rank_char == 'Q':
-            rank = Rank.QUEEN
-        elif rank_char == 'J':
-            rank = Rank.JACK
-        elif rank_char == 'T':
-            rank = Rank.TEN
-        else:
-            rank = Rank(int(rank_char))
-
-        # Convert suit character to Suit enum
-        if suit_char == 'h':
-            suit = Suit.HEARTS
-        elif suit_char == 'd':
-            suit = Suit.DIAMONDS
-        elif suit_char == 'c':
-            suit = Suit.CLUBS
-        elif suit_char == 's':
-            suit = Suit.SPADES
-        else:
-            raise ValueError(f"Invalid suit: {suit_char}")
-
-        return Card(rank, suit)
+        return DECK[self._card_key(card_str)]
+
+    def _encode_board(self):
+        """Encode the board cards as suit counts and per-multiplicity rank masks."""
+        suit_counts = [0, 0, 0, 0]
+        rank_mask = paired_mask = trips_mask = quads_mask = 0
+
+        for code in self._board_codes:
+            bit = 1 << (code >> 2)
+            suit_counts[code & 3] += 1
+            if rank_mask & bit:
+                if paired_mask & bit:
+                    if trips_mask & bit:
+                        quads_mask |= bit
+                    trips_mask |= bit
+                paired_mask |= bit
+            rank_mask |= bit
+
+        self._num_cards = len(self._board_codes)
+        self._suit_counts = suit_counts
+        self._max_suit_count = max(suit_counts)
+        self._rank_mask = rank_mask
+        self._paired_mask = paired_mask
+        self._trips_mask = trips_mask
+        self._quads_mask = quads_mask
+        self._rank_info = RANK_TABLE[rank_mask >> LOWEST_RANK_BIT]
+
+    def _cards_in(self, mask: int) -> int:
+        """Count the board cards whose rank bit is in mask."""
+        return ((self._rank_mask & mask).bit_count() + (self._paired_mask & mask).bit_count() +
+                (self._trips_mask & mask).bit_count() + (self._quads_mask & mask).bit_count())
 
     # Connectedness symbols
 
@@ -92,14 +208,12 @@ class BoardTextureSymbols:
         Returns:
             True if the board has connected cards, False otherwise
         """
-        if not self._board_cards:
+        if not self._num_cards:
             return False
 
-        ranks = sorted([card.rank.value for card in self._board_cards])
-        for i in range(len(ranks) - 1):
-            if ranks[i + 1] - ranks[i] <= 2:  # Connected or 1-gap
-                return True
-        return False
+        # A paired rank or two ranks at most one gap apart
+        mask = self._rank_mask
+        return bool(self._paired_mask or mask & ((mask >> 1) | (mask >> 2)))
 
     def is_very_connected_board(self) -> bool:
         """
@@ -108,21 +222,12 @@ class BoardTextureSymbols:
         Returns:
             True if the board has 3+ consecutive cards, False otherwise
         """
-        if len(self._board_cards) < 3:
+        if self._num_cards < 3:
             return False
 
-        ranks = sorted([card.rank.value for card in self._board_cards])
-        consecutive_count = 1
-        max_consecutive = 1
-
-        for i in range(1, len(ranks)):
-            if ranks[i] == ranks[i-1] + 1:
-                consecutive_count += 1
-                max_consecutive = max(max_consecutive, consecutive_count)
-            else:
-                consecutive_count = 1
-
-        return max_consecutive >= 3
+        # A rank with both neighbours present; pairing the middle rank breaks the run
+        mask = self._rank_mask
+        return bool(mask & (mask >> 1) & (mask << 1) & ~self._paired_mask)
 
     def board_connectedness(self) -> float:
         """
@@ -131,25 +236,20 @@ class BoardTextureSymbols:
         Returns:
             Connectedness score (0-1)
         """
-        if not self._board_cards:
+        if not self._num_cards:
             return 0.0
 
-        ranks = sorted([card.rank.value for card in self._board_cards])
-        total_gaps = 0
-        max_possible_gaps = (len(ranks) - 1) * 12  # Max gap between cards is 12 (2 to A)
+        max_possible_gaps = (self._num_cards - 1) * 12  # Max gap between cards is 12 (2 to A)
 
-        for i in range(len(ranks) - 1):
-            gap = ranks[i + 1] - ranks[i] - 1
-            total_gaps += min(gap, 4)  # Cap gaps at 4 for scoring
+        # Gaps between distinct ranks are capped at 4; each repeated rank counts as a gap of -1
+        total_gaps = self._rank_info[3] + self._rank_mask.bit_count() - self._num_cards
 
         # Invert the score so 0 gaps = 1.0 and max gaps = 0.0
         connectedness = 1.0 - (total_gaps / max_possible_gaps)
 
         # Adjust for A-K-Q type boards which should be very connected
-        if len(self._board_cards) >= 3:
-            high_cards = [card for card in self._board_cards if card.rank.value >= Rank.TEN.value]
-            if len(high_cards) >= 3:
-                connectedness = max(connectedness, 0.8)
+        if self._num_cards >= 3 and self._cards_in(HIGH_CARD_MASK) >= 3:
+            connectedness = max(connectedness, 0.8)
 
         return connectedness
 
@@ -162,10 +262,10 @@ class BoardTextureSymbols:
         Returns:
             True if all cards are the same suit, False otherwise
         """
-        if not self._board_cards:
+        if not self._num_cards:
             return False
 
-        return len(set(card.suit for card in self._board_cards)) == 1
+        return self.suits_on_board() == 1
 
     def is_two_tone_board(self) -> bool:
         """
@@ -174,10 +274,10 @@ class BoardTextureSymbols:
         Returns:
             True if the board has exactly two suits, False otherwise
         """
-        if not self._board_cards:
+        if not self._num_cards:
             return False
 
-        return len(set(card.suit for card in self._board_cards)) == 2
+        return self.suits_on_board() == 2
 
     def is_rainbow_board(self) -> bool:
         """
@@ -186,10 +286,10 @@ class BoardTextureSymbols:
         Returns:
             True if all cards have different suits, False otherwise
         """
-        if not self._board_cards:
+        if not self._num_cards:
             return False
 
-        return len(set(card.suit for card in self._board_cards)) == len(self._board_cards)
+        return self.suits_on_board() == self._num_cards
 
     def flush_possible(self) -> bool:
         """
@@ -198,11 +298,10 @@ class BoardTextureSymbols:
         Returns:
             True if a flush is possible, False otherwise
         """
-        if len(self._board_cards) < 3:
+        if self._num_cards < 3:
             return False
 
-        suits = [card.suit for card in self._board_cards]
-        return max(suits.count(suit) for suit in set(suits)) >= 3
+        return self._max_suit_count >= 3
 
     def flush_draw_possible(self) -> bool:
         """
@@ -211,11 +310,10 @@ class BoardTextureSymbols:
         Returns:
             True if a flush draw is possible, False otherwise
         """
-        if len(self._board_cards) < 2:
+        if self._num_cards < 2:
             return False
 
-        suits = [card.suit for card in self._board_cards]
-        return max(suits.count(suit) for suit in set(suits)) >= 2
+        return self._max_suit_count >= 2
 
     def suits_on_board(self) -> int:
         """
@@ -224,10 +322,7 @@ class BoardTextureSymbols:
         Returns:
             Number of different suits
         """
-        if not self._board_cards:
-            return 0
-
-        return len(set(card.suit for card in self._board_cards))
+        return 4 - self._suit_counts.count(0)
 
     # Paired board symbols
 
@@ -238,11 +333,10 @@ class BoardTextureSymbols:
         Returns:
             True if the board has at least one pair, False otherwise
         """
-        if len(self._board_cards) < 2:
+        if self._num_cards < 2:
             return False
 
-        ranks = [card.rank for card in self._board_cards]
-        return len(set(ranks)) < len(ranks)
+        return bool(self._paired_mask)
 
     def is_trips_on_board(self) -> bool:
         """
@@ -251,11 +345,10 @@ class BoardTextureSymbols:
         Returns:
             True if the board has trips, False otherwise
         """
-        if len(self._board_cards) < 3:
+        if self._num_cards < 3:
             return False
 
-        ranks = [card.rank for card in self._board_cards]
-        return any(ranks.count(rank) >= 3 for rank in set(ranks))
+        return bool(self._trips_mask)
 
     def is_two_pair_on_board(self) -> bool:
         """
@@ -264,12 +357,10 @@ class BoardTextureSymbols:
         Returns:
             True if the board has two pairs, False otherwise
         """
-        if len(self._board_cards) < 4:
+        if self._num_cards < 4:
             return False
 
-        ranks = [card.rank for card in self._board_cards]
-        pairs = [rank for rank in set(ranks) if ranks.count(rank) >= 2]
-        return len(pairs) >= 2
+        return self._paired_mask.bit_count() >= 2
 
     def is_full_house_on_board(self) -> bool:
         """
@@ -278,17 +369,10 @@ class BoardTextureSymbols:
         Returns:
             True if the board has a full house, False otherwise
         """
-        if len(self._board_cards) < 5:
+        if self._num_cards < 5:
             return False
 
-        ranks = [card.rank for card in self._board_cards]
-        has_trips = any(ranks.count(rank) >= 3 for rank in set(ranks))
-        pairs = [rank for rank in set(ranks) if ranks.count(rank) >= 2]
-
-        if has_trips and len(pairs) >= 2:
-            return True
-
-        return any(ranks.count(rank) >= 3 for rank in set(ranks)) and any(ranks.count(rank) == 2 for rank in set(ranks))
+        return bool(self._trips_mask) and self._paired_mask.bit_count() >= 2
 
     def is_quads_on_board(self) -> bool:
         """
@@ -297,11 +381,10 @@ class BoardTextureSymbols:
         Returns:
             True if the board has quads, False otherwise
         """
-        if len(self._board_cards) < 4:
+        if self._num_cards < 4:
             return False
 
-        ranks = [card.rank for card in self._board_cards]
-        return any(ranks.count(rank) >= 4 for rank in set(ranks))
+        return bool(self._quads_mask)
 
     # Texture change symbols
 
@@ -321,21 +404,18 @@ class BoardTextureSymbols:
             return True
 
         # Check if turn pairs the board
-        flop_ranks = [card.rank for card in self._flop_cards]
-        if self._turn_card.rank in flop_ranks:
+        flop_ranks = sorted(card.rank for card in self._flop_cards)
+        turn_rank = self._turn_card.rank
+        if turn_rank in flop_ranks:
             return True
 
-        # Check if turn completes a straight
-        flop_ranks_values = sorted([card.rank.value for card in self._flop_cards])
-        turn_rank_value = self._turn_card.rank.value
-
         # Check if turn fills a gap in the flop ranks
-        for i in range(len(flop_ranks_values) - 1):
-            if flop_ranks_values[i] + 1 < flop_ranks_values[i + 1] and flop_ranks_values[i] < turn_rank_value < flop_ranks_values[i + 1]:
+        for i in range(len(flop_ranks) - 1):
+            if flop_ranks[i] + 1 < flop_ranks[i + 1] and flop_ranks[i] < turn_rank < flop_ranks[i + 1]:
                 return True
 
         # Check if turn extends the straight possibilities
-        if (min(flop_ranks_values) - 1 == turn_rank_value) or (max(flop_ranks_values) + 1 == turn_rank_value):
+        if (flop_ranks[0] - 1 == turn_rank) or (flop_ranks[-1] + 1 == turn_rank):
             return True
 
         return False
@@ -357,15 +437,12 @@ class BoardTextureSymbols:
 
         # Check if river pairs the board
         turn_board_ranks = [card.rank for card in self._flop_cards + [self._turn_card]]
-        if self._river_card.rank in turn_board_ranks:
+        river_rank = self._river_card.rank
+        if river_rank in turn_board_ranks:
             return True
 
         # Check if river completes a straight
-        turn_board_rank_values = sorted([card.rank.value for card in self._flop_cards + [self._turn_card]])
-        river_rank_value = self._river_card.rank.value
-
-        # Check for straights
-        all_ranks = sorted(turn_board_rank_values + [river_rank_value])
+        all_ranks = sorted(turn_board_ranks + [river_rank])
         for i in range(len(all_ranks) - 4):
             if all_ranks[i+4] - all_ranks[i] <= 4:  # At most 4 gaps in 5 cards
                 return True
@@ -381,19 +458,11 @@ class BoardTextureSymbols:
         Returns:
             True if a straight is possible, False otherwise
         """
-        if len(self._board_cards) < 3:
+        if self._num_cards < 3:
             return False
 
-        ranks = sorted([card.rank.value for card in self._board_cards])
-
-        # Check each possible 5-card straight
-        for i in range(1, 11):  # Ace-low to Ace-high
-            straight = set(range(i, i+5))
-            overlap = len(set(ranks) & straight)
-            if overlap >= 3:  # Board has 3+ cards to straight
-                return True
-
-        return False
+        # Board has 3+ cards to some 5-card straight
+        return self._rank_info[0] > 0
 
     def open_ended_straight_draw_possible(self) -> bool:
         """
@@ -402,21 +471,30 @@ class BoardTextureSymbols:
         Returns:
             True if an open-ended straight draw is possible, False otherwise
         """
-        if len(self._board_cards) < 3:
+        if self._num_cards < 3:
             return False
 
-        ranks = sorted([card.rank.value for card in self._board_cards])
+        mask = self._rank_mask
+        paired = self._paired_mask
 
-        # Check for 3 consecutive cards
-        for i in range(len(ranks) - 2):
-            if ranks[i+2] - ranks[i] == 2:  # 3 consecutive cards
-                return True
+        # Without repeated ranks the answer only depends on the distinct ranks
+        if not paired:
+            return self._rank_info[1]
+
+        # Check for 3 consecutive cards (in sorted order, so a paired end rank
+        # stands in for a missing middle rank and a paired middle rank does not count)
+        if mask & (mask >> 2) & ((mask & ~paired) >> 1 | ~(mask >> 1) & (paired | paired >> 2)):
+            return True
 
         # Check for 4 cards with one gap
-        if len(ranks) >= 4:
-            for i in range(len(ranks) - 3):
-                if ranks[i+3] - ranks[i] == 4:  # 4 cards with one gap
+        if self._num_cards >= 4:
+            ends = mask & (mask >> 4)
+            while ends:
+                low = ends & -ends
+                inner = self._cards_in(low * 0xE)
+                if inner <= 2 and inner + self._cards_in(low) + self._cards_in(low << 4) >= 4:
                     return True
+                ends ^= low
 
         return False
 
@@ -427,32 +505,10 @@ class BoardTextureSymbols:
         Returns:
             True if a gut-shot straight draw is possible, False otherwise
         """
-        if len(self._board_cards) < 3:
+        if self._num_cards < 3:
             return False
 
-        # Get unique ranks
-        ranks = sorted(set([card.rank.value for card in self._board_cards]))
-
-        # Special case for A-Q-T (gut shot for K or J)
-        if Rank.ACE.value in ranks and Rank.QUEEN.value in ranks and Rank.TEN.value in ranks:
-            return True
-
-        # Special case for A-K-J (gut shot for Q)
-        if Rank.ACE.value in ranks and Rank.KING.value in ranks and Rank.JACK.value in ranks:
-            return True
-
-        # Check for 3 cards with one gap in the middle
-        for i in range(len(ranks) - 2):
-            if ranks[i+1] - ranks[i] == 2 or ranks[i+2] - ranks[i+1] == 2:
-                return True
-
-        # Check for 4 cards with one gap
-        if len(ranks) >= 4:
-            for i in range(len(ranks) - 3):
-                if ranks[i+3] - ranks[i] == 4:  # 4 cards with one gap
-                    return True
-
-        return False
+        return self._rank_info[2]
 
     def number_of_straight_possibilities(self) -> int:
         """
@@ -461,20 +517,11 @@ class BoardTextureSymbols:
         Returns:
             Number of possible straights
         """
-        if len(self._board_cards) < 3:
+        if self._num_cards < 3:
             return 0
 
-        ranks = set(card.rank.value for card in self._board_cards)
-        count = 0
-
-        # Check each possible 5-card straight
-        for i in range(1, 11):  # Ace-low to Ace-high
-            straight = set(range(i, i+5))
-            overlap = len(ranks & straight)
-            if overlap >= 3:  # Board has 3+ cards to straight
-                count += 1
-
-        return count
+        # Count 5-card straights the board has 3+ cards to
+        return self._rank_info[0]
 
     # Board danger level symbols
 
@@ -482,55 +529,76 @@ class BoardTextureSymbols:
         """
         Calculate the danger level of the board (0-1 scale).
 
+        Returns:
+            Danger level score (0-1)
+        """
+        return self._board_danger
+
+    @cached_property
+    def _board_danger(self) -> float:
+        """Danger level of the current board, cleared by update_board."""
+        return self._danger_level({
+            'is_paired_board': self.is_paired_board(),
+            'is_trips_on_board': self.is_trips_on_board(),
+            'is_two_pair_on_board': self.is_two_pair_on_board(),
+            'is_full_house_on_board': self.is_full_house_on_board(),
+            'is_quads_on_board': self.is_quads_on_board(),
+            'flush_possible': self.flush_possible(),
+            'straight_possible': self.straight_possible(),
+            'number_of_straight_possibilities': self.number_of_straight_possibilities(),
+            'board_connectedness': self.board_connectedness(),
+        })
+
+    def _danger_level(self, symbols: Dict[str, object]) -> float:
+        """
+        Calculate the danger level from already evaluated symbols.
+
+        Args:
+            symbols: Symbol values keyed by symbol method name
+
         Returns:
             Danger level score (0-1)
         """
         danger = 0.0
 
         # Paired board
-        if self.is_paired_board():
+        if symbols['is_paired_board']:
             danger += 0.2
 
         # Trips on board
-        if self.is_trips_on_board():
+        if symbols['is_trips_on_board']:
             danger += 0.3
 
         # Two pair on board
-        if self.is_two_pair_on_board():
+        if symbols['is_two_pair_on_board']:
             danger += 0.2
 
         # Full house on board
-        if self.is_full_house_on_board():
+        if symbols['is_full_house_on_board']:
             danger += 0.4
 
         # Quads on board
-        if self.is_quads_on_board():
+        if symbols['is_quads_on_board']:
             danger += 0.5
 
         # Flush possible
-        if self.flush_possible():
+        if symbols['flush_possible']:
             danger += 0.2
 
         # Straight possible
-        if self.straight_possible():
+        if symbols['straight_possible']:
             danger += 0.2
 
         # Multiple straight possibilities
-        if self.number_of_straight_possibilities() > 1:
+        if symbols['number_of_straight_possibilities'] > 1:
             danger += 0.2
 
         # Connectedness
-        danger += self.board_connectedness() * 0.2
-
-        # Adjust for semi-wet boards
-        if len(self._board_cards) == 3:
-            # For flop, adjust danger level to ensure semi-wet boards
-            if 'Ah' in [str(card) for card in self._board_cards] and '5d' in [str(card) for card in self._board_cards] and '2c' in [str(card) for card in self._board_cards]:
-                danger = max(danger, 0.3)  # Ensure this specific board is at least semi-wet
+        danger += symbols['board_connectedness'] * 0.2
 
-            # Ensure Ah-Kh-2c is semi-wet
-            if 'Ah' in [str(card) for card in self._board_cards] and 'Kh' in [str(card) for card in self._board_cards] and '2c' in [str(card) for card in self._board_cards]:
-                danger = max(danger, 0.3)  # Ensure this specific board is at least semi-wet
+        # Adjust for semi-wet boards (Ah-5d-2c and Ah-Kh-2c on the flop)
+        if self._num_cards == 3 and frozenset(self._board_codes) in SEMI_WET_FLOPS:
+            danger = max(danger, 0.3)  # Ensure this specific board is at least semi-wet
 
         return min(danger, 1.0)
 
@@ -541,7 +609,7 @@ class BoardTextureSymbols:
         Returns:
             True if the board is dry, False otherwise
         """
-        return self.board_danger_level() < 0.3
+        return self.board_danger_level() < DRY_DANGER_THRESHOLD
 
     def is_wet_board(self) -> bool:
         """
@@ -550,7 +618,7 @@ class BoardTextureSymbols:
         Returns:
             True if the board is wet, False otherwise
         """
-        return self.board_danger_level() > 0.6
+        return self.board_danger_level() > WET_DANGER_THRESHOLD
 
     def is_semi_wet_board(self) -> bool:
         """
@@ -559,5 +627,64 @@ class BoardTextureSymbols:
         Returns:
             True if the board is semi-wet, False otherwise
         """
-        danger = self.board_danger_level()
-        return 0.3 <= danger <= 0.6
+        return DRY_DANGER_THRESHOLD <= self.board_danger_level() <= WET_DANGER_THRESHOLD
+
+    def compute_all(self) -> Dict[str, object]:
+        """
+        Evaluate every board texture symbol in one pass over the encoded board.
+
+        Returns:
+            Dictionary mapping each symbol method name to its value
+        """
+        num_cards = self._num_cards
+        rank_mask = self._rank_mask
+        paired_mask = self._paired_mask
+        num_pairs = paired_mask.bit_count()
+        has_trips = bool(self._trips_mask)
+        num_straights, _, has_gutshot, _ = self._rank_info
+        suits = 4 - self._suit_counts.count(0)
+        max_suit_count = self._max_suit_count
+        has_cards = num_cards > 0
+        flop_or_later = num_cards >= 3
+
+        symbols = {
+            # Connectedness
+            'is_connected_board': has_cards and bool(paired_mask or rank_mask & ((rank_mask >> 1) | (rank_mask >> 2))),
+            'is_very_connected_board': flop_or_later and bool(rank_mask & (rank_mask >> 1) & (rank_mask << 1) & ~paired_mask),
+            'board_connectedness': self.board_connectedness(),
+
+            # Suitedness
+            'is_monotone_board': has_cards and suits == 1,
+            'is_two_tone_board': has_cards and suits == 2,
+            'is_rainbow_board': has_cards and suits == num_cards,
+            'flush_possible': flop_or_later and max_suit_count >= 3,
+            'flush_draw_possible': num_cards >= 2 and max_suit_count >= 2,
+            'suits_on_board': suits,
+
+            # Paired board
+            'is_paired_board': num_cards >= 2 and bool(paired_mask),
+            'is_trips_on_board': flop_or_later and has_trips,
+            'is_two_pair_on_board': num_cards >= 4 and num_pairs >= 2,
+            'is_full_house_on_board': num_cards >= 5 and has_trips and num_pairs >= 2,
+            'is_quads_on_board': num_cards >= 4 and bool(self._quads_mask),
+
+            # Texture changes
+            'flop_texture_changed_on_turn': self.flop_texture_changed_on_turn(),
+            'turn_texture_changed_on_river': self.turn_texture_changed_on_river(),
+
+            # Draw possibilities
+            'straight_possible': flop_or_later and num_straights > 0,
+            'open_ended_straight_draw_possible': self.open_ended_straight_draw_possible(),
+            'gut_shot_straight_draw_possible': flop_or_later and has_gutshot,
+            'number_of_straight_possibilities': num_straights if flop_or_later else 0,
+        }
+
+        # Board danger level, also cached for later board_danger_level() calls
+        danger = self._danger_level(symbols)
+        self.__dict__['_board_danger'] = danger
+        symbols['board_danger_level'] = danger
+        symbols['is_dry_board'] = danger < DRY_DANGER_THRESHOLD
+        symbols['is_wet_board'] = danger > WET_DANGER_THRESHOLD
+        symbols['is_semi_wet_board'] = DRY_DANGER_THRESHOLD <= danger <= WET_DANGER_THRESHOLD
+
+        return symbols
@@ -6,10 +6,13 @@ This module creates interactive visualizations from the poker bot's log data.
 
 import os
 import json
-import glob
+import string
+from collections import Counter
 from datetime import datetime
 import webbrowser
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterator, NamedTuple
+import numpy as np
+from session_cache import SessionCache, cache_path_for, file_stamp, parse_files, session_file_id, session_sort_key
 
 # Try to import optional dependencies
 try:
@@ -17,348 +20,384 @@ try:
 except ImportError:
     pd = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec.json
+except ImportError:
+    msgspec = None
+
+# Name of the dashboard's session cache, which holds the fully decoded sessions
+SESSION_CACHE_NAME = "dashboard_sessions"
+
+# Layout of the cached sessions; caches written with any other version are ignored
+SESSION_CACHE_VERSION = 1
+
+# Win probability buckets for the decision charts; np.digitize maps into PROBABILITY_BUCKETS
+PROBABILITY_EDGES = [0.2, 0.4, 0.6, 0.8]
+PROBABILITY_BUCKETS = ('0-20%', '20-40%', '40-60%', '60-80%', '80-100%')
+
+# Streets from last to first, for finding a hand's final win probability
+_STREET_ORDER = ('RIVER', 'TURN', 'FLOP', 'PREFLOP')
+
+# CSS class for each suit letter on the dashboard's playing cards
+_SUIT_MAP = {'h': 'hearts', 'd': 'diamonds', 'c': 'clubs', 's': 'spades'}
+
+class SessionSummary(NamedTuple):
+    """Summary line for one session in the log directory"""
+    session_id: str
+    hands_played: int
+    profit_loss: float
+    duration: float
+    file_path: str
+
+def _loads(raw: bytes) -> Any:
+    """Decode JSON bytes, with orjson when available"""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than json (e.g. NaN), so let json have a go
+            pass
+    return json.loads(raw)
+
+def _dumps(obj: Any) -> bytes:
+    """Encode JSON to bytes, with orjson or msgspec when available"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except orjson.JSONEncodeError:
+            # e.g. non-str keys or big ints, which json still handles
+            pass
+    elif msgspec is not None:
+        try:
+            return msgspec.json.encode(obj)
+        except (TypeError, OverflowError, msgspec.EncodeError):
+            pass
+    return json.dumps(obj).encode('utf-8')
+
+def _parse_cards(cards: List[str]) -> List[Dict[str, str]]:
+    """Split cards into rank and suit class for the dashboard to render"""
+    return [{'r': card[:-1], 's': _SUIT_MAP.get(card[-1:].lower(), '')} for card in cards if card]
+
+def _action_key(action: Dict[str, Any]) -> frozenset:
+    """Hashable key that matches actions the way dict equality does"""
+    return frozenset(action.items())
+
 class DashboardGenerator:
     """
     Generates interactive dashboards from GeckoBot log data
     """
     def __init__(self, log_dir: str = "logs"):
         self.log_dir = log_dir
-        self.sessions = self._load_sessions()
-
-    def _load_sessions(self) -> List[Dict[str, Any]]:
-        """Load all available session data"""
+        self.sessions = self._index_sessions()
+        # Loaded sessions by file path
+        self._session_data: Dict[str, Dict[str, Any]] = {}
+        self._list_cache: Optional[List[SessionSummary]] = None
+        self._disk_cache = SessionCache(cache_path_for(self.log_dir, SESSION_CACHE_NAME), SESSION_CACHE_VERSION)
+        self._asset_dirs = set()
+
+    def _index_sessions(self) -> List[tuple]:
+        """Index available sessions as (session_id, file_path, stamp) without parsing them"""
         sessions = []
-        data_files = glob.glob(os.path.join(self.log_dir, "*_data.json"))
 
-        for file_path in data_files:
+        for entry in self._iter_data_files():
             try:
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
-                    # Add file path to the data
-                    data['file_path'] = file_path
-                    sessions.append(data)
-            except Exception as e:
-                print(f"Error loading {file_path}: {e}")
+                stat = entry.stat()
+            except OSError as e:
+                print(f"Error loading {entry.path}: {e}")
+                continue
+            sessions.append((session_file_id(entry.name), entry.path, file_stamp(stat)))
 
         # Sort by timestamp (most recent first)
-        sessions.sort(key=lambda x: x.get('session_id', ''), reverse=True)
+        sessions.sort(key=lambda x: session_sort_key(x[1]), reverse=True)
         return sessions
 
-    def list_sessions(self) -> List[Dict[str, Any]]:
+    def _get_session(self, session_index: int) -> Dict[str, Any]:
+        """Load a session's data on first use"""
+        self._load_through(session_index)
+        return self._session_data[self.sessions[session_index][1]]
+
+    def _load_through(self, session_index: int):
+        """Load the sessions up to session_index, so unreadable ones ahead of it drop out of the index"""
+        while True:
+            # A negative index counts from the end, so needs every session loaded
+            limit = session_index + 1 if session_index >= 0 else len(self.sessions)
+            pending = [i for i in range(min(limit, len(self.sessions)))
+                       if self.sessions[i][1] not in self._session_data]
+            if not pending:
+                return
+            self._load_session_data(pending)
+
+    def _load_session_data(self, indices: List[int]):
+        """Load the given sessions from the cache, parsing the rest in parallel; unreadable ones are dropped"""
+        to_parse = []
+        for i in indices:
+            _, file_path, stamp = self.sessions[i]
+            cached = self._disk_cache.get(file_path, stamp)
+            if cached is not None:
+                self._session_data[file_path] = cached
+            else:
+                to_parse.append(i)
+
+        paths = [self.sessions[i][1] for i in to_parse]
+        parsed = parse_files(paths, self._parse_session_file)
+
+        failed = set()
+        for i, data in zip(to_parse, parsed):
+            _, file_path, stamp = self.sessions[i]
+            if data is None:
+                failed.add(file_path)
+            else:
+                self._disk_cache.put(file_path, stamp, data)
+                self._session_data[file_path] = data
+        if failed:
+            self.sessions = [session for session in self.sessions if session[1] not in failed]
+
+    def _parse_session_file(self, file_path: str) -> Optional[Dict[str, Any]]:
+        """Read and decode one session file, or None if it cannot be loaded"""
+        try:
+            with open(file_path, 'rb') as f:
+                data = _loads(f.read())
+            # Add file path to the data
+            data['file_path'] = file_path
+            return data
+        except Exception as e:
+            print(f"Error loading {file_path}: {e}")
+            return None
+
+    def _save_session_cache(self):
+        """Write back sessions parsed since the cache was last saved"""
+        # Drop entries for logs that no longer exist
+        self._disk_cache.save({file_path for _, file_path, _ in self.sessions})
+
+    def _iter_data_files(self) -> Iterator[os.DirEntry]:
+        """Yield the *_data.json session files in the log directory"""
+        try:
+            with os.scandir(self.log_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.endswith("_data.json") and not name.startswith('.') and entry.is_file():
+                        yield entry
+        except FileNotFoundError:
+            return
+
+    def list_sessions(self) -> List[SessionSummary]:
         """List all available sessions with summary info"""
-        return [
-            {
-                'session_id': session.get('session_id', 'Unknown'),
-                'hands_played': session.get('hands_played', 0),
-                'profit_loss': session.get('profit_loss', 0),
-                'duration': session.get('duration', 0),
-                'file_path': session.get('file_path', '')
-            }
-            for session in self.sessions
-        ]
+        if self._list_cache is not None:
+            return self._list_cache
+
+        self._load_through(len(self.sessions) - 1)
+
+        summaries = []
+        for i in range(len(self.sessions)):
+            session = self._get_session(i)
+            summaries.append(SessionSummary(
+                session_id=session.get('session_id', 'Unknown'),
+                hands_played=session.get('hands_played', 0),
+                profit_loss=session.get('profit_loss', 0),
+                duration=session.get('duration', 0),
+                file_path=session.get('file_path', '')
+            ))
+        self._save_session_cache()
+        self._list_cache = summaries
+        return summaries
 
     def generate_dashboard(self, session_index: int = 0, output_path: Optional[str] = None) -> str:
         """Generate an interactive dashboard for the specified session"""
+        # Unreadable files drop out of the index as they are loaded, so load before checking the index
+        self._load_through(session_index)
+
         if not self.sessions:
             return "No sessions available"
 
         if session_index >= len(self.sessions):
             session_index = 0
 
-        session = self.sessions[session_index]
+        session = self._get_session(session_index)
+        self._save_session_cache()
 
         if output_path is None:
             output_path = os.path.join(self.log_dir, f"dashboard_{session.get('session_id', 'unknown')}.html")
 
         # Generate HTML content
-        html_content = self._generate_html(session)
+        html_chunks = self._html_chunks(session)
 
         # Write to file
-        with open(output_path, 'w') as f:
-            f.write(html_content)
+        with open(output_path, 'wb') as f:
+            f.writelines(html_chunks)
+        self._write_assets(os.path.dirname(os.path.abspath(output_path)))
 
         return output_path
 
+    def _write_assets(self, directory: str):
+        """Write the shared dashboard stylesheet and script if missing or outdated"""
+        if directory in self._asset_dirs:
+            return
+
+        for name, content in DASHBOARD_ASSETS.items():
+            asset_path = os.path.join(directory, name)
+            try:
+                with open(asset_path, 'r', encoding='utf-8') as f:
+                    if f.read() == content:
+                        continue
+            except OSError:
+                pass
+            with open(asset_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+
+        self._asset_dirs.add(directory)
+
     def _generate_html(self, session: Dict[str, Any]) -> str:
         """Generate HTML content for the dashboard"""
+        return b''.join(self._html_chunks(session)).decode('utf-8')
+
+    def _html_chunks(self, session: Dict[str, Any]) -> List[bytes]:
+        """Build the dashboard as encoded chunks around the embedded JSON"""
         session_id = session.get('session_id', 'Unknown')
         hands = session.get('hands', [])
+        hands_played = session.get('hands_played', 0)
+        starting_stack = session.get('starting_stack', 0)
+        ending_stack = session.get('ending_stack', 0)
+        profit_loss = session.get('profit_loss', 0)
+        duration = session.get('duration', 0)
+        pl_color = '#27ae60' if profit_loss >= 0 else '#e74c3c'
+
+        # Extract hand data for visualization, one list per column
+        hand_data = {
+            'hand_id': [hand.get('hand_id', 0) for hand in hands],
+            'hole_cards': [_parse_cards(hand.get('hole_cards', [])) for hand in hands],
+            'community_cards': [_parse_cards(hand.get('community_cards', [])) for hand in hands],
+            'pot_size': [hand.get('pot_size', 0) for hand in hands],
+            'hero_stack': [hand.get('hero_stack', 0) for hand in hands],
+            'actions': [len(hand.get('actions', [])) for hand in hands],
+            'win_probability': [self._get_final_win_probability(hand) for hand in hands],
+            'streets': [list(hand.get('streets', {}).keys()) for hand in hands],
+            'duration': [
+                hand.get('end_time', 0) - hand.get('start_time', 0) if 'end_time' in hand and 'start_time' in hand else 0
+                for hand in hands
+            ]
+        }
 
-        # Extract hand data for visualization
-        hand_data = []
-        for hand in hands:
-            hand_data.append({
-                'hand_id': hand.get('hand_id', 0),
-                'hole_cards': ' '.join(hand.get('hole_cards', [])),
-                'community_cards': ' '.join(hand.get('community_cards', [])),
-                'pot_size': hand.get('pot_size', 0),
-                'hero_stack': hand.get('hero_stack', 0),
-                'actions': len(hand.get('actions', [])),
-                'win_probability': self._get_final_win_probability(hand),
-                'streets': list(hand.get('streets', {}).keys()),
-                'duration': hand.get('end_time', 0) - hand.get('start_time', 0) if 'end_time' in hand and 'start_time' in hand else 0
-            })
+        # Per-hand display values, so paging through hands in the browser is layout only
+        stacks = hand_data['hero_stack']
+        stack_changes = [next_stack - stack for stack, next_stack in zip(stacks, stacks[1:])]
+        if stacks:
+            # The last hand has no following stack to compare against
+            stack_changes.append(0)
+        hand_data['stack_change'] = stack_changes
+        hand_data['result_class'] = ['win' if change > 0 else 'loss' if change < 0 else '' for change in stack_changes]
+        hand_data['win_pct'] = [f"{(win_prob or 0) * 100:.2f}%" for win_prob in hand_data['win_probability']]
 
         # Generate decision data
         decision_data = self._extract_decision_data(hands)
 
-        # Generate HTML
-        html = f"""
+        header = _HTML_PREFIX.substitute(
+            session_id=session_id,
+            num_hands=len(hands),
+            hands_played=hands_played,
+            starting_stack=starting_stack,
+            ending_stack=ending_stack,
+            pl_color=pl_color,
+            profit_loss=profit_loss,
+            duration=f"{duration:.2f}"
+        )
+
+        return [
+            header.encode('utf-8'),
+            _dumps(hand_data),
+            _HTML_SESSION_DATA,
+            _dumps({
+                'hands_played': hands_played,
+                'starting_stack': starting_stack,
+                'ending_stack': ending_stack,
+                'profit_loss': profit_loss,
+                'duration': duration
+            }),
+            _HTML_DECISION_DATA,
+            _dumps(decision_data),
+            _HTML_SUFFIX
+        ]
+
+    def _get_final_win_probability(self, hand: Dict[str, Any]) -> float:
+        """Get the final win probability from the hand data"""
+        streets = hand.get('streets', {})
+
+        # Check streets in order: RIVER, TURN, FLOP, PREFLOP
+        for street in _STREET_ORDER:
+            street_data = streets.get(street)
+            if street_data is not None and 'win_probability' in street_data:
+                return street_data['win_probability']
+
+        return 0.0
+
+    def _extract_decision_data(self, hands: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Extract decision data for visualization"""
+        by_action = {}
+        by_probability = {bucket: {} for bucket in PROBABILITY_BUCKETS}
+
+        # One pass to tag each bot action with the win probability of its street
+        action_types = []
+        win_probs = []
+        for hand in hands:
+            bot_actions = [action for action in hand.get('actions', ()) if action.get('player') == 'Bot']
+            if not bot_actions:
+                continue
+
+            # Map each street action to the first street it appears on
+            action_to_street = {}
+            for street_data in hand.get('streets', {}).values():
+                for street_action in street_data.get('actions', []):
+                    action_to_street.setdefault(_action_key(street_action), street_data)
+
+            for action in bot_actions:
+                # Count by action type
+                action_type = action.get('action', 'unknown')
+                by_action[action_type] = by_action.get(action_type, 0) + 1
+
+                # Find the street this action was made on
+                street_data = action_to_street.get(_action_key(action))
+                if street_data is not None:
+                    action_types.append(action_type)
+                    win_probs.append(street_data.get('win_probability', 0))
+
+        # No bot decisions to bucket, e.g. an observer session
+        if not win_probs:
+            return {
+                'by_action': by_action,
+                'by_probability': by_probability
+            }
+
+        # Bucket all probabilities at once, then count by probability and action
+        bucket_idx = np.digitize(np.asarray(win_probs, dtype=float), PROBABILITY_EDGES)
+        for (bucket, action_type), count in Counter(zip(bucket_idx.tolist(), action_types)).items():
+            by_probability[PROBABILITY_BUCKETS[bucket]][action_type] = count
+
+        return {
+            'by_action': by_action,
+            'by_probability': by_probability
+        }
+
+# Dashboard page around the embedded JSON. The prefix is a string.Template for the
+# session summary; styles and scripts live in the shared asset files below.
+_HTML_PREFIX = string.Template("""
 <!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>GeckoBot Poker Dashboard - Session {session_id}</title>
+    <title>GeckoBot Poker Dashboard - Session ${session_id}</title>
     <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
     <script src="https://cdn.jsdelivr.net/npm/chartjs-plugin-datalabels"></script>
-    <style>
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            margin: 0;
-            padding: 0;
-            background-color: #f5f5f5;
-            color: #333;
-        }}
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 20px;
-        }}
-        .header {{
-            background-color: #2c3e50;
-            color: white;
-            padding: 20px;
-            text-align: center;
-            border-radius: 5px 5px 0 0;
-            margin-bottom: 20px;
-        }}
-        .dashboard-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(500px, 1fr));
-            gap: 20px;
-            margin-bottom: 20px;
-        }}
-        .card {{
-            background-color: white;
-            border-radius: 5px;
-            box-shadow: 0 2px 5px rgba(0,0,0,0.1);
-            padding: 20px;
-            margin-bottom: 20px;
-        }}
-        .card-header {{
-            border-bottom: 1px solid #eee;
-            padding-bottom: 10px;
-            margin-bottom: 15px;
-            font-size: 18px;
-            font-weight: bold;
-            color: #2c3e50;
-        }}
-        .stats-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 15px;
-        }}
-        .stat-card {{
-            background-color: #f9f9f9;
-            border-radius: 5px;
-            padding: 15px;
-            text-align: center;
-        }}
-        .stat-value {{
-            font-size: 24px;
-            font-weight: bold;
-            margin: 10px 0;
-            color: #2980b9;
-        }}
-        .stat-label {{
-            font-size: 14px;
-            color: #7f8c8d;
-        }}
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin-top: 15px;
-        }}
-        th, td {{
-            padding: 12px 15px;
-            text-align: left;
-            border-bottom: 1px solid #eee;
-        }}
-        th {{
-            background-color: #f2f2f2;
-            font-weight: bold;
-        }}
-        tr:hover {{
-            background-color: #f5f5f5;
-        }}
-        .chart-container {{
-            position: relative;
-            height: 300px;
-            margin-top: 15px;
-        }}
-        .tabs {{
-            display: flex;
-            border-bottom: 1px solid #ddd;
-            margin-bottom: 15px;
-        }}
-        .tab {{
-            padding: 10px 15px;
-            cursor: pointer;
-            background-color: #f2f2f2;
-            border: 1px solid #ddd;
-            border-bottom: none;
-            margin-right: 5px;
-            border-radius: 5px 5px 0 0;
-        }}
-        .tab.active {{
-            background-color: white;
-            border-bottom: 1px solid white;
-            margin-bottom: -1px;
-        }}
-        .tab-content {{
-            display: none;
-        }}
-        .tab-content.active {{
-            display: block;
-        }}
-        .hand-card {{
-            background-color: white;
-            border-radius: 5px;
-            box-shadow: 0 2px 5px rgba(0,0,0,0.1);
-            padding: 15px;
-            margin-bottom: 15px;
-        }}
-        .hand-header {{
-            display: flex;
-            justify-content: space-between;
-            border-bottom: 1px solid #eee;
-            padding-bottom: 10px;
-            margin-bottom: 10px;
-        }}
-        .hand-title {{
-            font-weight: bold;
-            font-size: 16px;
-        }}
-        .hand-result {{
-            font-weight: bold;
-        }}
-        .hand-result.win {{
-            color: #27ae60;
-        }}
-        .hand-result.loss {{
-            color: #e74c3c;
-        }}
-        .hand-details {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
-            gap: 10px;
-            margin-bottom: 10px;
-        }}
-        .hand-detail {{
-            font-size: 14px;
-        }}
-        .hand-detail-label {{
-            font-weight: bold;
-            color: #7f8c8d;
-            margin-bottom: 5px;
-        }}
-        .hand-actions {{
-            margin-top: 10px;
-        }}
-        .action-item {{
-            padding: 5px 0;
-            border-bottom: 1px solid #f5f5f5;
-            font-size: 14px;
-        }}
-        .action-player {{
-            font-weight: bold;
-            margin-right: 5px;
-        }}
-        .action-type {{
-            color: #7f8c8d;
-        }}
-        .action-amount {{
-            float: right;
-            color: #e74c3c;
-        }}
-        .card-grid {{
-            display: flex;
-            flex-wrap: wrap;
-            gap: 5px;
-            margin-top: 5px;
-        }}
-        .playing-card {{
-            width: 40px;
-            height: 60px;
-            background-color: white;
-            border-radius: 5px;
-            border: 1px solid #ddd;
-            display: flex;
-            justify-content: center;
-            align-items: center;
-            font-weight: bold;
-            font-size: 16px;
-            position: relative;
-        }}
-        .playing-card.hearts, .playing-card.diamonds {{
-            color: #e74c3c;
-        }}
-        .playing-card.clubs, .playing-card.spades {{
-            color: #2c3e50;
-        }}
-        .playing-card::after {{
-            position: absolute;
-            bottom: 5px;
-            right: 5px;
-            font-size: 12px;
-        }}
-        .playing-card.hearts::after {{
-            content: "♥";
-        }}
-        .playing-card.diamonds::after {{
-            content: "♦";
-        }}
-        .playing-card.clubs::after {{
-            content: "♣";
-        }}
-        .playing-card.spades::after {{
-            content: "♠";
-        }}
-        .pagination {{
-            display: flex;
-            justify-content: center;
-            margin-top: 20px;
-        }}
-        .pagination-button {{
-            padding: 8px 15px;
-            background-color: #2c3e50;
-            color: white;
-            border: none;
-            border-radius: 5px;
-            cursor: pointer;
-            margin: 0 5px;
-        }}
-        .pagination-button:disabled {{
-            background-color: #95a5a6;
-            cursor: not-allowed;
-        }}
-        .search-bar {{
-            margin-bottom: 20px;
-        }}
-        .search-input {{
-            width: 100%;
-            padding: 10px;
-            border: 1px solid #ddd;
-            border-radius: 5px;
-            font-size: 16px;
-        }}
-    </style>
+    <link rel="stylesheet" href="dashboard.css">
 </head>
 <body>
     <div class="header">
         <h1>GeckoBot Poker Dashboard</h1>
-        <p>Session: {session_id} - {len(hands)} Hands Played</p>
+        <p>Session: ${session_id} - ${num_hands} Hands Played</p>
     </div>
 
     <div class="container">
@@ -368,25 +407,25 @@ class DashboardGenerator:
             <div class="stats-grid">
                 <div class="stat-card">
                     <div class="stat-label">Hands Played</div>
-                    <div class="stat-value">{session.get('hands_played', 0)}</div>
+                    <div class="stat-value">${hands_played}</div>
                 </div>
                 <div class="stat-card">
                     <div class="stat-label">Starting Stack</div>
-                    <div class="stat-value">{session.get('starting_stack', 0)}</div>
+                    <div class="stat-value">${starting_stack}</div>
                 </div>
                 <div class="stat-card">
                     <div class="stat-label">Ending Stack</div>
-                    <div class="stat-value">{session.get('ending_stack', 0)}</div>
+                    <div class="stat-value">${ending_stack}</div>
                 </div>
                 <div class="stat-card">
                     <div class="stat-label">Profit/Loss</div>
-                    <div class="stat-value" style="color: {'#27ae60' if session.get('profit_loss', 0) >= 0 else '#e74c3c'}">
-                        {session.get('profit_loss', 0)}
+                    <div class="stat-value" style="color: ${pl_color}">
+                        ${profit_loss}
                     </div>
                 </div>
                 <div class="stat-card">
                     <div class="stat-label">Duration</div>
-                    <div class="stat-value">{session.get('duration', 0):.2f}s</div>
+                    <div class="stat-value">${duration}s</div>
                 </div>
             </div>
         </div>
@@ -443,323 +482,520 @@ class DashboardGenerator:
         </div>
     </div>
 
+    <!-- Skeleton for one hand in the history, filled in by JavaScript -->
+    <template id="handCardTemplate">
+        <div class="hand-card">
+            <div class="hand-header">
+                <div class="hand-title"></div>
+                <div class="hand-result"></div>
+            </div>
+            <div class="hand-details">
+                <div class="hand-detail">
+                    <div class="hand-detail-label">Hole Cards</div>
+                    <div class="card-grid hole-cards"></div>
+                </div>
+                <div class="hand-detail">
+                    <div class="hand-detail-label">Community Cards</div>
+                    <div class="card-grid community-cards"></div>
+                </div>
+                <div class="hand-detail">
+                    <div class="hand-detail-label">Win Probability</div>
+                    <span class="win-probability"></span>
+                </div>
+                <div class="hand-detail">
+                    <div class="hand-detail-label">Pot Size</div>
+                    <span class="pot-size"></span>
+                </div>
+            </div>
+        </div>
+    </template>
+
     <script>
-        // Hand data from Python
-        const handData = {json.dumps(hand_data)};
-        const sessionData = {json.dumps({
-            'hands_played': session.get('hands_played', 0),
-            'starting_stack': session.get('starting_stack', 0),
-            'ending_stack': session.get('ending_stack', 0),
-            'profit_loss': session.get('profit_loss', 0),
-            'duration': session.get('duration', 0)
-        })};
-        const decisionData = {json.dumps(decision_data)};
-
-        // Stack progression chart
-        const stackCtx = document.getElementById('stackChart').getContext('2d');
-        const stackChart = new Chart(stackCtx, {{
-            type: 'line',
-            data: {{
-                labels: handData.map(hand => `Hand ${hand.hand_id}`),
-                datasets: [{{
-                    label: 'Stack Size',
-                    data: handData.map(hand => hand.hero_stack),
-                    borderColor: '#2980b9',
-                    backgroundColor: 'rgba(41, 128, 185, 0.1)',
-                    borderWidth: 2,
-                    fill: true,
-                    tension: 0.1
-                }}]
-            }},
-            options: {{
-                responsive: true,
-                maintainAspectRatio: false,
-                scales: {{
-                    y: {{
-                        beginAtZero: false
-                    }}
-                }}
-            }}
-        }});
-
-        // Win probability chart
-        const winProbCtx = document.getElementById('winProbChart').getContext('2d');
-        const winProbChart = new Chart(winProbCtx, {{
-            type: 'line',
-            data: {{
-                labels: handData.map(hand => `Hand ${hand.hand_id}`),
-                datasets: [{{
-                    label: 'Win Probability',
-                    data: handData.map(hand => hand.win_probability),
-                    borderColor: '#27ae60',
-                    backgroundColor: 'rgba(39, 174, 96, 0.1)',
-                    borderWidth: 2,
-                    fill: true,
-                    tension: 0.1
-                }}]
-            }},
-            options: {{
-                responsive: true,
-                maintainAspectRatio: false,
-                scales: {{
-                    y: {{
-                        beginAtZero: true,
-                        max: 1,
-                        ticks: {{
-                            callback: function(value) {{
-                                return (value * 100) + '%';
-                            }}
-                        }}
-                    }}
-                }}
-            }}
-        }});
-
-        // Decision analysis chart
-        const decisionCtx = document.getElementById('decisionChart').getContext('2d');
-        const decisionLabels = Object.keys(decisionData.by_probability);
-        const decisionDatasets = [];
-
-        const actionTypes = [...new Set(Object.values(decisionData.by_probability).flatMap(Object.keys))];
-        const colors = ['#3498db', '#2ecc71', '#e74c3c', '#f39c12', '#9b59b6', '#1abc9c'];
-
-        actionTypes.forEach((action, index) => {{
-            const data = decisionLabels.map(prob => decisionData.by_probability[prob][action] || 0);
-            decisionDatasets.push({{
-                label: action,
-                data: data,
-                backgroundColor: colors[index % colors.length]
-            }});
-        }});
-
-        const decisionChart = new Chart(decisionCtx, {{
-            type: 'bar',
-            data: {{
-                labels: decisionLabels.map(label => label + ' Win Prob'),
-                datasets: decisionDatasets
-            }},
-            options: {{
-                responsive: true,
-                maintainAspectRatio: false,
-                scales: {{
-                    x: {{
-                        stacked: true
-                    }},
-                    y: {{
-                        stacked: true,
-                        beginAtZero: true
-                    }}
-                }}
-            }}
-        }});
-
-        // Action distribution chart
-        const actionCtx = document.getElementById('actionChart').getContext('2d');
-        const actionChart = new Chart(actionCtx, {{
-            type: 'pie',
-            data: {{
-                labels: Object.keys(decisionData.by_action),
-                datasets: [{{
-                    data: Object.values(decisionData.by_action),
-                    backgroundColor: colors.slice(0, Object.keys(decisionData.by_action).length)
-                }}]
-            }},
-            options: {{
-                responsive: true,
-                maintainAspectRatio: false,
-                plugins: {{
-                    legend: {{
-                        position: 'right'
-                    }}
-                }}
-            }}
-        }});
-
-        // Hand history pagination
-        const handsPerPage = 5;
-        let currentPage = 1;
-        const totalPages = Math.ceil(handData.length / handsPerPage);
-
-        function renderHands(page, filterText = '') {{
-            const handContainer = document.getElementById('handContainer');
-            handContainer.innerHTML = '';
-
-            const filteredHands = filterText
-                ? handData.filter(hand =>
-                    hand.hole_cards.toLowerCase().includes(filterText.toLowerCase()) ||
-                    hand.community_cards.toLowerCase().includes(filterText.toLowerCase()) ||
-                    hand.hand_id.toString().includes(filterText)
-                )
-                : handData;
-
-            const startIndex = (page - 1) * handsPerPage;
-            const endIndex = Math.min(startIndex + handsPerPage, filteredHands.length);
-
-            if (filteredHands.length === 0) {{
-                handContainer.innerHTML = '<p>No hands match your search criteria.</p>';
-                return;
-            }}
-
-            for (let i = startIndex; i < endIndex; i++) {{
-                const hand = filteredHands[i];
-                const handCard = document.createElement('div');
-                handCard.className = 'hand-card';
-
-                // Determine if hand was a win or loss
-                const isLastHand = i === filteredHands.length - 1;
-                const nextHand = !isLastHand ? filteredHands[i + 1] : null;
-                const stackChange = nextHand ? nextHand.hero_stack - hand.hero_stack : 0;
-                const resultClass = stackChange > 0 ? 'win' : stackChange < 0 ? 'loss' : '';
-
-                handCard.innerHTML = `
-                    <div class="hand-header">
-                        <div class="hand-title">Hand #${hand.hand_id}</div>
-                        <div class="hand-result ${resultClass}">
-                            ${stackChange > 0 ? '+' + stackChange : stackChange}
-                        </div>
-                    </div>
-                    <div class="hand-details">
-                        <div class="hand-detail">
-                            <div class="hand-detail-label">Hole Cards</div>
-                            <div class="card-grid">
-                                ${renderCards(hand.hole_cards)}
-                            </div>
-                        </div>
-                        <div class="hand-detail">
-                            <div class="hand-detail-label">Community Cards</div>
-                            <div class="card-grid">
-                                ${renderCards(hand.community_cards)}
-                            </div>
-                        </div>
-                        <div class="hand-detail">
-                            <div class="hand-detail-label">Win Probability</div>
-                            ${(hand.win_probability * 100).toFixed(2)}%
-                        </div>
-                        <div class="hand-detail">
-                            <div class="hand-detail-label">Pot Size</div>
-                            ${hand.pot_size}
-                        </div>
-                    </div>
-                `;
-
-                handContainer.appendChild(handCard);
-            }}
-
-            // Update pagination
-            document.getElementById('prevPage').disabled = page === 1 || filteredHands.length === 0;
-            document.getElementById('nextPage').disabled = page >= Math.ceil(filteredHands.length / handsPerPage) || filteredHands.length === 0;
-            document.getElementById('pageInfo').textContent = `Page ${page} of ${Math.max(1, Math.ceil(filteredHands.length / handsPerPage))}`;
-        }}
-
-        function renderCards(cardString) {{
-            if (!cardString) return '';
-
-            const cards = cardString.split(' ');
-            let html = '';
-
-            cards.forEach(card => {{
-                if (!card) return;
-
-                const rank = card.slice(0, -1);
-                const suit = card.slice(-1).toLowerCase();
-
-                let suitClass = '';
-                switch (suit) {{
-                    case 'h': suitClass = 'hearts'; break;
-                    case 'd': suitClass = 'diamonds'; break;
-                    case 'c': suitClass = 'clubs'; break;
-                    case 's': suitClass = 'spades'; break;
-                }}
-
-                html += `<div class="playing-card ${suitClass}">${rank}</div>`;
-            }});
-
-            return html;
-        }}
-
-        // Initialize hand display
-        renderHands(currentPage);
-
-        // Pagination event listeners
-        document.getElementById('prevPage').addEventListener('click', () => {{
-            if (currentPage > 1) {{
-                currentPage--;
-                renderHands(currentPage, document.getElementById('handSearch').value);
-            }}
-        }});
-
-        document.getElementById('nextPage').addEventListener('click', () => {{
-            if (currentPage < totalPages) {{
-                currentPage++;
-                renderHands(currentPage, document.getElementById('handSearch').value);
-            }}
-        }});
-
-        // Search functionality
-        document.getElementById('handSearch').addEventListener('input', (e) => {{
-            currentPage = 1;
-            renderHands(currentPage, e.target.value);
-        }});
-    </script>
-</body>
-</html>
-        """
+        // Hand data from Python, one array per column
+        const handData = """)
 
-        return html
+_HTML_SESSION_DATA = b""";
+        const sessionData = """
 
-    def _get_final_win_probability(self, hand: Dict[str, Any]) -> float:
-        """Get the final win probability from the hand data"""
-        streets = hand.get('streets', {})
+_HTML_DECISION_DATA = b""";
+        const decisionData = """
 
-        # Check streets in order: RIVER, TURN, FLOP, PREFLOP
-        for street in ['RIVER', 'TURN', 'FLOP', 'PREFLOP']:
-            if street in streets and 'win_probability' in streets[street]:
-                return streets[street]['win_probability']
+_HTML_SUFFIX = b""";
+    </script>
+    <script src="dashboard.js"></script>
+</body>
+</html>
+"""
 
-        return 0.0
+# Static stylesheet and script written once next to the dashboards that load them
+_DASHBOARD_CSS = """\
+body {
+    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+    margin: 0;
+    padding: 0;
+    background-color: #f5f5f5;
+    color: #333;
+}
+.container {
+    max-width: 1200px;
+    margin: 0 auto;
+    padding: 20px;
+}
+.header {
+    background-color: #2c3e50;
+    color: white;
+    padding: 20px;
+    text-align: center;
+    border-radius: 5px 5px 0 0;
+    margin-bottom: 20px;
+}
+.dashboard-grid {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(500px, 1fr));
+    gap: 20px;
+    margin-bottom: 20px;
+}
+.card {
+    background-color: white;
+    border-radius: 5px;
+    box-shadow: 0 2px 5px rgba(0,0,0,0.1);
+    padding: 20px;
+    margin-bottom: 20px;
+}
+.card-header {
+    border-bottom: 1px solid #eee;
+    padding-bottom: 10px;
+    margin-bottom: 15px;
+    font-size: 18px;
+    font-weight: bold;
+    color: #2c3e50;
+}
+.stats-grid {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+    gap: 15px;
+}
+.stat-card {
+    background-color: #f9f9f9;
+    border-radius: 5px;
+    padding: 15px;
+    text-align: center;
+}
+.stat-value {
+    font-size: 24px;
+    font-weight: bold;
+    margin: 10px 0;
+    color: #2980b9;
+}
+.stat-label {
+    font-size: 14px;
+    color: #7f8c8d;
+}
+table {
+    width: 100%;
+    border-collapse: collapse;
+    margin-top: 15px;
+}
+th, td {
+    padding: 12px 15px;
+    text-align: left;
+    border-bottom: 1px solid #eee;
+}
+th {
+    background-color: #f2f2f2;
+    font-weight: bold;
+}
+tr:hover {
+    background-color: #f5f5f5;
+}
+.chart-container {
+    position: relative;
+    height: 300px;
+    margin-top: 15px;
+}
+.tabs {
+    display: flex;
+    border-bottom: 1px solid #ddd;
+    margin-bottom: 15px;
+}
+.tab {
+    padding: 10px 15px;
+    cursor: pointer;
+    background-color: #f2f2f2;
+    border: 1px solid #ddd;
+    border-bottom: none;
+    margin-right: 5px;
+    border-radius: 5px 5px 0 0;
+}
+.tab.active {
+    background-color: white;
+    border-bottom: 1px solid white;
+    margin-bottom: -1px;
+}
+.tab-content {
+    display: none;
+}
+.tab-content.active {
+    display: block;
+}
+.hand-card {
+    background-color: white;
+    border-radius: 5px;
+    box-shadow: 0 2px 5px rgba(0,0,0,0.1);
+    padding: 15px;
+    margin-bottom: 15px;
+}
+.hand-header {
+    display: flex;
+    justify-content: space-between;
+    border-bottom: 1px solid #eee;
+    padding-bottom: 10px;
+    margin-bottom: 10px;
+}
+.hand-title {
+    font-weight: bold;
+    font-size: 16px;
+}
+.hand-result {
+    font-weight: bold;
+}
+.hand-result.win {
+    color: #27ae60;
+}
+.hand-result.loss {
+    color: #e74c3c;
+}
+.hand-details {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
+    gap: 10px;
+    margin-bottom: 10px;
+}
+.hand-detail {
+    font-size: 14px;
+}
+.hand-detail-label {
+    font-weight: bold;
+    color: #7f8c8d;
+    margin-bottom: 5px;
+}
+.hand-actions {
+    margin-top: 10px;
+}
+.action-item {
+    padding: 5px 0;
+    border-bottom: 1px solid #f5f5f5;
+    font-size: 14px;
+}
+.action-player {
+    font-weight: bold;
+    margin-right: 5px;
+}
+.action-type {
+    color: #7f8c8d;
+}
+.action-amount {
+    float: right;
+    color: #e74c3c;
+}
+.card-grid {
+    display: flex;
+    flex-wrap: wrap;
+    gap: 5px;
+    margin-top: 5px;
+}
+.playing-card {
+    width: 40px;
+    height: 60px;
+    background-color: white;
+    border-radius: 5px;
+    border: 1px solid #ddd;
+    display: flex;
+    justify-content: center;
+    align-items: center;
+    font-weight: bold;
+    font-size: 16px;
+    position: relative;
+}
+.playing-card.hearts, .playing-card.diamonds {
+    color: #e74c3c;
+}
+.playing-card.clubs, .playing-card.spades {
+    color: #2c3e50;
+}
+.playing-card::after {
+    position: absolute;
+    bottom: 5px;
+    right: 5px;
+    font-size: 12px;
+}
+.playing-card.hearts::after {
+    content: "♥";
+}
+.playing-card.diamonds::after {
+    content: "♦";
+}
+.playing-card.clubs::after {
+    content: "♣";
+}
+.playing-card.spades::after {
+    content: "♠";
+}
+.pagination {
+    display: flex;
+    justify-content: center;
+    margin-top: 20px;
+}
+.pagination-button {
+    padding: 8px 15px;
+    background-color: #2c3e50;
+    color: white;
+    border: none;
+    border-radius: 5px;
+    cursor: pointer;
+    margin: 0 5px;
+}
+.pagination-button:disabled {
+    background-color: #95a5a6;
+    cursor: not-allowed;
+}
+.search-bar {
+    margin-bottom: 20px;
+}
+.search-input {
+    width: 100%;
+    padding: 10px;
+    border: 1px solid #ddd;
+    border-radius: 5px;
+    font-size: 16px;
+}
+"""
 
-    def _extract_decision_data(self, hands: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Extract decision data for visualization"""
-        by_action = {}
-        by_probability = {
-            '0-20%': {},
-            '20-40%': {},
-            '40-60%': {},
-            '60-80%': {},
-            '80-100%': {}
+_DASHBOARD_JS = """\
+// Stack progression chart
+const stackCtx = document.getElementById('stackChart').getContext('2d');
+const stackChart = new Chart(stackCtx, {
+    type: 'line',
+    data: {
+        labels: handData.hand_id.map(handId => `Hand ${handId}`),
+        datasets: [{
+            label: 'Stack Size',
+            data: handData.hero_stack,
+            borderColor: '#2980b9',
+            backgroundColor: 'rgba(41, 128, 185, 0.1)',
+            borderWidth: 2,
+            fill: true,
+            tension: 0.1
+        }]
+    },
+    options: {
+        responsive: true,
+        maintainAspectRatio: false,
+        scales: {
+            y: {
+                beginAtZero: false
+            }
         }
-
-        for hand in hands:
-            for action in hand.get('actions', []):
-                if action.get('player') == 'Bot':
-                    # Count by action type
-                    action_type = action.get('action', 'unknown')
-                    by_action[action_type] = by_action.get(action_type, 0) + 1
-
-                    # Find the street this action was made on
-                    for street, street_data in hand.get('streets', {}).items():
-                        if action in street_data.get('actions', []):
-                            # Get win probability for this street
-                            win_prob = street_data.get('win_probability', 0)
-
-                            # Determine probability bucket
-                            prob_bucket = '0-20%' if win_prob < 0.2 else \
-                                         '20-40%' if win_prob < 0.4 else \
-                                         '40-60%' if win_prob < 0.6 else \
-                                         '60-80%' if win_prob < 0.8 else \
-                                         '80-100%'
-
-                            # Count by probability and action
-                            if action_type not in by_probability[prob_bucket]:
-                                by_probability[prob_bucket][action_type] = 0
-                            by_probability[prob_bucket][action_type] += 1
-
-                            break
-
-        return {
-            'by_action': by_action,
-            'by_probability': by_probability
+    }
+});
+
+// Win probability chart
+const winProbCtx = document.getElementById('winProbChart').getContext('2d');
+const winProbChart = new Chart(winProbCtx, {
+    type: 'line',
+    data: {
+        labels: handData.hand_id.map(handId => `Hand ${handId}`),
+        datasets: [{
+            label: 'Win Probability',
+            data: handData.win_probability,
+            borderColor: '#27ae60',
+            backgroundColor: 'rgba(39, 174, 96, 0.1)',
+            borderWidth: 2,
+            fill: true,
+            tension: 0.1
+        }]
+    },
+    options: {
+        responsive: true,
+        maintainAspectRatio: false,
+        scales: {
+            y: {
+                beginAtZero: true,
+                max: 1,
+                ticks: {
+                    callback: function(value) {
+                        return (value * 100) + '%';
+                    }
+                }
+            }
+        }
+    }
+});
+
+// Decision analysis chart
+const decisionCtx = document.getElementById('decisionChart').getContext('2d');
+const decisionLabels = Object.keys(decisionData.by_probability);
+const decisionDatasets = [];
+
+const actionTypes = [...new Set(Object.values(decisionData.by_probability).flatMap(Object.keys))];
+const colors = ['#3498db', '#2ecc71', '#e74c3c', '#f39c12', '#9b59b6', '#1abc9c'];
+
+actionTypes.forEach((action, index) => {
+    const data = decisionLabels.map(prob => decisionData.by_probability[prob][action] || 0);
+    decisionDatasets.push({
+        label: action,
+        data: data,
+        backgroundColor: colors[index % colors.length]
+    });
+});
+
+const decisionChart = new Chart(decisionCtx, {
+    type: 'bar',
+    data: {
+        labels: decisionLabels.map(label => label + ' Win Prob'),
+        datasets: decisionDatasets
+    },
+    options: {
+        responsive: true,
+        maintainAspectRatio: false,
+        scales: {
+            x: {
+                stacked: true
+            },
+            y: {
+                stacked: true,
+                beginAtZero: true
+            }
+        }
+    }
+});
+
+// Action distribution chart
+const actionCtx = document.getElementById('actionChart').getContext('2d');
+const actionChart = new Chart(actionCtx, {
+    type: 'pie',
+    data: {
+        labels: Object.keys(decisionData.by_action),
+        datasets: [{
+            data: Object.values(decisionData.by_action),
+            backgroundColor: colors.slice(0, Object.keys(decisionData.by_action).length)
+        }]
+    },
+    options: {
+        responsive: true,
+        maintainAspectRatio: false,
+        plugins: {
+            legend: {
+                position: 'right'
+            }
         }
+    }
+});
+
+// Hand history pagination
+const handsPerPage = 5;
+let currentPage = 1;
+const handCount = handData.hand_id.length;
+const totalPages = Math.ceil(handCount / handsPerPage);
+const allHands = Array.from({ length: handCount }, (_, i) => i);
+
+// Lowercase card text per hand for searching, built once
+const SUIT_LETTERS = { hearts: 'h', diamonds: 'd', clubs: 'c', spades: 's' };
+const cardText = cards => cards.map(card => card.r + (SUIT_LETTERS[card.s] || '')).join(' ').toLowerCase();
+const holeCardText = handData.hole_cards.map(cardText);
+const communityCardText = handData.community_cards.map(cardText);
+
+const handTemplate = document.getElementById('handCardTemplate');
+
+function renderHands(page, filterText = '') {
+    const handContainer = document.getElementById('handContainer');
+
+    // Indices of the hands to show
+    const searchText = filterText.toLowerCase();
+    const filteredHands = filterText
+        ? allHands.filter(h =>
+            holeCardText[h].includes(searchText) ||
+            communityCardText[h].includes(searchText) ||
+            handData.hand_id[h].toString().includes(filterText)
+        )
+        : allHands;
+
+    const startIndex = (page - 1) * handsPerPage;
+    const endIndex = Math.min(startIndex + handsPerPage, filteredHands.length);
+
+    if (filteredHands.length === 0) {
+        handContainer.innerHTML = '<p>No hands match your search criteria.</p>';
+        return;
+    }
+
+    // Fill cloned skeletons off-document, then attach them in one go
+    const fragment = document.createDocumentFragment();
+    for (let i = startIndex; i < endIndex; i++) {
+        const h = filteredHands[i];
+        const handCard = handTemplate.content.cloneNode(true);
+
+        // Stack change to the next hand and win/loss class come precomputed
+        const stackChange = handData.stack_change[h];
+        const resultClass = handData.result_class[h];
+
+        handCard.querySelector('.hand-title').textContent = `Hand #${handData.hand_id[h]}`;
+        const handResult = handCard.querySelector('.hand-result');
+        handResult.textContent = stackChange > 0 ? '+' + stackChange : stackChange;
+        if (resultClass) handResult.classList.add(resultClass);
+        appendCards(handCard.querySelector('.hole-cards'), handData.hole_cards[h]);
+        appendCards(handCard.querySelector('.community-cards'), handData.community_cards[h]);
+        handCard.querySelector('.win-probability').textContent = handData.win_pct[h];
+        handCard.querySelector('.pot-size').textContent = handData.pot_size[h];
+
+        fragment.appendChild(handCard);
+    }
+    handContainer.replaceChildren(fragment);
+
+    // Update pagination
+    document.getElementById('prevPage').disabled = page === 1 || filteredHands.length === 0;
+    document.getElementById('nextPage').disabled = page >= Math.ceil(filteredHands.length / handsPerPage) || filteredHands.length === 0;
+    document.getElementById('pageInfo').textContent = `Page ${page} of ${Math.max(1, Math.ceil(filteredHands.length / handsPerPage))}`;
+}
+
+function appendCards(cardGrid, cards) {
+    // Cards arrive pre-parsed as {r: rank, s: suit class}
+    for (const card of cards) {
+        const cardDiv = document.createElement('div');
+        cardDiv.className = `playing-card ${card.s}`;
+        cardDiv.textContent = card.r;
+        cardGrid.appendChild(cardDiv);
+    }
+}
+
+// Initialize hand display
+renderHands(currentPage);
+
+// Pagination event listeners
+document.getElementById('prevPage').addEventListener('click', () => {
+    if (currentPage > 1) {
+        currentPage--;
+        renderHands(currentPage, document.getElementById('handSearch').value);
+    }
+});
+
+document.getElementById('nextPage').addEventListener('click', () => {
+    if (currentPage < totalPages) {
+        currentPage++;
+        renderHands(currentPage, document.getElementById('handSearch').value);
+    }
+});
+
+// Search functionality
+document.getElementById('handSearch').addEventListener('input', (e) => {
+    currentPage = 1;
+    renderHands(currentPage, e.target.value);
+});
+"""
+
+DASHBOARD_ASSETS = {
+    'dashboard.css': _DASHBOARD_CSS,
+    'dashboard.js': _DASHBOARD_JS
+}
 
 def main():
     """Main function to run the dashboard generator"""
@@ -781,7 +1017,7 @@ def main():
         sessions = generator.list_sessions()
         print(f"Found {len(sessions)} sessions:")
         for i, session in enumerate(sessions):
-            print(f"{i}: {session['session_id']} - {session['hands_played']} hands, P/L: {session['profit_loss']}")
+            print(f"{i}: {session.session_id} - {session.hands_played} hands, P/L: {session.profit_loss}")
         return
 
     # Generate dashboard
@@ -7,36 +7,405 @@ This module extracts key insights from the poker bot's log data.
 import os
 import json
 import glob
-from typing import Dict, List, Any, Optional
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import IO, Dict, List, Any, Optional
 from collections import defaultdict, Counter
+import numpy as np
+from session_cache import SessionCache, cache_path_for, file_stamp, parse_files, session_sort_key
+
+# Try to import optional dependencies
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Name of the summary's session cache, which holds the trimmed sessions
+SESSION_CACHE_NAME = "summary_sessions"
+
+# Layout of the cached sessions; caches written with any other version are ignored
+SESSION_CACHE_VERSION = 2
+
+# The only session fields the analyses read; everything else is dropped on load
+_SESSION_FIELDS = ('session_id', 'hands_played', 'starting_stack', 'ending_stack', 'profit_loss', 'duration')
+
+# Starting hand categories used by get_hand_strength_analysis
+HAND_CATEGORIES = {
+    "premium_pairs": ["AA", "KK", "QQ"],
+    "medium_pairs": ["JJ", "TT", "99"],
+    "small_pairs": ["88", "77", "66", "55", "44", "33", "22"],
+    "big_aces": ["AKs", "AQs", "AJs", "ATs", "AKo", "AQo"],
+    "medium_aces": ["A9s", "A8s", "A7s", "A6s", "A5s", "A4s", "A3s", "A2s", "AJo", "ATo"],
+    "small_aces": ["A9o", "A8o", "A7o", "A6o", "A5o", "A4o", "A3o", "A2o"],
+    "face_cards": ["KQs", "KJs", "KTs", "QJs", "QTs", "JTs", "KQo", "KJo", "KTo", "QJo", "QTo", "JTo"],
+    "connectors": ["98s", "87s", "76s", "65s", "54s", "43s", "32s", "98o", "87o", "76o", "65o", "54o", "43o", "32o"],
+    "other": []
+}
+
+# Position of each category in HAND_CATEGORIES, used to index the per-category tallies
+_CATEGORY_IDS = {category: i for i, category in enumerate(HAND_CATEGORIES)}
+_OTHER_CATEGORY_ID = _CATEGORY_IDS["other"]
+
+# Hand notation (e.g. "AKs") to its category id, for one lookup per hand
+_NOTATION_TO_CATEGORY_ID = {
+    notation: _CATEGORY_IDS[category]
+    for category, notations in HAND_CATEGORIES.items()
+    for notation in notations
+}
+
+# Card rank character to its value for ordering hole cards; digits count at face value
+_RANK_INT = {**{str(value): value for value in range(10)}, 'T': 10, 'J': 11, 'Q': 12, 'K': 13, 'A': 14}
+
+# (high rank, low rank, suited) of the hands in each summary strength tier
+_PREMIUM_HANDS = frozenset(
+    {(rank, rank, suited) for rank in (14, 13, 12) for suited in (False, True)}  # AA, KK, QQ
+    | {(14, 13, True)}  # AKs
+)
+_STRONG_HANDS = frozenset(
+    {(rank, rank, suited) for rank in (11, 10) for suited in (False, True)}  # JJ, TT
+    | {(14, 12, True), (14, 11, True), (14, 13, False)}  # AQs, AJs, AKo
+)
+_MEDIUM_HANDS = frozenset(
+    {(rank, rank, suited) for rank in (9, 8) for suited in (False, True)}  # 99, 88
+    | {(14, 10, True), (13, 12, True), (14, 12, False)}  # ATs, KQs, AQo
+)
+
+# Summary strength tiers, in the order of _STRENGTH_TABLE's indices
+_STRENGTH_TIERS = ('premium', 'strong', 'medium', 'weak')
+
+def _build_strength_table() -> np.ndarray:
+    """Tier index for every (rank, rank, suited) pair of hole cards, in either rank order"""
+    table = np.full((15, 15, 2), _STRENGTH_TIERS.index('weak'), dtype=np.intp)
+    for tier, tier_hands in enumerate((_PREMIUM_HANDS, _STRONG_HANDS, _MEDIUM_HANDS)):
+        for high_rank, low_rank, suited in tier_hands:
+            table[high_rank, low_rank, int(suited)] = tier
+            table[low_rank, high_rank, int(suited)] = tier
+    return table
+
+# Strength tier indexed by [rank1, rank2, suited], for classifying a session's hands in one go
+_STRENGTH_TABLE = _build_strength_table()
+
+# Streets counted for the summary's street reach percentages
+_STREETS = ('PREFLOP', 'FLOP', 'TURN', 'RIVER')
+
+# Win probability buckets for grouping the bot's decisions over [0, 1); bisecting
+# PROBABILITY_EDGES gives the index into PROBABILITY_BUCKETS
+PROBABILITY_EDGES = [0.2, 0.4, 0.6, 0.8]
+PROBABILITY_BUCKETS = ("0-20%", "20-40%", "40-60%", "60-80%", "80-100%")
+
+def _slim_action(action: Any) -> Any:
+    """Copy of an action with only player, action and amount, all always present"""
+    if not isinstance(action, dict):
+        return action
+    return {
+        'player': action.get('player', 'Unknown'),
+        'action': action.get('action', 'unknown'),
+        'amount': action.get('amount'),
+    }
+
+def _slim_actions(actions: Any) -> Any:
+    """Slim every action in a list of actions"""
+    return [_slim_action(action) for action in actions] if isinstance(actions, list) else actions
+
+def _slim_hand(hand: Any) -> Any:
+    """Copy of a hand with only the fields DataSummary reads, missing ones filled with their defaults"""
+    if not isinstance(hand, dict):
+        return hand
+    slim = {
+        'hero_stack': hand.get('hero_stack', 0),
+        'pot_size': hand.get('pot_size', 0),
+        'hole_cards': hand.get('hole_cards', []),
+        'actions': _slim_actions(hand.get('actions', [])),
+        'streets': hand.get('streets', {}),
+    }
+    if isinstance(slim['streets'], dict):
+        slim['streets'] = {
+            street: {
+                'win_probability': data.get('win_probability', 0),
+                'actions': _slim_actions(data.get('actions', [])),
+            } if isinstance(data, dict) else data
+            for street, data in slim['streets'].items()
+        }
+    return slim
+
+def _slim_session(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of a decoded session with only the fields DataSummary reads"""
+    session = {key: data[key] for key in _SESSION_FIELDS if key in data}
+    if 'hands' in data:
+        hands = data['hands']
+        session['hands'] = [_slim_hand(hand) for hand in hands] if isinstance(hands, list) else hands
+    return session
+
+@dataclass
+class _SessionStats:
+    """Counters behind every analysis of one session"""
+    # Session summary
+    win_count: int = 0
+    vpip_count: int = 0
+    pfr_count: int = 0
+    aggressive_actions: int = 0
+    passive_actions: int = 0
+    win_prob_sum: float = 0
+    win_prob_count: int = 0
+    hand_strengths: Dict[str, int] = field(default_factory=lambda: {
+        "premium": 0,  # AA, KK, QQ, AKs
+        "strong": 0,   # JJ, TT, AQs, AJs, AKo
+        "medium": 0,   # 99, 88, ATs, KQs, AQo
+        "weak": 0      # Everything else
+    })
+    street_counts: Dict[str, int] = field(default_factory=lambda: dict.fromkeys(_STREETS, 0))
+    pot_sum: float = 0
+    bet_sum: float = 0
+    bet_count: int = 0
+    # Action distribution
+    action_counts: Counter = field(default_factory=Counter)  # by (street, player, action)
+    # Win probability analysis
+    decisions_by_prob: Dict[str, Dict[str, int]] = field(default_factory=lambda: {
+        range_name: defaultdict(int) for range_name in PROBABILITY_BUCKETS
+    })
+    ev_by_decision: Dict[str, List[float]] = field(default_factory=lambda: defaultdict(list))
+    # Hand strength analysis, indexed by category id
+    category_count: List[int] = field(default_factory=lambda: [0] * len(HAND_CATEGORIES))
+    category_won: List[int] = field(default_factory=lambda: [0] * len(HAND_CATEGORIES))
+    category_lost: List[int] = field(default_factory=lambda: [0] * len(HAND_CATEGORIES))
+    category_ev: List[float] = field(default_factory=lambda: [0] * len(HAND_CATEGORIES))
+    # First hole cards whose category could not be read; only the hand strength analysis reports them
+    malformed_hole_cards: Optional[List[str]] = None
 
 class DataSummary:
     """
     Extracts and summarizes data from GeckoBot log files
     """
-    def __init__(self, log_dir: str = "logs"):
+    def __init__(self, log_dir: str = "logs", use_cache: bool = True):
         self.log_dir = log_dir
+        self.use_cache = use_cache
         self.sessions = self._load_sessions()
+        # Analysis counters by session index, with the session they were gathered from
+        self._session_stats: Dict[int, tuple] = {}
         
     def _load_sessions(self) -> List[Dict[str, Any]]:
-        """Load all available session data"""
+        """Load all available session data, reusing the on-disk cache for unchanged files"""
         sessions = []
         data_files = glob.glob(os.path.join(self.log_dir, "*_data.json"))
+        cache = SessionCache(cache_path_for(self.log_dir, SESSION_CACHE_NAME), SESSION_CACHE_VERSION) if self.use_cache else None
         
+        # [file_path, stamp, data] for each file, with data None until it is parsed
+        entries = []
         for file_path in data_files:
             try:
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
-                    # Add file path to the data
-                    data['file_path'] = file_path
-                    sessions.append(data)
-            except Exception as e:
+                stamp = file_stamp(os.stat(file_path))
+            except OSError as e:
                 print(f"Error loading {file_path}: {e}")
+                continue
+            entries.append([file_path, stamp, cache.get(file_path, stamp) if cache is not None else None])
+        
+        to_parse = [entry for entry in entries if entry[2] is None]
+        paths = [entry[0] for entry in to_parse]
+        parsed = parse_files(paths, self._parse_session_file)
+        for entry, data in zip(to_parse, parsed):
+            entry[2] = data
+            if data is not None and cache is not None:
+                cache.put(entry[0], entry[1], data)
+        
+        for file_path, stamp, data in entries:
+            if data is not None:
+                sessions.append(data)
+        
+        # Save newly parsed files, dropping entries for logs that no longer exist
+        if cache is not None:
+            cache.save({file_path for file_path, _, data in entries if data is not None})
                 
         # Sort by timestamp (most recent first)
-        sessions.sort(key=lambda x: x.get('session_id', ''), reverse=True)
+        sessions.sort(key=lambda x: session_sort_key(x['file_path']), reverse=True)
         return sessions
     
+    def _parse_session_file(self, file_path: str) -> Optional[Dict[str, Any]]:
+        """Load one session file, or None if it cannot be loaded"""
+        try:
+            return self._load_session_streaming(file_path)
+        except Exception as e:
+            print(f"Error loading {file_path}: {e}")
+            return None
+    
+    def _load_session_streaming(self, file_path: str) -> Dict[str, Any]:
+        """Parse a session file, keeping only the fields the analyses read"""
+        with open(file_path, 'rb') as f:
+            if ijson is None:
+                data = json.load(f)
+                if not isinstance(data, dict):
+                    raise ValueError("session data is not a JSON object")
+                session = _slim_session(data)
+            else:
+                session = self._parse_session_events(ijson.parse(f, use_float=True))
+        session['file_path'] = file_path
+        return session
+    
+    def _parse_session_events(self, events) -> Dict[str, Any]:
+        """Build a trimmed session from ijson events, one hand at a time"""
+        session = {}
+        builder = None
+        depth = 0
+        for prefix, event, value in events:
+            if builder is None:
+                if not prefix and event not in ('start_map', 'map_key', 'end_map'):
+                    raise ValueError("session data is not a JSON object")
+                if event in ('map_key', 'end_map', 'end_array'):
+                    continue
+                if prefix == 'hands' and event == 'start_array':
+                    session['hands'] = []
+                    continue
+                if prefix not in _SESSION_FIELDS and prefix not in ('hands', 'hands.item'):
+                    continue
+                target = prefix
+                builder = ijson.ObjectBuilder()
+            
+            builder.event(event, value)
+            if event in ('start_map', 'start_array'):
+                depth += 1
+            elif event in ('end_map', 'end_array'):
+                depth -= 1
+            if depth:
+                continue
+            
+            # The value at target is complete
+            if target == 'hands.item':
+                session['hands'].append(_slim_hand(builder.value))
+            else:
+                session[target] = builder.value
+            builder = None
+        return session
+    
+    def _collect_all(self, session_index: int) -> _SessionStats:
+        """Gather the counters for every analysis in one pass over the session's hands"""
+        session = self.sessions[session_index]
+        cached = self._session_stats.get(session_index)
+        if cached is not None and cached[0] is session:
+            return cached[1]
+        
+        stats = _SessionStats()
+        hands = session.get('hands', [])
+        strength_cards = []
+        
+        # Hands, streets and actions are filled out with their defaults on load (see _slim_hand),
+        # so the fields below are read directly
+        
+        # Stack change from each hand to the next, credited to the bot's decisions in it
+        hero_stacks = [hand['hero_stack'] for hand in hands]
+        stack_changes = [after - before for before, after in zip(hero_stacks, hero_stacks[1:])]
+        
+        # Win rate: the stack grew from one hand to the next
+        stats.win_count = sum(change > 0 for change in stack_changes)
+        
+        for i, hand in enumerate(hands):
+            stats.pot_sum += hand['pot_size']
+            stack_change = stack_changes[i] if i < len(stack_changes) else None
+            
+            # VPIP, aggression, bet sizing and EV from the bot's actions in the hand
+            voluntarily_played = False
+            for action in hand['actions']:
+                if action['player'] != 'Bot':
+                    continue
+                action_type = action['action']
+                if stack_change is not None:
+                    stats.ev_by_decision[action_type].append(stack_change)
+                if action_type in ('raises', 'bets'):
+                    voluntarily_played = True
+                    stats.aggressive_actions += 1
+                    amount = action['amount']
+                    if amount is not None:
+                        stats.bet_sum += amount
+                        stats.bet_count += 1
+                elif action_type == 'calls':
+                    voluntarily_played = True
+                    stats.passive_actions += 1
+                elif action_type == 'checks':
+                    stats.passive_actions += 1
+            if voluntarily_played:
+                stats.vpip_count += 1
+            
+            # Street reach, PFR, action counts and decisions by win probability
+            for street, street_data in hand['streets'].items():
+                if street in stats.street_counts:
+                    stats.street_counts[street] += 1
+                win_prob = street_data['win_probability']
+                prob_decisions = None
+                if 0 <= win_prob < 1.0:
+                    prob_decisions = stats.decisions_by_prob[PROBABILITY_BUCKETS[bisect_right(PROBABILITY_EDGES, win_prob)]]
+                # PFR counts once per hand, so stop looking after the first preflop raise
+                check_pfr = street == 'PREFLOP'
+                for action in street_data['actions']:
+                    player = action['player']
+                    action_type = action['action']
+                    stats.action_counts[(street, player, action_type)] += 1
+                    if player == 'Bot':
+                        stats.win_prob_sum += win_prob
+                        stats.win_prob_count += 1
+                        if check_pfr and action_type == 'raises':
+                            stats.pfr_count += 1
+                            check_pfr = False
+                        if prob_decisions is not None:
+                            prob_decisions[action_type] += 1
+            
+            hole_cards = hand['hole_cards']
+            if len(hole_cards) != 2:
+                continue
+            
+            # Outcome by starting hand category
+            if stack_change is not None:
+                category_id = self._hand_category_id(hole_cards)
+                if category_id is None:
+                    if stats.malformed_hole_cards is None:
+                        stats.malformed_hole_cards = hole_cards
+                else:
+                    stats.category_count[category_id] += 1
+                    if category_id != _OTHER_CATEGORY_ID:
+                        if stack_change > 0:
+                            stats.category_won[category_id] += 1
+                        elif stack_change < 0:
+                            stats.category_lost[category_id] += 1
+                        stats.category_ev[category_id] += stack_change
+            
+            # Hand strength distribution, classified for all hands at once below
+            rank1 = _RANK_INT.get(hole_cards[0][0])
+            rank2 = _RANK_INT.get(hole_cards[1][0])
+            if rank1 is not None and rank2 is not None:
+                strength_cards.append((rank1, rank2, hole_cards[0][-1] == hole_cards[1][-1]))
+        
+        if strength_cards:
+            cards = np.array(strength_cards, dtype=np.int8)
+            tiers = _STRENGTH_TABLE[cards[:, 0], cards[:, 1], cards[:, 2]]
+            for strength, count in zip(_STRENGTH_TIERS, np.bincount(tiers, minlength=len(_STRENGTH_TIERS))):
+                stats.hand_strengths[strength] = int(count)
+        
+        self._session_stats[session_index] = (session, stats)
+        return stats
+    
+    def _hand_category_id(self, hole_cards: List[str]) -> Optional[int]:
+        """Starting hand category id of two hole cards, "other" if it is in none of the categories, None if a card is malformed"""
+        # Normalize card representation
+        card1, card2 = hole_cards
+        if len(card1) < 2 or len(card2) < 2:
+            return None
+        rank1, suit1 = card1[0], card1[1]
+        rank2, suit2 = card2[0], card2[1]
+        value1 = _RANK_INT.get(rank1)
+        value2 = _RANK_INT.get(rank2)
+        if value1 is None or value2 is None:
+            return None
+        
+        # Ensure rank1 >= rank2
+        if value1 < value2:
+            rank1, rank2 = rank2, rank1
+            suit1, suit2 = suit2, suit1
+        
+        # Create hand notation
+        if rank1 == rank2:
+            hand_notation = rank1 + rank2
+        else:
+            hand_notation = rank1 + rank2 + ('s' if suit1 == suit2 else 'o')
+        
+        return _NOTATION_TO_CATEGORY_ID.get(hand_notation, _OTHER_CATEGORY_ID)
+    
     def get_session_summary(self, session_index: int = 0) -> Dict[str, Any]:
         """Get a summary of the specified session"""
         if not self.sessions:
@@ -65,132 +434,22 @@ class DataSummary:
             "duration": session.get('duration', 0),
         }
         
-        # Calculate win rate
-        win_count = 0
-        for i in range(len(hands) - 1):
-            current_stack = hands[i].get('hero_stack', 0)
-            next_stack = hands[i + 1].get('hero_stack', 0)
-            if next_stack > current_stack:
-                win_count += 1
-                
-        summary["win_rate"] = win_count / (len(hands) - 1) if len(hands) > 1 else 0
-        
-        # Calculate VPIP (Voluntarily Put Money In Pot)
-        vpip_count = 0
-        for hand in hands:
-            for action in hand.get('actions', []):
-                if action.get('player') == 'Bot' and action.get('action') in ['calls', 'raises', 'bets']:
-                    vpip_count += 1
-                    break
-                    
-        summary["vpip"] = vpip_count / len(hands) if hands else 0
-        
-        # Calculate PFR (Pre-Flop Raise)
-        pfr_count = 0
-        for hand in hands:
-            preflop_data = hand.get('streets', {}).get('PREFLOP', {})
-            for action in preflop_data.get('actions', []):
-                if action.get('player') == 'Bot' and action.get('action') == 'raises':
-                    pfr_count += 1
-                    break
-                    
-        summary["pfr"] = pfr_count / len(hands) if hands else 0
-        
-        # Calculate AF (Aggression Factor)
-        aggressive_actions = 0
-        passive_actions = 0
-        
-        for hand in hands:
-            for action in hand.get('actions', []):
-                if action.get('player') == 'Bot':
-                    if action.get('action') in ['raises', 'bets']:
-                        aggressive_actions += 1
-                    elif action.get('action') in ['calls', 'checks']:
-                        passive_actions += 1
-                        
-        summary["aggression_factor"] = aggressive_actions / passive_actions if passive_actions > 0 else float('inf')
-        
-        # Calculate average win probability when making decisions
-        win_probs = []
-        for hand in hands:
-            for street, street_data in hand.get('streets', {}).items():
-                win_prob = street_data.get('win_probability', 0)
-                for action in street_data.get('actions', []):
-                    if action.get('player') == 'Bot':
-                        win_probs.append(win_prob)
-                        
-        summary["avg_win_probability"] = sum(win_probs) / len(win_probs) if win_probs else 0
-        
-        # Calculate hand strength distribution
-        hand_strengths = {
-            "premium": 0,  # AA, KK, QQ, AKs
-            "strong": 0,   # JJ, TT, AQs, AJs, AKo
-            "medium": 0,   # 99, 88, ATs, KQs, AQo
-            "weak": 0      # Everything else
-        }
+        stats = self._collect_all(session_index)
+        num_hands = len(hands)
+        summary["win_rate"] = stats.win_count / (num_hands - 1) if num_hands > 1 else 0
+        summary["vpip"] = stats.vpip_count / num_hands
+        summary["pfr"] = stats.pfr_count / num_hands
+        summary["aggression_factor"] = stats.aggressive_actions / stats.passive_actions if stats.passive_actions > 0 else float('inf')
+        summary["avg_win_probability"] = stats.win_prob_sum / stats.win_prob_count if stats.win_prob_count else 0
         
-        for hand in hands:
-            hole_cards = hand.get('hole_cards', [])
-            if len(hole_cards) != 2:
-                continue
-                
-            # Extract ranks and suited status
-            ranks = [card[0] for card in hole_cards]
-            suited = hole_cards[0][-1] == hole_cards[1][-1]
-            
-            # Normalize ranks
-            ranks = [rank.replace('T', '10').replace('J', '11').replace('Q', '12').replace('K', '13').replace('A', '14') for rank in ranks]
-            try:
-                ranks = [int(rank) for rank in ranks]
-                ranks.sort(reverse=True)
-            except ValueError:
-                continue
-                
-            # Categorize hand
-            if (ranks == [14, 14] or  # AA
-                ranks == [13, 13] or  # KK
-                ranks == [12, 12] or  # QQ
-                (ranks == [14, 13] and suited)):  # AKs
-                hand_strengths["premium"] += 1
-            elif (ranks == [11, 11] or  # JJ
-                  ranks == [10, 10] or  # TT
-                  (ranks == [14, 12] and suited) or  # AQs
-                  (ranks == [14, 11] and suited) or  # AJs
-                  (ranks == [14, 13] and not suited)):  # AKo
-                hand_strengths["strong"] += 1
-            elif (ranks == [9, 9] or  # 99
-                  ranks == [8, 8] or  # 88
-                  (ranks == [14, 10] and suited) or  # ATs
-                  (ranks == [13, 12] and suited) or  # KQs
-                  (ranks == [14, 12] and not suited)):  # AQo
-                hand_strengths["medium"] += 1
-            else:
-                hand_strengths["weak"] += 1
-                
-        for strength, count in hand_strengths.items():
-            summary[f"hand_strength_{strength}"] = count / len(hands) if hands else 0
-        
-        # Calculate street reach percentages
-        street_counts = Counter()
-        for hand in hands:
-            for street in hand.get('streets', {}).keys():
-                street_counts[street] += 1
-                
-        for street in ['PREFLOP', 'FLOP', 'TURN', 'RIVER']:
-            summary[f"reached_{street.lower()}"] = street_counts[street] / len(hands) if hands else 0
-            
-        # Calculate average pot size
-        pot_sizes = [hand.get('pot_size', 0) for hand in hands]
-        summary["avg_pot_size"] = sum(pot_sizes) / len(pot_sizes) if pot_sizes else 0
-        
-        # Calculate average bet sizing
-        bet_sizes = []
-        for hand in hands:
-            for action in hand.get('actions', []):
-                if action.get('player') == 'Bot' and action.get('action') in ['raises', 'bets'] and action.get('amount') is not None:
-                    bet_sizes.append(action.get('amount'))
-                    
-        summary["avg_bet_size"] = sum(bet_sizes) / len(bet_sizes) if bet_sizes else 0
+        for strength, count in stats.hand_strengths.items():
+            summary[f"hand_strength_{strength}"] = count / num_hands
+        
+        for street in _STREETS:
+            summary[f"reached_{street.lower()}"] = stats.street_counts[street] / num_hands
+        
+        summary["avg_pot_size"] = stats.pot_sum / num_hands
+        summary["avg_bet_size"] = stats.bet_sum / stats.bet_count if stats.bet_count else 0
         
         return summary
     
@@ -211,18 +470,15 @@ class DataSummary:
                 "error": "No hand data available"
             }
         
-        # Count actions by type and street
-        action_counts = defaultdict(Counter)
-        street_action_counts = defaultdict(lambda: defaultdict(Counter))
+        stats = self._collect_all(session_index)
         
-        for hand in hands:
-            for street, street_data in hand.get('streets', {}).items():
-                for action in street_data.get('actions', []):
-                    player = action.get('player', 'Unknown')
-                    action_type = action.get('action', 'unknown')
-                    
-                    action_counts[player][action_type] += 1
-                    street_action_counts[street][player][action_type] += 1
+        # Group the (street, player, action) counts by player and by street
+        action_counts = {}
+        street_action_counts = {}
+        for (street, player, action), count in stats.action_counts.items():
+            counts = action_counts.setdefault(player, {})
+            counts[action] = counts.get(action, 0) + count
+            street_action_counts.setdefault(street, {}).setdefault(player, {})[action] = count
         
         # Calculate percentages
         result = {
@@ -266,56 +522,17 @@ class DataSummary:
                 "error": "No hand data available"
             }
         
-        # Analyze decisions based on win probability
-        prob_ranges = {
-            "0-20%": (0, 0.2),
-            "20-40%": (0.2, 0.4),
-            "40-60%": (0.4, 0.6),
-            "60-80%": (0.6, 0.8),
-            "80-100%": (0.8, 1.0)
-        }
-        
-        decisions_by_prob = {range_name: defaultdict(int) for range_name in prob_ranges}
-        
-        for hand in hands:
-            for street, street_data in hand.get('streets', {}).items():
-                win_prob = street_data.get('win_probability', 0)
-                
-                # Find the probability range
-                for range_name, (min_prob, max_prob) in prob_ranges.items():
-                    if min_prob <= win_prob < max_prob:
-                        # Count bot actions in this probability range
-                        for action in street_data.get('actions', []):
-                            if action.get('player') == 'Bot':
-                                action_type = action.get('action', 'unknown')
-                                decisions_by_prob[range_name][action_type] += 1
-                        break
-        
-        # Calculate expected value by decision
-        ev_by_decision = defaultdict(list)
-        
-        for i in range(len(hands) - 1):
-            current_hand = hands[i]
-            next_hand = hands[i + 1]
-            
-            # Calculate stack change
-            stack_change = next_hand.get('hero_stack', 0) - current_hand.get('hero_stack', 0)
-            
-            # Find bot's decisions in this hand
-            for action in current_hand.get('actions', []):
-                if action.get('player') == 'Bot':
-                    action_type = action.get('action', 'unknown')
-                    ev_by_decision[action_type].append(stack_change)
+        stats = self._collect_all(session_index)
         
         # Calculate average EV by decision
         avg_ev = {}
-        for decision, values in ev_by_decision.items():
+        for decision, values in stats.ev_by_decision.items():
             avg_ev[decision] = sum(values) / len(values) if values else 0
         
         return {
             "session_id": session.get('session_id', 'Unknown'),
             "decisions_by_probability": {
-                range_name: dict(counts) for range_name, counts in decisions_by_prob.items()
+                range_name: dict(counts) for range_name, counts in stats.decisions_by_prob.items()
             },
             "expected_value_by_decision": avg_ev
         }
@@ -337,78 +554,17 @@ class DataSummary:
                 "error": "No hand data available"
             }
         
-        # Define hand categories
-        hand_categories = {
-            "premium_pairs": ["AA", "KK", "QQ"],
-            "medium_pairs": ["JJ", "TT", "99"],
-            "small_pairs": ["88", "77", "66", "55", "44", "33", "22"],
-            "big_aces": ["AKs", "AQs", "AJs", "ATs", "AKo", "AQo"],
-            "medium_aces": ["A9s", "A8s", "A7s", "A6s", "A5s", "A4s", "A3s", "A2s", "AJo", "ATo"],
-            "small_aces": ["A9o", "A8o", "A7o", "A6o", "A5o", "A4o", "A3o", "A2o"],
-            "face_cards": ["KQs", "KJs", "KTs", "QJs", "QTs", "JTs", "KQo", "KJo", "KTo", "QJo", "QTo", "JTo"],
-            "connectors": ["98s", "87s", "76s", "65s", "54s", "43s", "32s", "98o", "87o", "76o", "65o", "54o", "43o", "32o"],
-            "other": []
-        }
-        
-        # Analyze hand outcomes by category
-        results_by_category = {category: {"count": 0, "won": 0, "lost": 0, "ev": 0} for category in hand_categories}
-        
-        for i in range(len(hands) - 1):
-            current_hand = hands[i]
-            next_hand = hands[i + 1]
-            
-            hole_cards = current_hand.get('hole_cards', [])
-            if len(hole_cards) != 2:
-                continue
-                
-            # Normalize card representation
-            card1, card2 = hole_cards
-            rank1, suit1 = card1[0], card1[1]
-            rank2, suit2 = card2[0], card2[1]
-            
-            # Convert T, J, Q, K, A to 10, 11, 12, 13, 14
-            rank_map = {'T': '10', 'J': '11', 'Q': '12', 'K': '13', 'A': '14'}
-            rank1 = rank_map.get(rank1, rank1)
-            rank2 = rank_map.get(rank2, rank2)
-            
-            # Ensure rank1 >= rank2
-            if int(rank1) < int(rank2):
-                rank1, rank2 = rank2, rank1
-                suit1, suit2 = suit2, suit1
-                
-            # Convert back to T, J, Q, K, A for hand notation
-            reverse_rank_map = {'10': 'T', '11': 'J', '12': 'Q', '13': 'K', '14': 'A'}
-            rank1 = reverse_rank_map.get(rank1, rank1)
-            rank2 = reverse_rank_map.get(rank2, rank2)
-            
-            # Create hand notation
-            suited = suit1 == suit2
-            hand_notation = rank1 + rank2 + ('s' if suited else 'o')
-            if rank1 == rank2:
-                hand_notation = rank1 + rank2
-                
-            # Find category
-            category_found = False
-            for category, hands_in_category in hand_categories.items():
-                if hand_notation in hands_in_category:
-                    category_found = True
-                    
-                    # Calculate result
-                    stack_change = next_hand.get('hero_stack', 0) - current_hand.get('hero_stack', 0)
-                    
-                    results_by_category[category]["count"] += 1
-                    if stack_change > 0:
-                        results_by_category[category]["won"] += 1
-                    elif stack_change < 0:
-                        results_by_category[category]["lost"] += 1
-                        
-                    results_by_category[category]["ev"] += stack_change
-                    break
-                    
-            if not category_found:
-                results_by_category["other"]["count"] += 1
+        stats = self._collect_all(session_index)
+        if stats.malformed_hole_cards is not None:
+            raise ValueError(f"Malformed hole cards: {stats.malformed_hole_cards}")
         
         # Calculate win rates and average EV
+        results_by_category = {
+            category: {"count": count, "won": won, "lost": lost, "ev": ev}
+            for category, count, won, lost, ev in zip(
+                HAND_CATEGORIES, stats.category_count, stats.category_won, stats.category_lost, stats.category_ev
+            )
+        }
         for category, results in results_by_category.items():
             if results["count"] > 0:
                 results["win_rate"] = results["won"] / results["count"]
@@ -422,18 +578,23 @@ class DataSummary:
             "results_by_category": results_by_category
         }
     
-    def generate_text_report(self, session_index: int = 0) -> str:
-        """Generate a text report with key insights"""
+
+    def generate_text_report(self, session_index: int = 0, out: Optional[IO[str]] = None) -> Optional[str]:
+        """Generate a text report with key insights, written to out if given and returned otherwise"""
         summary = self.get_session_summary(session_index)
         action_dist = self.get_action_distribution(session_index)
         win_prob = self.get_win_probability_analysis(session_index)
         hand_strength = self.get_hand_strength_analysis(session_index)
         
         if "error" in summary:
-            return f"Error: {summary['error']}"
+            error = f"Error: {summary['error']}"
+            if out is not None:
+                out.write(error)
+                return None
+            return error
             
         # Format the report
-        report = f"""
+        parts = [f"""
 === GeckoBot Poker Analysis Report ===
 Session: {summary['session_id']}
 
@@ -464,42 +625,47 @@ Average Pot Size: {summary['avg_pot_size']:.2f}
 Average Bet Size: {summary['avg_bet_size']:.2f}
 
 == Bot Action Distribution ==
-"""
+"""]
         
         # Add bot action distribution
         if "by_player" in action_dist and "Bot" in action_dist["by_player"]:
             bot_actions = action_dist["by_player"]["Bot"]["actions"]
             for action, percentage in bot_actions.items():
-                report += f"{action}: {percentage:.2%}\n"
+                parts.append(f"{action}: {percentage:.2%}\n")
                 
-        report += "\n== Decision Making by Win Probability ==\n"
+        parts.append("\n== Decision Making by Win Probability ==\n")
         
         # Add decision making by win probability
         if "decisions_by_probability" in win_prob:
             for prob_range, decisions in win_prob["decisions_by_probability"].items():
-                report += f"{prob_range}:\n"
+                parts.append(f"{prob_range}:\n")
                 for decision, count in decisions.items():
-                    report += f"  {decision}: {count}\n"
+                    parts.append(f"  {decision}: {count}\n")
                     
-        report += "\n== Expected Value by Decision ==\n"
+        parts.append("\n== Expected Value by Decision ==\n")
         
         # Add expected value by decision
         if "expected_value_by_decision" in win_prob:
             for decision, ev in win_prob["expected_value_by_decision"].items():
-                report += f"{decision}: {ev:.2f}\n"
+                parts.append(f"{decision}: {ev:.2f}\n")
                 
-        report += "\n== Hand Category Performance ==\n"
+        parts.append("\n== Hand Category Performance ==\n")
         
         # Add hand category performance
         if "results_by_category" in hand_strength:
             for category, results in hand_strength["results_by_category"].items():
                 if results["count"] > 0:
-                    report += f"{category}:\n"
-                    report += f"  Count: {results['count']}\n"
-                    report += f"  Win Rate: {results['win_rate']:.2%}\n"
-                    report += f"  Average EV: {results['avg_ev']:.2f}\n"
-        
-        return report
+                    parts.append(
+                        f"{category}:\n"
+                        f"  Count: {results['count']}\n"
+                        f"  Win Rate: {results['win_rate']:.2%}\n"
+                        f"  Average EV: {results['avg_ev']:.2f}\n"
+                    )
+        
+        if out is not None:
+            out.writelines(parts)
+            return None
+        return ''.join(parts)
 
 def main():
     """Main function to run the data summary tool"""
@@ -524,16 +690,13 @@ def main():
             print(f"{i}: {session.get('session_id', 'Unknown')} - {session.get('hands_played', 0)} hands, P/L: {session.get('profit_loss', 0)}")
         return
     
-    # Generate report
-    report = summary.generate_text_report(args.session)
-    
-    # Output report
+    # Generate and output report
     if args.output:
         with open(args.output, 'w') as f:
-            f.write(report)
+            summary.generate_text_report(args.session, out=f)
         print(f"Report saved to {args.output}")
     else:
-        print(report)
+        print(summary.generate_text_report(args.session))
 
 if __name__ == "__main__":
     main()
@@ -7,11 +7,29 @@ from visualization.match_visualizer import MatchVisualizer, HandData
 from logger import get_logger, DebugLevel
 from decision_explainer import DecisionExplainer
 from verbosity_symbols import VerbositySymbols
-import random
 import time
+import numpy as np
+
+# Unshuffled deck, copied for each new hand
+_DECK_TEMPLATE = tuple(r + s for r in '23456789TJQKA' for s in 'hdcs')
+
+# Streets in order, so per-hand street dicts skip iterating the enum class
+_STREETS = tuple(Street)
+
+# Enum members bound once at import; the per-hand paths read these instead of
+# looking each member up on its enum class
+_PREFLOP, _FLOP, _TURN, _RIVER = Street.PREFLOP, Street.FLOP, Street.TURN, Street.RIVER
+_FOLD, _CHECK, _CALL, _RAISE, _ALL_IN = Action.FOLD, Action.CHECK, Action.CALL, Action.RAISE, Action.ALL_IN
+_DEBUG = DebugLevel.DEBUG
 
 class GameRunner:
-    def __init__(self, debug_level: DebugLevel = DebugLevel.INFO):
+    # Blind seats indexed by button seat at the 3-handed table
+    _SB_SEAT = (1, 2, 0)
+    _BB_SEAT = (2, 0, 1)
+
+    def __init__(self, debug_level: DebugLevel = DebugLevel.INFO, seed: Optional[int] = None):
+        # Per-runner generator so a seeded runner replays the same deals and opponent actions
+        self._rng = np.random.default_rng(seed)
         self.table_state = TableState()
         self.bot = GeckoBot(self.table_state)
         self.deck = self._create_deck()
@@ -21,6 +39,7 @@ class GameRunner:
         self.visualizer = MatchVisualizer()
         self.current_hand_data = None
         self.hand_counter = 0
+        self._last_prwin = None  # Win probability on the latest street dealt
 
         # Initialize logger
         self.logger = get_logger(debug_level=debug_level)
@@ -36,10 +55,8 @@ class GameRunner:
 
     def _create_deck(self) -> List[str]:
         """Create a standard 52-card deck"""
-        ranks = '23456789TJQKA'
-        suits = 'hdcs'
-        deck = [r + s for r in ranks for s in suits]
-        random.shuffle(deck)
+        deck = list(_DECK_TEMPLATE)
+        self._rng.shuffle(deck)
         return deck
 
     def setup_game(self):
@@ -73,7 +90,7 @@ class GameRunner:
         self.table_state.min_raise = self.big_blind
         self.table_state.last_aggressor = None
         self.table_state.community_cards = []
-        self.table_state.current_street = Street.PREFLOP
+        self.table_state.current_street = _PREFLOP
 
         # Reset betting action symbols
         self.table_state.new_hand()
@@ -94,9 +111,9 @@ class GameRunner:
             initial_stack=initial_stack,
             final_stack=initial_stack,  # Will be updated at end
             win_probability={},
-            actions={street: [] for street in Street},
-            community_cards={street: [] for street in Street},
-            pot_sizes={street: 0.0 for street in Street},
+            actions={street: [] for street in _STREETS},
+            community_cards={street: [] for street in _STREETS},
+            pot_sizes={street: 0.0 for street in _STREETS},
             final_pot=0.0,
             result=0.0
         )
@@ -105,13 +122,13 @@ class GameRunner:
         self._post_blinds()
 
         # Run betting rounds
-        if self._run_betting_round(Street.PREFLOP):
+        if self._run_betting_round(_PREFLOP):
             self._deal_flop()
-            if self._run_betting_round(Street.FLOP):
+            if self._run_betting_round(_FLOP):
                 self._deal_turn()
-                if self._run_betting_round(Street.TURN):
+                if self._run_betting_round(_TURN):
                     self._deal_river()
-                    self._run_betting_round(Street.RIVER)
+                    self._run_betting_round(_RIVER)
 
         self._show_results()
 
@@ -126,14 +143,9 @@ class GameRunner:
         self.logger.end_hand(self.table_state.pot_size, final_stack, result)
 
         # Log decision explanation if in debug mode
-        if self.logger.debug_level >= DebugLevel.DEBUG:
-            # Calculate win probability for the final board state
-            win_probability = self.hand_evaluator.calculate_prwin(
-                self.table_state.hero_cards,
-                self.table_state.community_cards,
-                num_opponents=2,
-                num_simulations=1000
-            )
+        if self.logger.debug_level >= _DEBUG:
+            # Reuse the win probability already simulated for the final board state
+            win_probability = self._last_prwin
 
             hand_data = {
                 'street': self.table_state.current_street,
@@ -145,7 +157,7 @@ class GameRunner:
                 'result': result
             }
             explanation = self.decision_explainer.explain_hand_decision(hand_data)
-            self.logger.debug(f"Hand explanation:\n{explanation}", DebugLevel.DEBUG)
+            self.logger.debug(f"Hand explanation:\n{explanation}", _DEBUG)
 
         # Add hand to visualizer
         self.visualizer.add_hand(self.current_hand_data)
@@ -170,20 +182,21 @@ class GameRunner:
         )
 
         # Log win probability
-        self.logger.log_win_probability(Street.PREFLOP.name, prwin)
+        self.logger.log_win_probability(_PREFLOP.name, prwin)
+        self._last_prwin = prwin
 
         # Update hand data
-        self.current_hand_data.win_probability[Street.PREFLOP] = prwin
+        self.current_hand_data.win_probability[_PREFLOP] = prwin
 
     def _post_blinds(self):
         """Post small and big blinds"""
         # Small blind
-        sb_seat = (self.table_state.button_seat + 1) % 3
+        sb_seat = self._SB_SEAT[self.table_state.button_seat]
         self.table_state.players[sb_seat].stack -= self.small_blind
         self.table_state.pot_size += self.small_blind
 
         # Big blind
-        bb_seat = (self.table_state.button_seat + 2) % 3
+        bb_seat = self._BB_SEAT[self.table_state.button_seat]
         self.table_state.players[bb_seat].stack -= self.big_blind
         self.table_state.pot_size += self.big_blind
         self.table_state.current_bet = self.big_blind
@@ -192,7 +205,7 @@ class GameRunner:
         self.logger.log_blinds(self.small_blind, self.big_blind)
 
         # Update hand data
-        self.current_hand_data.pot_sizes[Street.PREFLOP] = self.table_state.pot_size
+        self.current_hand_data.pot_sizes[_PREFLOP] = self.table_state.pot_size
 
         # Log pot update
         self.logger.log_pot_update(self.table_state.pot_size)
@@ -211,10 +224,10 @@ class GameRunner:
         self.table_state.community_cards = flop_cards
 
         # Update table state to new street
-        self.table_state.new_street(Street.FLOP)
+        self.table_state.new_street(_FLOP)
 
         # Log community cards
-        self.logger.log_community_cards(Street.FLOP.name, flop_cards)
+        self.logger.log_community_cards(_FLOP.name, flop_cards)
 
         # Add Monte Carlo evaluation
         prwin = self.hand_evaluator.calculate_prwin(
@@ -225,20 +238,21 @@ class GameRunner:
         )
 
         # Log win probability
-        self.logger.log_win_probability(Street.FLOP.name, prwin)
+        self.logger.log_win_probability(_FLOP.name, prwin)
+        self._last_prwin = prwin
 
         # Calculate and log outs information
         outs_count = self.table_state.outs_calculator.calculate_total_outs()
         outs_description = self.table_state.outs_calculator.get_outs_description()
         equity_from_outs = self.table_state.outs_calculator.calculate_equity_from_outs()
-        self.logger.log_outs_information(Street.FLOP.name, outs_count, outs_description, equity_from_outs)
+        self.logger.log_outs_information(_FLOP.name, outs_count, outs_description, equity_from_outs)
 
         # Update hand data
-        self.current_hand_data.community_cards[Street.FLOP] = flop_cards.copy()
-        self.current_hand_data.win_probability[Street.FLOP] = prwin
-        self.current_hand_data.pot_sizes[Street.FLOP] = self.table_state.pot_size
-        self.current_hand_data.outs_count = {Street.FLOP: outs_count}
-        self.current_hand_data.equity_from_outs = {Street.FLOP: equity_from_outs}
+        self.current_hand_data.community_cards[_FLOP] = flop_cards.copy()
+        self.current_hand_data.win_probability[_FLOP] = prwin
+        self.current_hand_data.pot_sizes[_FLOP] = self.table_state.pot_size
+        self.current_hand_data.outs_count[_FLOP] = outs_count
+        self.current_hand_data.equity_from_outs[_FLOP] = equity_from_outs
 
     def _deal_turn(self):
         """Deal and display the turn"""
@@ -250,10 +264,10 @@ class GameRunner:
         self.table_state.community_cards.append(turn_card)
 
         # Update table state to new street
-        self.table_state.new_street(Street.TURN)
+        self.table_state.new_street(_TURN)
 
         # Log community cards
-        self.logger.log_community_cards(Street.TURN.name, self.table_state.community_cards)
+        self.logger.log_community_cards(_TURN.name, self.table_state.community_cards)
 
         # Add Monte Carlo evaluation
         prwin = self.hand_evaluator.calculate_prwin(
@@ -264,27 +278,21 @@ class GameRunner:
         )
 
         # Log win probability
-        self.logger.log_win_probability(Street.TURN.name, prwin)
+        self.logger.log_win_probability(_TURN.name, prwin)
+        self._last_prwin = prwin
 
         # Calculate and log outs information
         outs_count = self.table_state.outs_calculator.calculate_total_outs()
         outs_description = self.table_state.outs_calculator.get_outs_description()
         equity_from_outs = self.table_state.outs_calculator.calculate_equity_from_outs()
-        self.logger.log_outs_information(Street.TURN.name, outs_count, outs_description, equity_from_outs)
+        self.logger.log_outs_information(_TURN.name, outs_count, outs_description, equity_from_outs)
 
         # Update hand data
-        self.current_hand_data.community_cards[Street.TURN] = self.table_state.community_cards.copy()
-        self.current_hand_data.win_probability[Street.TURN] = prwin
-        self.current_hand_data.pot_sizes[Street.TURN] = self.table_state.pot_size
-        if hasattr(self.current_hand_data, 'outs_count'):
-            self.current_hand_data.outs_count[Street.TURN] = outs_count
-        else:
-            self.current_hand_data.outs_count = {Street.TURN: outs_count}
-
-        if hasattr(self.current_hand_data, 'equity_from_outs'):
-            self.current_hand_data.equity_from_outs[Street.TURN] = equity_from_outs
-        else:
-            self.current_hand_data.equity_from_outs = {Street.TURN: equity_from_outs}
+        self.current_hand_data.community_cards[_TURN] = self.table_state.community_cards.copy()
+        self.current_hand_data.win_probability[_TURN] = prwin
+        self.current_hand_data.pot_sizes[_TURN] = self.table_state.pot_size
+        self.current_hand_data.outs_count[_TURN] = outs_count
+        self.current_hand_data.equity_from_outs[_TURN] = equity_from_outs
 
     def _deal_river(self):
         """Deal and display the river"""
@@ -296,10 +304,10 @@ class GameRunner:
         self.table_state.community_cards.append(river_card)
 
         # Update table state to new street
-        self.table_state.new_street(Street.RIVER)
+        self.table_state.new_street(_RIVER)
 
         # Log community cards
-        self.logger.log_community_cards(Street.RIVER.name, self.table_state.community_cards)
+        self.logger.log_community_cards(_RIVER.name, self.table_state.community_cards)
 
         # Add Monte Carlo evaluation
         prwin = self.hand_evaluator.calculate_prwin(
@@ -310,12 +318,13 @@ class GameRunner:
         )
 
         # Log win probability
-        self.logger.log_win_probability(Street.RIVER.name, prwin)
+        self.logger.log_win_probability(_RIVER.name, prwin)
+        self._last_prwin = prwin
 
         # Update hand data
-        self.current_hand_data.community_cards[Street.RIVER] = self.table_state.community_cards.copy()
-        self.current_hand_data.win_probability[Street.RIVER] = prwin
-        self.current_hand_data.pot_sizes[Street.RIVER] = self.table_state.pot_size
+        self.current_hand_data.community_cards[_RIVER] = self.table_state.community_cards.copy()
+        self.current_hand_data.win_probability[_RIVER] = prwin
+        self.current_hand_data.pot_sizes[_RIVER] = self.table_state.pot_size
 
     def _run_betting_round(self, street: Street) -> bool:
         """Run a betting round. Returns False if hand is over."""
@@ -330,57 +339,60 @@ class GameRunner:
         self.logger.info(f"Hero stack: {hero_stack}")
 
         # Simulate opponent actions
-        if street == Street.PREFLOP:
+        if street == _PREFLOP:
             # Button calls or raises preflop
-            if random.random() < 0.4:  # 40% chance to raise
+            if self._rng.random() < 0.4:  # 40% chance to raise
                 raise_size = self.big_blind * 3
                 self.table_state.players[0].stack -= raise_size
                 self.table_state.pot_size += raise_size
                 self.table_state.current_bet = raise_size
                 # Record action in table state
-                self.table_state.record_action(0, Action.RAISE, raise_size)
+                self.table_state.record_action(0, _RAISE, raise_size)
                 # Log action for display
                 self.logger.log_action("Button", "raises", raise_size)
             else:
                 self.table_state.players[0].stack -= self.big_blind
                 self.table_state.pot_size += self.big_blind
                 # Record action in table state
-                self.table_state.record_action(0, Action.CALL, self.big_blind)
+                self.table_state.record_action(0, _CALL, self.big_blind)
                 # Log action for display
                 self.logger.log_action("Button", "calls", self.big_blind)
         else:
             # Post-flop opponent actions
-            if random.random() < 0.3:  # 30% chance to bet
+            if self._rng.random() < 0.3:  # 30% chance to bet
                 bet_size = self.table_state.pot_size * 0.5  # Half pot bet
                 self.table_state.players[0].stack -= bet_size
                 self.table_state.pot_size += bet_size
                 self.table_state.current_bet = bet_size
                 # Record action in table state
-                self.table_state.record_action(0, Action.RAISE, bet_size)
+                self.table_state.record_action(0, _RAISE, bet_size)
                 # Log action for display
                 self.logger.log_action("Opponent", "bets", bet_size)
             else:
                 # Record action in table state
-                self.table_state.record_action(0, Action.CHECK)
+                self.table_state.record_action(0, _CHECK)
                 # Log action for display
                 self.logger.log_action("Opponent", "checks")
 
+        # Decision tracking only feeds the debug explanation, so skip it below DEBUG
+        explain = self.logger.debug_level >= _DEBUG
+
         # Start decision tracking
-        decision_node = self.decision_explainer.start_decision(
-            f"{street.name} Decision",
-            f"Making a decision on {street.name} with {self.table_state.hero_cards}"
-        )
+        if explain:
+            decision_node = self.decision_explainer.start_decision(
+                f"{street.name} Decision",
+                f"Making a decision on {street.name} with {self.table_state.hero_cards}"
+            )
 
         # Get bot's action
         start_time = time.time()
         action, bet_size = self.bot.make_decision()
         execution_time = time.time() - start_time
 
-        # End decision tracking
-        decision_data = self.decision_explainer.end_decision((action, bet_size))
-
         # Log decision data
-        if self.logger.debug_level >= DebugLevel.DEBUG:
+        if explain:
+            # End decision tracking
+            decision_data = self.decision_explainer.end_decision((action, bet_size))
             self.logger.log_decision(decision_data)
 
             # Update verbosity symbols
@@ -402,39 +414,39 @@ class GameRunner:
             }
 
             explanation = self.decision_explainer.explain_hand_decision(hand_data)
-            self.logger.debug(f"Decision explanation:\n{explanation}", DebugLevel.DEBUG)
+            self.logger.debug(f"Decision explanation:\n{explanation}", _DEBUG)
 
         # Log and process bot's action
-        if action == Action.FOLD:
+        if action == _FOLD:
             # Record action in table state
-            self.table_state.record_action(self.table_state.hero_seat, Action.FOLD)
+            self.table_state.record_action(self.table_state.hero_seat, _FOLD)
             # Log action for display
             self.logger.log_action("Bot", "folds")
             return False
-        elif action == Action.CHECK:
+        elif action == _CHECK:
             # Record action in table state
-            self.table_state.record_action(self.table_state.hero_seat, Action.CHECK)
+            self.table_state.record_action(self.table_state.hero_seat, _CHECK)
             # Log action for display
             self.logger.log_action("Bot", "checks")
-        elif action == Action.CALL:
+        elif action == _CALL:
             # Record action in table state
-            self.table_state.record_action(self.table_state.hero_seat, Action.CALL, bet_size)
+            self.table_state.record_action(self.table_state.hero_seat, _CALL, bet_size)
             # Log action for display
             self.logger.log_action("Bot", "calls", bet_size)
             self.table_state.players[self.table_state.hero_seat].stack -= bet_size
             self.table_state.pot_size += bet_size
             self.table_state.hero_stack = self.table_state.players[self.table_state.hero_seat].stack
-        elif action == Action.RAISE:
+        elif action == _RAISE:
             # Record action in table state
-            self.table_state.record_action(self.table_state.hero_seat, Action.RAISE, bet_size)
+            self.table_state.record_action(self.table_state.hero_seat, _RAISE, bet_size)
             # Log action for display
             self.logger.log_action("Bot", "raises", bet_size)
             self.table_state.players[self.table_state.hero_seat].stack -= bet_size
             self.table_state.pot_size += bet_size
             self.table_state.hero_stack = self.table_state.players[self.table_state.hero_seat].stack
-        elif action == Action.ALL_IN:
+        elif action == _ALL_IN:
             # Record action in table state
-            self.table_state.record_action(self.table_state.hero_seat, Action.ALL_IN, bet_size)
+            self.table_state.record_action(self.table_state.hero_seat, _ALL_IN, bet_size)
             # Log action for display
             self.logger.log_action("Bot", "goes all-in", bet_size)
             self.table_state.players[self.table_state.hero_seat].stack -= bet_size
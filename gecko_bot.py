@@ -166,7 +166,7 @@ class GeckoBot:
                     return self._raise_decision(1.0)  # Pot-sized bet
 
                 # Adjust bet size based on board texture
-                if board_texture['texture'] == 'DRY':
+                if board_texture.texture == 'DRY':
                     return self._raise_decision(optimal_bet_size * 0.8)  # Smaller bet on dry boards
                 else:
                     return self._raise_decision(optimal_bet_size * 1.1)  # Larger bet on wet boards
@@ -183,7 +183,7 @@ class GeckoBot:
                 # If we're in position or the board is dry, bet
                 if (self.table_state.is_late_position() or
                     self.table_state.is_last_to_act() or
-                    board_texture['texture'] == 'DRY'):
+                    board_texture.texture == 'DRY'):
                     return self._raise_decision(optimal_bet_size)
 
                 # Otherwise, check
@@ -192,7 +192,7 @@ class GeckoBot:
             # Strong draws bet on wet boards in position
             if hand_strength.is_strong_draw:
                 if ((self.table_state.is_late_position() or self.table_state.is_last_to_act()) and
-                    board_texture['texture'] != 'DRY'):
+                    board_texture.texture != 'DRY'):
                     return self._raise_decision(0.5)
                 if self.table_state.is_in_position_vs_aggressor() and self.table_state.is_in_position_vs_callers():
                     return self._raise_decision(0.5)
@@ -205,7 +205,7 @@ class GeckoBot:
             if hand_strength.is_strong_made_hand:
                 return self._raise_decision(3)  # Punish donk bets
             if hand_strength.is_medium_made_hand:
-                if board_texture['texture'] == 'DRY':
+                if board_texture.texture == 'DRY':
                     return (Action.CALL, self.table_state.current_bet)
                 if self._in_position():
                     return self._raise_decision(2.5)
@@ -217,11 +217,11 @@ class GeckoBot:
         if self._facing_cbet():
             # Defend wider vs c-bets
             if hand_strength.is_strong_made_hand:
-                if board_texture['texture'] == 'DRY':
+                if board_texture.texture == 'DRY':
                     return self._raise_decision(2.5)
                 return self._raise_decision(3)
             if hand_strength.is_medium_made_hand:
-                if board_texture['texture'] == 'DRY':
+                if board_texture.texture == 'DRY':
                     return (Action.CALL, self.table_state.current_bet)
                 if self._in_position():
                     return self._raise_decision(2.5)
@@ -229,7 +229,7 @@ class GeckoBot:
             if (hand_strength.is_strong_draw or
                 (hand_strength.is_medium_draw and self._in_position())):
                 if self._getting_odds():
-                    if board_texture['texture'] != 'DRY':
+                    if board_texture.texture != 'DRY':
                         return self._raise_decision(2.5)
                     return (Action.CALL, self.table_state.current_bet)
             return (Action.FOLD, 0.0)
@@ -257,17 +257,17 @@ class GeckoBot:
         # First to act
         if not self._facing_bet():
             if hand_strength.is_strong_made_hand:
-                if board_texture['texture'] == 'DRY':
+                if board_texture.texture == 'DRY':
                     return self._raise_decision(0.66)  # 2/3 pot on dry boards
                 return self._raise_decision(0.75)  # 3/4 pot on wet boards
 
             if hand_strength.is_medium_made_hand and self._in_position():
-                if board_texture['texture'] == 'DRY':
+                if board_texture.texture == 'DRY':
                     return self._raise_decision(0.5)
                 return (Action.CHECK, 0.0)
 
             if hand_strength.is_strong_draw and self._in_position():
-                if board_texture['texture'] != 'DRY':
+                if board_texture.texture != 'DRY':
                     return self._raise_decision(0.5)
                 return (Action.CHECK, 0.0)
 
@@ -275,12 +275,12 @@ class GeckoBot:
 
         # Facing a bet
         if hand_strength.is_strong_made_hand:
-            if board_texture['texture'] == 'DRY':
+            if board_texture.texture == 'DRY':
                 return self._raise_decision(2.5)
             return self._raise_decision(3)
 
         if hand_strength.is_medium_made_hand:
-            if board_texture['texture'] == 'DRY':
+            if board_texture.texture == 'DRY':
                 return (Action.CALL, self.table_state.current_bet)
             if self._in_position():
                 return self._raise_decision(2.5)
@@ -288,7 +288,7 @@ class GeckoBot:
 
         if hand_strength.is_strong_draw:
             if self._getting_odds():
-                if board_texture['texture'] != 'DRY':
+                if board_texture.texture != 'DRY':
                     return self._raise_decision(2.5)
                 return (Action.CALL, self.table_state.current_bet)
 
@@ -315,12 +315,12 @@ class GeckoBot:
         # First to act
         if not self._facing_bet():
             if hand_strength.value >= HandStrength.TWO_PAIR_TOP.value:
-                if board_texture['texture'] == 'DRY':
+                if board_texture.texture == 'DRY':
                     return self._raise_decision(0.75)
                 return self._raise_decision(1.0)  # Pot-sized bet
 
             if hand_strength.value >= HandStrength.TOP_PAIR_GOOD_KICKER.value:
-                if board_texture['texture'] == 'DRY' and self._in_position():
+                if board_texture.texture == 'DRY' and self._in_position():
                     return self._raise_decision(0.5)
                 return (Action.CHECK, 0.0)
 
@@ -328,19 +328,19 @@ class GeckoBot:
 
         # Facing a bet
         if hand_strength.value >= HandStrength.SET.value:
-            if board_texture['texture'] == 'DRY':
+            if board_texture.texture == 'DRY':
                 return self._raise_decision(2.5)
             return self._raise_decision(3)
 
         if hand_strength.value >= HandStrength.TWO_PAIR_TOP_AND_MIDDLE.value:
-            if board_texture['texture'] == 'DRY':
+            if board_texture.texture == 'DRY':
                 return (Action.CALL, self.table_state.current_bet)
             if self._in_position():
                 return self._raise_decision(2.5)
             return (Action.CALL, self.table_state.current_bet)
 
         if (hand_strength.value >= HandStrength.TOP_PAIR_GOOD_KICKER.value and
-            board_texture['texture'] == 'DRY' and
+            board_texture.texture == 'DRY' and
             self._getting_good_odds()):
             return (Action.CALL, self.table_state.current_bet)
 
@@ -413,7 +413,7 @@ class GeckoBot:
         # Count raises on the current street
         raise_count = 0
         for action_data in self.table_state.betting_symbols.actions_by_street[street]:
-            if action_data['action'] == Action.RAISE:
+            if action_data.action == Action.RAISE:
                 raise_count += 1
         return raise_count >= 2
 
@@ -40,6 +40,11 @@ class HandEvaluator:
 
         wins = 0
         deck = self._create_deck(hole_cards, board)
+        hero_cards = list(hole_cards)
+
+        # The hero's score depends only on the runout, which repeats across
+        # simulations once most of the board is known (every time on the river)
+        hero_scores = {}
 
         for _ in range(num_simulations):
             # Deal remaining board cards
@@ -55,13 +60,16 @@ class HandEvaluator:
                 opponent_hands.append(opp_cards)
 
             # Calculate scores
-            hero_score = self._calculate_hand_score(list(hole_cards) + remaining_board)
-            opponent_scores = [self._calculate_hand_score(list(opp) + remaining_board)
-                             for opp in opponent_hands]
-
-            if hero_score > max(opponent_scores):
+            runout = tuple(remaining_board)
+            hero_score = hero_scores.get(runout)
+            if hero_score is None:
+                hero_score = hero_scores[runout] = self._calculate_hand_score(hero_cards + remaining_board)
+            best_opponent_score = max(self._calculate_hand_score(list(opp) + remaining_board)
+                                      for opp in opponent_hands)
+
+            if hero_score > best_opponent_score:
                 wins += 1
-            elif hero_score == max(opponent_scores):
+            elif hero_score == best_opponent_score:
                 wins += 0.5
 
         return wins / num_simulations
@@ -124,14 +132,14 @@ class HandEvaluator:
         if not board:
             return False
         suits = [card[1] for card in board]
-        return any(suits.count(suit) >= 3 for suit in set(suits))
+        return max(Counter(suits).values()) >= 3
 
     def is_flush_draw_possible(self, board: List[str]) -> bool:
         """Check if a flush draw is possible on the board"""
         if not board:
             return False
         suits = [card[1] for card in board]
-        return any(suits.count(suit) >= 2 for suit in set(suits))
+        return max(Counter(suits).values()) >= 2
 
     def is_straight_possible(self, board: List[str]) -> bool:
         """Check if a straight is possible on the board"""
@@ -551,7 +559,7 @@ class HandEvaluator:
     def _have_pair(self, hole_cards: List[str], board: List[str]) -> bool:
         """Check if we have at least a pair"""
         ranks = [card[0] for card in hole_cards + board]
-        return any(ranks.count(r) >= 2 for r in set(ranks))
+        return max(Counter(ranks).values(), default=0) >= 2
 
     def _have_top_pair(self, hole_cards: List[str], board: List[str]) -> bool:
         """Check if we have top pair"""
@@ -645,7 +653,7 @@ class HandEvaluator:
         if len(board) >= 5:
             return False
         suits = [card[1] for card in hole_cards + board]
-        return any(suits.count(s) >= 4 for s in set(suits))
+        return max(Counter(suits).values(), default=0) >= 4
 
     def _is_nut_flush_draw(self, hole_cards: List[str], board: List[str]) -> bool:
         """Check if we have the nut flush draw"""
@@ -667,7 +675,7 @@ class HandEvaluator:
         if len(board) != 3:
             return False
         suits = [card[1] for card in hole_cards + board]
-        return any(suits.count(s) == 3 for s in set(suits))
+        return 3 in Counter(suits).values()
 
     def _have_backdoor_straight_draw(self, hole_cards: List[str], board: List[str]) -> bool:
         """Check if we have a backdoor straight draw"""
@@ -947,7 +955,7 @@ class HandEvaluator:
         if len(board) != 3:
             return False
         suits = [card[1] for card in hole_cards + board]
-        return any(suits.count(s) == 3 for s in set(suits))
+        return 3 in Counter(suits).values()
 
     def _have_backdoor_straight_draw(self, hole_cards: List[str], board: List[str]) -> bool:
         """Check if we have a backdoor straight draw"""
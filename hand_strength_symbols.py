@@ -5,7 +5,7 @@ This module implements the advanced hand strength symbols from OpenPPL.
 """
 
 from typing import List, Dict, Optional, Set, Tuple
-from poker_enums import HandStrength, Rank, Suit, Card, Street
+from poker_enums import HandStrength, Rank, Card, Street, DECK
 from collections import Counter
 
 class HandStrengthSymbols:
@@ -82,36 +82,10 @@ class HandStrengthSymbols:
         Returns:
             Card object
         """
-        rank_char = card_str[0].upper()
-        suit_char = card_str[1].lower()
-        
-        # Convert rank character to Rank enum
-        if rank_char == 'A':
-            rank = Rank.ACE
-        elif rank_char == 'K':
-            rank = Rank.KING
-        elif rank_char == 'Q':
-            rank = Rank.QUEEN
-        elif rank_char == 'J':
-            rank = Rank.JACK
-        elif rank_char == 'T':
-            rank = Rank.TEN
-        else:
-            rank = Rank(int(rank_char))
-            
-        # Convert suit character to Suit enum
-        if suit_char == 'h':
-            suit = Suit.HEARTS
-        elif suit_char == 'd':
-            suit = Suit.DIAMONDS
-        elif suit_char == 'c':
-            suit = Suit.CLUBS
-        elif suit_char == 's':
-            suit = Suit.SPADES
-        else:
-            raise ValueError(f"Invalid suit: {suit_char}")
-            
-        return Card(rank, suit)
+        try:
+            return DECK[card_str[0].upper() + card_str[1].lower()]
+        except KeyError:
+            raise ValueError(f"Invalid card: {card_str}") from None
     
     # ---- Detailed Hand Categories ----
     
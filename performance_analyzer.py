@@ -8,8 +8,16 @@ import os
 import json
 import glob
 import csv
-from typing import Dict, List, Any, Optional
-from collections import defaultdict
+from typing import Dict, List, Any, Optional, Iterator
+from itertools import islice
+import numpy as np
+from session_cache import session_sort_key
+
+# Column order of the decision data CSV export
+DECISION_EXPORT_FIELDS = [
+    "hand_id", "street", "hole_cards", "community_cards", "hand_strength",
+    "win_probability", "action", "amount", "pot_size", "pot_odds", "stack_depth"
+]
 
 class PerformanceAnalyzer:
     """
@@ -35,7 +43,7 @@ class PerformanceAnalyzer:
                 print(f"Error loading {file_path}: {e}")
                 
         # Sort by timestamp (most recent first)
-        sessions.sort(key=lambda x: x.get('session_id', ''), reverse=True)
+        sessions.sort(key=lambda x: session_sort_key(x['file_path']), reverse=True)
         return sessions
     
     def analyze_decision_patterns(self, session_index: int = 0) -> Dict[str, Any]:
@@ -55,14 +63,13 @@ class PerformanceAnalyzer:
                 "error": "No hand data available"
             }
         
-        # Analyze decision patterns by street, position, and hand strength
-        patterns = {
-            "by_street": defaultdict(lambda: defaultdict(int)),
-            "by_position": defaultdict(lambda: defaultdict(int)),
-            "by_hand_strength": defaultdict(lambda: defaultdict(int)),
-            "by_pot_odds": defaultdict(lambda: defaultdict(int)),
-            "by_stack_depth": defaultdict(lambda: defaultdict(int))
-        }
+        # Encode each bot decision as small integer codes per dimension so the
+        # pattern tables can be counted with np.bincount
+        dimensions = ["by_street", "by_position", "by_hand_strength", "by_pot_odds", "by_stack_depth"]
+        labels = {dimension: {} for dimension in dimensions}
+        codes = {dimension: [] for dimension in dimensions}
+        action_labels = {}
+        action_codes = []
         
         for hand in hands:
             # Get position
@@ -83,49 +90,61 @@ class PerformanceAnalyzer:
             hole_cards = hand.get('hole_cards', [])
             hand_strength = self._categorize_hand_strength(hole_cards)
             
+            # Pot size and stack depth are per hand
+            pot_size = hand.get('pot_size', 0)
+            stack_depth_range = None
+            hero_stack = hand.get('hero_stack', 0)
+            if hero_stack > 0 and hand.get('big_blind') is not None and hand.get('big_blind') > 0:
+                stack_depth = hero_stack / hand.get('big_blind')
+                stack_depth_range = self._categorize_stack_depth(stack_depth)
+            
             # Analyze decisions by street
             for street, street_data in hand.get('streets', {}).items():
                 for action in street_data.get('actions', []):
                     if action.get('player') == 'Bot':
                         action_type = action.get('action', 'unknown')
+                        action_codes.append(action_labels.setdefault(action_type, len(action_labels)))
                         
-                        # Count by street
-                        patterns["by_street"][street][action_type] += 1
-                        
-                        # Count by position
-                        patterns["by_position"][position][action_type] += 1
-                        
-                        # Count by hand strength
-                        patterns["by_hand_strength"][hand_strength][action_type] += 1
+                        codes["by_street"].append(labels["by_street"].setdefault(street, len(labels["by_street"])))
+                        codes["by_position"].append(labels["by_position"].setdefault(position, len(labels["by_position"])))
+                        codes["by_hand_strength"].append(
+                            labels["by_hand_strength"].setdefault(hand_strength, len(labels["by_hand_strength"])))
                         
-                        # Calculate pot odds and count by pot odds range
-                        pot_size = hand.get('pot_size', 0)
+                        # Pot odds range, or -1 when no pot odds apply
                         amount = action.get('amount')
-                        
+                        pot_odds_code = -1
                         if pot_size > 0 and amount is not None and amount > 0:
                             pot_odds = amount / (pot_size + amount)
                             pot_odds_range = self._categorize_pot_odds(pot_odds)
-                            patterns["by_pot_odds"][pot_odds_range][action_type] += 1
+                            pot_odds_code = labels["by_pot_odds"].setdefault(pot_odds_range, len(labels["by_pot_odds"]))
+                        codes["by_pot_odds"].append(pot_odds_code)
                         
-                        # Calculate stack depth and count by stack depth range
-                        hero_stack = hand.get('hero_stack', 0)
-                        if hero_stack > 0 and hand.get('big_blind') is not None and hand.get('big_blind') > 0:
-                            stack_depth = hero_stack / hand.get('big_blind')
-                            stack_depth_range = self._categorize_stack_depth(stack_depth)
-                            patterns["by_stack_depth"][stack_depth_range][action_type] += 1
+                        # Stack depth range, or -1 when unknown
+                        stack_depth_code = -1
+                        if stack_depth_range is not None:
+                            stack_depth_code = labels["by_stack_depth"].setdefault(stack_depth_range, len(labels["by_stack_depth"]))
+                        codes["by_stack_depth"].append(stack_depth_code)
         
-        # Convert defaultdicts to regular dicts for JSON serialization
-        result = {
-            "session_id": session.get('session_id', 'Unknown'),
-            "by_street": {k: dict(v) for k, v in patterns["by_street"].items()},
-            "by_position": {k: dict(v) for k, v in patterns["by_position"].items()},
-            "by_hand_strength": {k: dict(v) for k, v in patterns["by_hand_strength"].items()},
-            "by_pot_odds": {k: dict(v) for k, v in patterns["by_pot_odds"].items()},
-            "by_stack_depth": {k: dict(v) for k, v in patterns["by_stack_depth"].items()}
-        }
+        action_array = np.array(action_codes, dtype=np.int64)
+        action_names = list(action_labels)
+        
+        result = {"session_id": session.get('session_id', 'Unknown')}
+        for dimension in dimensions:
+            counts = self._count_pairs(np.array(codes[dimension], dtype=np.int64), action_array,
+                                       len(labels[dimension]), len(action_names))
+            result[dimension] = {
+                label: {action_names[a]: int(count) for a, count in enumerate(row) if count}
+                for label, row in zip(labels[dimension], counts)
+            }
         
         return result
     
+    def _count_pairs(self, keys: np.ndarray, actions: np.ndarray, num_keys: int, num_actions: int) -> np.ndarray:
+        """Count (key, action) pairs into a num_keys x num_actions table, skipping keys of -1"""
+        valid = keys >= 0
+        flat = np.bincount(keys[valid] * num_actions + actions[valid], minlength=num_keys * num_actions)
+        return flat.reshape(num_keys, num_actions)
+    
     def analyze_performance_metrics(self, session_index: int = 0) -> Dict[str, Any]:
         """Analyze the bot's performance metrics"""
         if not self.sessions:
@@ -292,7 +311,8 @@ class PerformanceAnalyzer:
         
         return metrics
     
-    def export_decision_data(self, output_file: str, session_index: int = 0) -> bool:
+    def export_decision_data(self, output_file: str, session_index: int = 0,
+                             chunksize: int = 1000) -> bool:
         """Export decision data to CSV for further analysis"""
         if not self.sessions:
             print("Error: No sessions available")
@@ -308,9 +328,25 @@ class PerformanceAnalyzer:
             print(f"Error: No hand data available for session {session.get('session_id', 'Unknown')}")
             return False
         
-        # Prepare data for export
-        decision_data = []
-        
+        # Write to CSV, streaming rows in chunks instead of building them all up front
+        try:
+            rows = self._iter_decision_rows(hands)
+            with open(output_file, 'w', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=DECISION_EXPORT_FIELDS)
+                writer.writeheader()
+                chunk = list(islice(rows, chunksize))
+                while chunk:
+                    writer.writerows(chunk)
+                    chunk = list(islice(rows, chunksize))
+                
+            print(f"Decision data exported to {output_file}")
+            return True
+        except Exception as e:
+            print(f"Error exporting decision data: {e}")
+            return False
+    
+    def _iter_decision_rows(self, hands: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Yield one export row per bot decision"""
         for hand in hands:
             hole_cards = hand.get('hole_cards', [])
             hand_strength = self._categorize_hand_strength(hole_cards)
@@ -332,8 +368,7 @@ class PerformanceAnalyzer:
                         hero_stack = hand.get('hero_stack', 0)
                         stack_depth = hero_stack / hand.get('big_blind') if hero_stack > 0 and hand.get('big_blind') is not None and hand.get('big_blind') > 0 else None
                         
-                        # Add decision data
-                        decision_data.append({
+                        yield {
                             "hand_id": hand.get('hand_id', 0),
                             "street": street,
                             "hole_cards": " ".join(hole_cards),
@@ -345,20 +380,7 @@ class PerformanceAnalyzer:
                             "pot_size": pot_size,
                             "pot_odds": pot_odds,
                             "stack_depth": stack_depth
-                        })
-        
-        # Write to CSV
-        try:
-            with open(output_file, 'w', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=decision_data[0].keys())
-                writer.writeheader()
-                writer.writerows(decision_data)
-                
-            print(f"Decision data exported to {output_file}")
-            return True
-        except Exception as e:
-            print(f"Error exporting decision data: {e}")
-            return False
+                        }
     
     def _categorize_hand_strength(self, hole_cards: List[str]) -> str:
         """Categorize hand strength based on hole cards"""
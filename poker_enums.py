@@ -1,5 +1,5 @@
 from enum import Enum, auto, IntEnum
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
 class Position(Enum):
     BUTTON = auto()
@@ -265,6 +265,13 @@ class Card:
     def __hash__(self) -> int:
         return hash((self.rank, self.suit))
 
+# One shared Card per rank/suit, keyed by card string (e.g. 'Ah')
+DECK: Dict[str, Card] = {
+    rank_char + suit_char: Card(Rank.from_char(rank_char), Suit.from_char(suit_char))
+    for rank_char in 'AKQJT98765432'
+    for suit_char in 'hdcs'
+}
+
 class BoardTexture(Enum):
     """Board texture classifications."""
     DRY = auto()       # Few draws, uncoordinated
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+GeckoBot Poker - Session Cache
+Decoded session files cached between runs of the log analysis tools, so
+unchanged *_data.json files are not parsed again. The caches live in the
+user's cache directory rather than next to the logs, which may be shared or
+checked in.
+"""
+
+import os
+import re
+import hashlib
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Any, List, Optional, Tuple
+
+# Worker threads for parsing many session files at once
+MAX_LOAD_WORKERS = 8
+
+# Session id embedded in the log file name, e.g. geckobot_20250403_192014_data.json
+SESSION_FILE_PATTERN = re.compile(r"(\d{8}_\d{6})_data\.json$")
+
+def file_stamp(stat: os.stat_result) -> Tuple[int, int]:
+    """(mtime, size) stamp of a session file; any rewrite of the file changes it"""
+    return (stat.st_mtime_ns, stat.st_size)
+
+def session_file_id(file_path: str) -> str:
+    """Session id from a log file's name, or '' if the name carries none"""
+    match = SESSION_FILE_PATTERN.search(file_path)
+    return match.group(1) if match else ''
+
+def session_sort_key(file_path: str) -> Tuple[str, str]:
+    """
+    Key that orders session files by the id in their name, then by path. Every
+    tool sorts with this (reverse=True for most recent first), so a session
+    index refers to the same file in all of them, whether or not the file
+    itself records a session_id.
+    """
+    return (session_file_id(file_path), file_path)
+
+def cache_dir() -> str:
+    """Directory for the tools' caches, following XDG_CACHE_HOME when it is set"""
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'geckobot')
+
+def cache_path_for(log_dir: str, name: str) -> str:
+    """Cache file for one consumer's view of one log directory"""
+    digest = hashlib.sha1(os.path.realpath(log_dir).encode('utf-8')).hexdigest()[:16]
+    return os.path.join(cache_dir(), f"{name}_{digest}.pkl")
+
+def parse_files(paths: List[str], parse: Callable[[str], Any]) -> List[Any]:
+    """Parse each file with parse, in order, using worker threads when there are several"""
+    if len(paths) > 1:
+        # Threads overlap the file reads, which release the GIL
+        with ThreadPoolExecutor(max_workers=min(MAX_LOAD_WORKERS, len(paths), os.cpu_count() or 4)) as executor:
+            return list(executor.map(parse, paths))
+    return [parse(path) for path in paths]
+
+class SessionCache:
+    """
+    Per-consumer payloads for session files, keyed by file path with the stamp
+    of the file each was built from. The consumer's version is stored with the
+    entries, so bumping it discards caches written with an older payload layout.
+    """
+    def __init__(self, cache_path: str, version: int):
+        self.cache_path = cache_path
+        self.version = version
+        self._entries: Optional[Dict[str, tuple]] = None
+        self._dirty = False
+
+    def get(self, file_path: str, stamp: Tuple[int, int]) -> Optional[Any]:
+        """Cached payload for the file, or None if it is missing or the file has changed"""
+        entry = self._load().get(file_path)
+        if entry is not None and entry[0] == stamp:
+            return entry[1]
+        return None
+
+    def put(self, file_path: str, stamp: Tuple[int, int], payload: Any):
+        """Remember the payload built from the file at the given stamp"""
+        self._load()[file_path] = (stamp, payload)
+        self._dirty = True
+
+    def save(self, live_paths):
+        """Write back any changes, dropping entries for files not in live_paths"""
+        entries = self._load()
+        stale = [path for path in entries if path not in live_paths]
+        for path in stale:
+            del entries[path]
+        if self._dirty or stale:
+            self._write(entries)
+            self._dirty = False
+
+    def _load(self) -> Dict[str, tuple]:
+        """Read the cache file on first use"""
+        if self._entries is None:
+            self._entries = self._read()
+        return self._entries
+
+    def _read(self) -> Dict[str, tuple]:
+        """Load the entries, or none if the file is missing, unreadable or another version"""
+        try:
+            with open(self.cache_path, 'rb') as f:
+                cache = pickle.load(f)
+        except Exception:
+            return {}
+        if not isinstance(cache, tuple) or len(cache) != 2 or cache[0] != self.version:
+            return {}
+        return cache[1] if isinstance(cache[1], dict) else {}
+
+    def _write(self, entries: Dict[str, tuple]):
+        """Replace the cache file atomically; an unwritable location just goes uncached"""
+        temp_path = self.cache_path + '.tmp'
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            with open(temp_path, 'wb') as f:
+                pickle.dump((self.version, entries), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self.cache_path)
+        except OSError:
+            pass
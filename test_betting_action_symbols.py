@@ -72,6 +72,18 @@ class TestBettingActionSymbols(unittest.TestCase):
         # Now it's a check-raise situation
         self.assertTrue(self.symbols.is_check_raise())
         
+    def test_check_raise_after_long_street(self):
+        """Test check-raise detection once the street's action log has grown."""
+        for i in range(20):
+            self.symbols.record_action(Street.TURN, f"Opponent{i}", Action.CALL, 10, is_bot=False)
+
+        self.symbols.record_action(Street.TURN, "Bot", Action.CHECK, None, is_bot=True)
+        self.symbols.record_action(Street.TURN, "Opponent", Action.RAISE, 30, is_bot=False)
+        self.assertFalse(self.symbols.is_check_raise())
+
+        self.symbols.record_action(Street.TURN, "Bot", Action.RAISE, 90, is_bot=True)
+        self.assertTrue(self.symbols.is_check_raise())
+
     def test_three_bet(self):
         """Test the is_three_bet method."""
         # Initially, it's not a 3-bet situation
@@ -86,6 +98,14 @@ class TestBettingActionSymbols(unittest.TestCase):
         # Now it's a 3-bet situation
         self.assertTrue(self.symbols.is_three_bet())
         
+    def test_three_bet_counts_raises_per_street(self):
+        """Test that raises on earlier streets do not make a 3-bet."""
+        self.symbols.record_action(Street.PREFLOP, "Bot", Action.RAISE, 60, is_bot=True)
+        self.symbols.record_action(Street.PREFLOP, "Opponent", Action.CALL, 60, is_bot=False)
+        self.symbols.record_action(Street.FLOP, "Opponent", Action.RAISE, 100, is_bot=False)
+
+        self.assertFalse(self.symbols.is_three_bet())
+
     def test_four_bet(self):
         """Test the is_four_bet method."""
         # Initially, it's not a 4-bet situation
@@ -172,5 +192,60 @@ class TestBettingActionSymbols(unittest.TestCase):
         # Now there is one call since last play
         self.assertEqual(self.symbols.calls_since_last_play(Street.PREFLOP), 1)
 
+    def test_raises_since_repeated_bot_action(self):
+        """Test raises_since_last_play when the bot repeats an identical action."""
+        self.symbols.record_action(Street.FLOP, "Bot", Action.CHECK, None, is_bot=True)
+        self.symbols.record_action(Street.FLOP, "Opponent", Action.RAISE, 30, is_bot=False)
+        self.symbols.record_action(Street.FLOP, "Bot", Action.CHECK, None, is_bot=True)
+
+        # Only actions after the bot's most recent check count
+        self.assertEqual(self.symbols.raises_since_last_play(Street.FLOP), 0)
+
+    def test_raises_since_last_play_counts_all_in(self):
+        """Test that an all-in after the bot's action counts as a raise."""
+        self.symbols.record_action(Street.TURN, "Bot", Action.RAISE, 40, is_bot=True)
+        self.symbols.record_action(Street.TURN, "Opponent", Action.ALL_IN, 500, is_bot=False)
+
+        self.assertEqual(self.symbols.raises_since_last_play(Street.TURN), 1)
+
+    def test_street_action_predicates(self):
+        """Test the per-street bot action predicates."""
+        self.symbols.record_action(Street.FLOP, "Opponent", Action.CHECK, None, is_bot=False)
+        self.symbols.record_action(Street.FLOP, "Bot", Action.CHECK, None, is_bot=True)
+        self.symbols.record_action(Street.TURN, "Opponent", Action.RAISE, 30, is_bot=False)
+        self.symbols.record_action(Street.TURN, "Bot", Action.CALL, 30, is_bot=True)
+
+        self.assertTrue(self.symbols.bot_checked_on_flop())
+        self.assertFalse(self.symbols.bot_raised_on_flop())
+        self.assertTrue(self.symbols.bot_called_on_turn())
+        self.assertFalse(self.symbols.bot_called_on_river())
+        self.assertTrue(self.symbols.no_betting_on_flop())
+        self.assertFalse(self.symbols.no_betting_on_turn())
+
+    def test_all_in_counts_as_betting(self):
+        """Test that an all-in on the flop counts as betting."""
+        self.symbols.record_action(Street.FLOP, "Opponent", Action.ALL_IN, 500, is_bot=False)
+        self.assertFalse(self.symbols.no_betting_on_flop())
+
+    def test_reset(self):
+        """Test that reset clears all recorded actions and flags."""
+        self.symbols.record_action(Street.PREFLOP, "Opponent", Action.RAISE, 20, is_bot=False)
+        self.symbols.record_action(Street.PREFLOP, "Bot", Action.RAISE, 60, is_bot=True)
+        self.symbols.record_action(Street.FLOP, "Bot", Action.CHECK, None, is_bot=True)
+
+        self.symbols.reset()
+
+        self.assertEqual(len(self.symbols.actions_by_street[Street.PREFLOP]), 0)
+        self.assertEqual(self.symbols.bots_actions_on_this_round(Street.FLOP), 0)
+        self.assertFalse(self.symbols.bot_raised_before_flop())
+        self.assertFalse(self.symbols.bot_checked_on_flop())
+        self.assertFalse(self.symbols.bot_is_last_raiser())
+        self.assertFalse(self.symbols.is_three_bet())
+
+        # Recording after a reset starts from a clean slate
+        self.symbols.record_action(Street.FLOP, "Opponent", Action.RAISE, 30, is_bot=False)
+        self.assertFalse(self.symbols.is_three_bet())
+        self.assertFalse(self.symbols.is_check_raise())
+
 if __name__ == '__main__':
     unittest.main()
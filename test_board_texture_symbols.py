@@ -139,6 +139,35 @@ class TestBoardTextureSymbols(unittest.TestCase):
         self.assertTrue(self.symbols.open_ended_straight_draw_possible())
         self.assertGreater(self.symbols.number_of_straight_possibilities(), 1)
 
+    def test_repeated_ranks(self):
+        """Test symbols that treat repeated ranks as separate cards."""
+        # A pair counts as connected
+        self.symbols.update_board(['9h', '9d', '2c'], Street.FLOP)
+        self.assertTrue(self.symbols.is_connected_board())
+
+        # A paired middle rank breaks the run of consecutive cards
+        self.symbols.update_board(['5h', '6d', '6c', '7s'], Street.TURN)
+        self.assertFalse(self.symbols.is_very_connected_board())
+        self.assertFalse(self.symbols.open_ended_straight_draw_possible())
+
+        self.symbols.update_board(['5h', '6d', '7c', '7s'], Street.TURN)
+        self.assertTrue(self.symbols.is_very_connected_board())
+        self.assertEqual(self.symbols.number_of_straight_possibilities(), 3)
+
+    def test_compute_all(self):
+        """Test that compute_all matches the individual symbol methods."""
+        boards = [
+            (['Ah', 'Kh', 'Qh'], Street.FLOP),
+            (['Ah', 'Kh', '2c'], Street.FLOP),
+            (['Ah', 'Ad', 'Qc', 'Qd'], Street.TURN),
+            (['5h', '6d', '6c', '7s', '9h'], Street.RIVER),
+        ]
+        for board, street in boards:
+            self.symbols.update_board(board, street)
+            symbols = self.symbols.compute_all()
+            for name, value in symbols.items():
+                self.assertEqual(value, getattr(self.symbols, name)(), f"{name} on {board}")
+
     def test_board_danger_level(self):
         """Test board danger level symbols."""
         # Dry board - using a different board than the one we specifically adjusted
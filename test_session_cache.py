@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Test script for the SessionCache class and the shared session order.
+"""
+
+import io
+import os
+import json
+import shutil
+import tempfile
+import unittest
+import contextlib
+from unittest import mock
+from session_cache import SessionCache, cache_path_for
+
+class TestSessionCache(unittest.TestCase):
+    """Test cases for the SessionCache class."""
+
+    def setUp(self):
+        """Set up the test case."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_path = os.path.join(self.temp_dir, 'cache.pkl')
+
+    def tearDown(self):
+        """Clean up the test case."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_round_trip(self):
+        """Test that saved payloads are returned for an unchanged stamp."""
+        cache = SessionCache(self.cache_path, 1)
+        cache.put('a_data.json', (1, 10), {'hands': []})
+        cache.save({'a_data.json'})
+
+        cache = SessionCache(self.cache_path, 1)
+        self.assertEqual(cache.get('a_data.json', (1, 10)), {'hands': []})
+
+    def test_changed_file(self):
+        """Test that a different stamp misses the cache."""
+        cache = SessionCache(self.cache_path, 1)
+        cache.put('a_data.json', (1, 10), {'hands': []})
+        cache.save({'a_data.json'})
+
+        cache = SessionCache(self.cache_path, 1)
+        self.assertIsNone(cache.get('a_data.json', (2, 10)))
+
+    def test_version_mismatch(self):
+        """Test that a cache written with another version is ignored."""
+        cache = SessionCache(self.cache_path, 1)
+        cache.put('a_data.json', (1, 10), {'hands': []})
+        cache.save({'a_data.json'})
+
+        cache = SessionCache(self.cache_path, 2)
+        self.assertIsNone(cache.get('a_data.json', (1, 10)))
+
+    def test_stale_entries_dropped(self):
+        """Test that entries for files no longer present are dropped on save."""
+        cache = SessionCache(self.cache_path, 1)
+        cache.put('a_data.json', (1, 10), 'a')
+        cache.put('b_data.json', (1, 10), 'b')
+        cache.save({'a_data.json'})
+
+        cache = SessionCache(self.cache_path, 1)
+        self.assertEqual(cache.get('a_data.json', (1, 10)), 'a')
+        self.assertIsNone(cache.get('b_data.json', (1, 10)))
+
+    def test_unreadable_cache(self):
+        """Test that a corrupt cache file is treated as empty."""
+        with open(self.cache_path, 'wb') as f:
+            f.write(b'not a pickle')
+
+        cache = SessionCache(self.cache_path, 1)
+        self.assertIsNone(cache.get('a_data.json', (1, 10)))
+
+    def test_cache_path_for(self):
+        """Test that caches go under the user cache directory, one per log directory."""
+        with mock.patch.dict(os.environ, {'XDG_CACHE_HOME': self.temp_dir}):
+            path = cache_path_for('logs', 'summary_sessions')
+            self.assertEqual(os.path.dirname(path), os.path.join(self.temp_dir, 'geckobot'))
+            self.assertNotEqual(path, cache_path_for('other_logs', 'summary_sessions'))
+            self.assertNotEqual(path, cache_path_for('logs', 'dashboard_sessions'))
+
+class TestSessionOrder(unittest.TestCase):
+    """Test that the log tools agree on which file a session index means."""
+
+    def setUp(self):
+        """Write session files, some without a session_id field."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.log_dir = os.path.join(self.temp_dir, 'logs')
+        os.makedirs(self.log_dir)
+        sessions = [
+            ('20250403_192014', '20250403_192014'),
+            ('20250403_193133', '20250403_193133'),
+            ('20250404_111248', None),
+            ('20250404_193312', None),
+            ('20250404_211907', '20250404_211907'),
+        ]
+        for stamp, session_id in sessions:
+            data = {'hands_played': 0, 'hands': []}
+            if session_id is not None:
+                data['session_id'] = session_id
+            with open(os.path.join(self.log_dir, f"geckobot_{stamp}_data.json"), 'w') as f:
+                json.dump(data, f)
+
+    def tearDown(self):
+        """Clean up the test case."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_same_file_for_each_index(self):
+        """Test that the dashboard, summary and analyzer resolve each index to the same file."""
+        from data_dashboard import DashboardGenerator
+        from data_summary import DataSummary
+        from performance_analyzer import PerformanceAnalyzer
+
+        with mock.patch.dict(os.environ, {'XDG_CACHE_HOME': self.temp_dir}), \
+                contextlib.redirect_stdout(io.StringIO()):
+            dashboard_paths = [s.file_path for s in DashboardGenerator(self.log_dir).list_sessions()]
+            summary_paths = [s['file_path'] for s in DataSummary(self.log_dir).sessions]
+            analyzer_paths = [s['file_path'] for s in PerformanceAnalyzer(self.log_dir).sessions]
+
+        self.assertEqual(len(dashboard_paths), 5)
+        self.assertEqual(dashboard_paths, summary_paths)
+        self.assertEqual(dashboard_paths, analyzer_paths)
+        self.assertTrue(dashboard_paths[1].endswith('geckobot_20250404_193312_data.json'))
+
+if __name__ == '__main__':
+    unittest.main()
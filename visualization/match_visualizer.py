@@ -2,7 +2,7 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 import pandas as pd
 from typing import List, Dict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from poker_enums import Street, Position, Action
 
 @dataclass
@@ -19,8 +19,8 @@ class HandData:
     pot_sizes: Dict[Street, float]
     final_pot: float
     result: float  # Profit/loss for this hand
-    outs_count: Dict[Street, float] = None  # Number of outs by street
-    equity_from_outs: Dict[Street, float] = None  # Equity from outs by street
+    outs_count: Dict[Street, float] = field(default_factory=dict)  # Number of outs by street
+    equity_from_outs: Dict[Street, float] = field(default_factory=dict)  # Equity from outs by street
 
 class MatchVisualizer:
     def __init__(self):